@@ -0,0 +1,37 @@
+"""diagram_snapshot
+
+Revision ID: 3b7d2f9a41c6
+Revises: ec2aad9de30f
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from src.models.guid import GUID
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2f9a41c6'
+down_revision: Union[str, None] = 'ec2aad9de30f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('diagram_snapshot',
+    sa.Column('scenario_id', GUID(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('format_version', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=True),
+    sa.ForeignKeyConstraint(['scenario_id'], ['scenario.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('scenario_id')
+    )
+    # every existing scenario gets an empty snapshot, which is built on first use
+    op.execute("INSERT INTO diagram_snapshot (scenario_id, version, format_version) SELECT id, 0, 0 FROM scenario")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('diagram_snapshot')
@@ -0,0 +1,86 @@
+"""
+Benchmark of InfluenceDiagramDOT.find_seperated_graphs against the previous implementation,
+which ran a DFS from every start node and merged the overlapping sets pairwise until no sets
+overlapped, for diagrams of many small disconnected fragments.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_components
+"""
+
+import time
+import uuid
+from src.domain.graph import Graph
+from src.domain.influence_diagram import InfluenceDiagramDOT
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.dtos.issue_dtos import IssueOutgoingDto
+from benchmarks.diagram_factory import create_decision, create_edge, create_uncertainty
+
+
+def previous_join_sets_with_common_elements(sets: list[set[uuid.UUID]]) -> list[set[uuid.UUID]]:
+    """The join_sets_with_common_elements implementation before the union-find, kept as reference."""
+    sets = [set(s) for s in sets]
+    changed = True
+    while changed:
+        changed = False
+        i = 0
+        while i < len(sets):
+            j = i + 1
+            while j < len(sets):
+                if sets[i] & sets[j]:
+                    sets[i] |= sets[j]
+                    sets.pop(j)
+                    changed = True
+                else:
+                    j += 1
+            i += 1
+    return sets
+
+
+def previous_find_seperated_graphs(diagram: InfluenceDiagramDOT) -> list[set[uuid.UUID]]:
+    """The find_seperated_graphs implementation before the union-find, kept as reference."""
+    paths = [diagram.graph.DFS(x) for x in diagram.start_nodes]
+    return previous_join_sets_with_common_elements(paths)
+
+
+def create_fragments(num_fragments: int) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
+    """Fragments of two uncertainties influencing a decision, so every fragment has two start nodes."""
+    issues: list[IssueOutgoingDto] = []
+    edges: list[EdgeOutgoingDto] = []
+    for n in range(num_fragments):
+        decision = create_decision(f"decision {n}", 2)
+        uncertainties = [create_uncertainty(f"uncertainty {n} {x}", 2) for x in range(2)]
+        issues += [decision, *uncertainties]
+        edges += [create_edge(x, decision) for x in uncertainties]
+    return issues, edges
+
+
+def main():
+    print(f"{'fragments':>9} {'previous [ms]':>14} {'union-find [ms]':>16} {'speedup':>8}")
+    for num_fragments in [50, 100, 200, 400, 800]:
+        issues, edges = create_fragments(num_fragments)
+        diagram = InfluenceDiagramDOT(edges, issues)
+
+        start = time.perf_counter()
+        previous = previous_find_seperated_graphs(diagram)
+        previous_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        components = diagram.find_seperated_graphs()
+        union_find_time = time.perf_counter() - start
+
+        assert sorted(map(sorted, components)) == sorted(map(sorted, previous)), "Components differ"
+        print(
+            f"{num_fragments:>9} {previous_time * 1000:>14.2f} "
+            f"{union_find_time * 1000:>16.2f} {previous_time / union_find_time:>7.1f}x"
+        )
+
+    graph = Graph()
+    for n in range(100_000):
+        graph.addEdge(uuid.UUID(int=n), uuid.UUID(int=n + 1))
+    start = time.perf_counter()
+    assert len(graph.weaklyConnectedComponents()) == 1
+    print(f"path of 100000 edges: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
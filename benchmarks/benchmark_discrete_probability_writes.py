@@ -0,0 +1,105 @@
+"""
+Benchmark of writing generated discrete probability rows, comparing the ORM unit of work flush
+with the batched Core inserts of bulk_insert_discrete_probabilities.
+
+The SQLite engines are run in memory. "sqlite executemany" disables insertmanyvalues, so every
+table is written with a DBAPI executemany call as pyodbc does with fast_executemany; it stands in
+for SQL Server when no server is available. Set BENCHMARK_MSSQL_URL to an mssql+pyodbc url to
+also run against a real SQL Server database, the tables are created and dropped in that database.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_discrete_probability_writes [row counts ...]
+"""
+
+import os
+import sys
+import time
+import uuid
+from typing import Callable
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+from src.models.base import Base
+from src.models.discrete_probability import (
+    DiscreteProbability,
+    DiscreteProbabilityParentOutcome,
+    DiscreteProbabilityParentOption,
+)
+from src.repositories.discrete_probability_repository import (
+    DiscreteProbabilityRow,
+    bulk_insert_discrete_probabilities,
+)
+
+TABLES = [
+    DiscreteProbability.__table__,
+    DiscreteProbabilityParentOutcome.__table__,
+    DiscreteProbabilityParentOption.__table__,
+]
+
+
+def create_rows(num_rows: int) -> list[DiscreteProbabilityRow]:
+    """Rows of a single uncertainty with two uncertainty parents and one decision parent."""
+    uncertainty_id = uuid.uuid4()
+    outcome_ids = [uuid.uuid4() for _ in range(4)]
+    return [
+        DiscreteProbabilityRow(
+            id=uuid.uuid4(),
+            uncertainty_id=uncertainty_id,
+            outcome_id=outcome_ids[n % len(outcome_ids)],
+            probability=0,
+            parent_outcome_ids=[uuid.uuid4(), uuid.uuid4()],
+            parent_option_ids=[uuid.uuid4()],
+        )
+        for n in range(num_rows)
+    ]
+
+
+def orm_flush(session: Session, rows: list[DiscreteProbabilityRow]) -> None:
+    session.add_all(
+        [
+            DiscreteProbability(
+                id=row.id,
+                uncertainty_id=row.uncertainty_id,
+                outcome_id=row.outcome_id,
+                probability=row.probability,
+                parent_outcomes=[DiscreteProbabilityParentOutcome(row.id, x) for x in row.parent_outcome_ids],
+                parent_options=[DiscreteProbabilityParentOption(row.id, x) for x in row.parent_option_ids],
+            )
+            for row in rows
+        ]
+    )
+    session.flush()
+
+
+def time_write(engine: Engine, rows: list[DiscreteProbabilityRow], write: Callable[[Session, list[DiscreteProbabilityRow]], None]) -> float:
+    Base.metadata.create_all(engine, tables=TABLES)
+    try:
+        with Session(engine) as session:
+            start = time.perf_counter()
+            write(session, rows)
+            elapsed = time.perf_counter() - start
+            session.rollback()
+        return elapsed
+    finally:
+        Base.metadata.drop_all(engine, tables=TABLES)
+
+
+def main():
+    row_counts = [int(x) for x in sys.argv[1:]] or [10_000, 100_000]
+    engines = {
+        "sqlite": create_engine("sqlite://"),
+        "sqlite executemany": create_engine("sqlite://", use_insertmanyvalues=False),
+    }
+    if os.getenv("BENCHMARK_MSSQL_URL"):
+        engines["mssql"] = create_engine(os.environ["BENCHMARK_MSSQL_URL"], fast_executemany=True)
+
+    print(f"{'engine':>18} {'rows':>7} {'orm flush [s]':>14} {'bulk insert [s]':>16} {'speedup':>8}")
+    for name, engine in engines.items():
+        for num_rows in row_counts:
+            rows = create_rows(num_rows)
+            orm_time = time_write(engine, rows, orm_flush)
+            bulk_time = time_write(engine, rows, bulk_insert_discrete_probabilities)
+            print(f"{name:>18} {num_rows:>7} {orm_time:>14.2f} {bulk_time:>16.2f} {orm_time / bulk_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
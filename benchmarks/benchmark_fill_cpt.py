@@ -0,0 +1,68 @@
+"""
+Microbenchmark of PyagrumSolver.fill_cpt against the previous row by row fill,
+for a single uncertainty with an increasing number of parents and states.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_fill_cpt
+"""
+
+import time
+from itertools import product
+from typing import Callable
+import numpy as np
+from src.services.pyagrum_solver import PyagrumSolver
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.utils.discrete_probability_array_manager import DiscreteProbabilityArrayManager
+from benchmarks.diagram_factory import create_star_diagram
+
+
+def row_by_row_fill_cpt(solver: PyagrumSolver, issue: IssueOutgoingDto):
+    """The fill_cpt implementation before the vectorized path, kept as reference."""
+    assert issue.uncertainty is not None
+    node_id = solver.node_lookup[issue.id.__str__()]
+    parent_ids: list[int] = list(solver.diagram.parents(node_id))  # type: ignore
+    parent_labels = [solver.diagram.variable(pid).labels() for pid in parent_ids]  # type: ignore
+    outcome_labels = solver.diagram.variable(node_id).labels()  # type: ignore
+    manager = DiscreteProbabilityArrayManager(
+        issue.uncertainty.discrete_probabilities, parent_labels, outcome_labels
+    )
+    cpt = solver.diagram.cpt(node_id)  # type: ignore
+    for parent_state in product(*parent_labels):
+        probabilities = manager.get_probabilities_for_combination(list(parent_state))
+        assign = {
+            solver.diagram.variable(parent_id).name(): state  # type: ignore
+            for parent_id, state in zip(parent_ids, parent_state)
+        }
+        cpt[assign] = probabilities
+    return cpt
+
+
+def time_fill(
+    issues: list[IssueOutgoingDto], edges, fill: Callable[[PyagrumSolver, IssueOutgoingDto], object]
+) -> tuple[float, np.ndarray]:
+    solver = PyagrumSolver()
+    solver.add_nodes(issues)
+    solver.add_edges(edges)
+    start = time.perf_counter()
+    cpt = fill(solver, issues[-1])
+    return time.perf_counter() - start, cpt.toarray()  # type: ignore
+
+
+def main():
+    print(f"{'parents':>7} {'states':>6} {'rows':>7} {'row by row [ms]':>16} {'vectorized [ms]':>16} {'speedup':>8}")
+    for num_states in [2, 3, 4]:
+        for num_parents in range(1, 7):
+            issues, edges = create_star_diagram(num_parents, num_states)
+            row_time, row_cpt = time_fill(issues, edges, row_by_row_fill_cpt)
+            vectorized_time, vectorized_cpt = time_fill(
+                issues, edges, lambda solver, issue: solver.fill_cpt(issue)
+            )
+            assert np.allclose(row_cpt, vectorized_cpt), "CPTs differ"
+            print(
+                f"{num_parents:>7} {num_states:>6} {num_states ** num_parents:>7} "
+                f"{row_time * 1000:>16.2f} {vectorized_time * 1000:>16.2f} {row_time / vectorized_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark of calculate_partial_order against the previous implementation,
+which removed the nodes without children in repeated passes over a copy of the graph,
+for random diagrams of 50 to 500 issues.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_partial_order
+"""
+
+import time
+import uuid
+from src.constants import Type
+from src.domain.diagram_model import DiagramModel
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.services.decision_tree.partial_order import calculate_partial_order
+from benchmarks.diagram_factory import create_random_diagram
+
+
+def previous_decision_elimination_order(
+    types: dict[uuid.UUID, str], children: dict[uuid.UUID, list[uuid.UUID]]
+) -> list[uuid.UUID]:
+    """The decision_elimination_order implementation before the single pass, kept as reference."""
+    graph = {x: list(y) for x, y in children.items()}
+
+    decisions: list[uuid.UUID] = []
+    decisions_count = len([x for x in graph if types[x] == Type.DECISION.value])
+    while decisions_count > 0:
+        for node in list(graph):
+            if not graph[node]:
+                if types[node] == Type.DECISION.value:
+                    decisions.append(node)
+                    decisions_count -= 1
+                del graph[node]
+                for x in graph.values():
+                    while node in x:
+                        x.remove(node)
+    return decisions
+
+
+def previous_calculate_partial_order(
+    issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]
+) -> list[uuid.UUID]:
+    """The calculate_partial_order implementation before the single pass, kept as reference."""
+    model = DiagramModel(issues, edges)
+    types = {x.id: x.type for x in issues}
+    children: dict[uuid.UUID, list[uuid.UUID]] = {x.id: [] for x in issues}
+    parents: dict[uuid.UUID, list[uuid.UUID]] = {x.id: [] for x in issues}
+    for tail, head in map(model.get_edge_issues, edges):
+        if head.id not in children[tail.id]:
+            children[tail.id].append(head.id)
+            parents[head.id].append(tail.id)
+
+    uncertainty_nodes = [x.id for x in issues if x.type == Type.UNCERTAINTY.value]
+    elimination_order = previous_decision_elimination_order(types, children)
+    partial_order: list[uuid.UUID] = []
+
+    while elimination_order:
+        decision = elimination_order.pop()
+        parent_decision_nodes: list[uuid.UUID] = []
+        for parent in parents[decision]:
+            if not types[parent] == Type.DECISION.value:
+                if parent in uncertainty_nodes:
+                    parent_decision_nodes.append(parent)
+                    uncertainty_nodes.remove(parent)
+
+        partial_order += parent_decision_nodes
+        partial_order.append(decision)
+
+    return partial_order + uncertainty_nodes
+
+
+def main():
+    print(f"{'issues':>6} {'edges':>6} {'previous [ms]':>14} {'single pass [ms]':>17} {'speedup':>8}")
+    for num_issues in [50, 100, 200, 300, 500]:
+        issues, edges = create_random_diagram(num_issues)
+
+        start = time.perf_counter()
+        previous = previous_calculate_partial_order(issues, edges)
+        previous_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        partial_order = [x.id for x in calculate_partial_order(issues, edges)]
+        single_pass_time = time.perf_counter() - start
+
+        assert partial_order == previous, "Partial orders differ"
+        print(
+            f"{num_issues:>6} {len(edges):>6} {previous_time * 1000:>14.2f} "
+            f"{single_pass_time * 1000:>17.2f} {previous_time / single_pass_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
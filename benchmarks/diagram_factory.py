@@ -0,0 +1,194 @@
+"""
+Synthetic influence diagrams for the benchmarks.
+"""
+
+import uuid
+import random
+from itertools import product
+from src.constants import Type, Boundary
+from src.dtos.issue_dtos import IssueOutgoingDto, IssueViaNodeOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.dtos.node_dtos import NodeOutgoingDto, NodeViaIssueOutgoingDto
+from src.dtos.node_style_dtos import NodeStyleOutgoingDto
+from src.dtos.decision_dtos import DecisionOutgoingDto
+from src.dtos.uncertainty_dtos import UncertaintyOutgoingDto
+from src.dtos.option_dtos import OptionOutgoingDto
+from src.dtos.outcome_dtos import OutcomeOutgoingDto
+from src.dtos.discrete_probability_dtos import DiscreteProbabilityOutgoingDto
+
+SCENARIO_ID = uuid.uuid4()
+
+
+def _node(issue_id: uuid.UUID, name: str) -> NodeViaIssueOutgoingDto:
+    node_id = uuid.uuid4()
+    return NodeViaIssueOutgoingDto(
+        id=node_id,
+        scenario_id=SCENARIO_ID,
+        issue_id=issue_id,
+        name=name,
+        node_style=NodeStyleOutgoingDto(node_id=node_id),
+    )
+
+
+def create_decision(name: str, num_options: int) -> IssueOutgoingDto:
+    issue_id = uuid.uuid4()
+    decision_id = uuid.uuid4()
+    return IssueOutgoingDto(
+        id=issue_id,
+        scenario_id=SCENARIO_ID,
+        name=name,
+        order=0,
+        type=Type.DECISION.value,
+        boundary=Boundary.ON.value,
+        node=_node(issue_id, name),
+        decision=DecisionOutgoingDto(
+            id=decision_id,
+            issue_id=issue_id,
+            type="Focus",
+            options=[
+                OptionOutgoingDto(name=f"{name} {n}", decision_id=decision_id, utility=random.random())
+                for n in range(num_options)
+            ],
+        ),
+        uncertainty=None,
+        utility=None,
+        value_metric=None,
+    )
+
+
+def create_uncertainty(name: str, num_outcomes: int) -> IssueOutgoingDto:
+    issue_id = uuid.uuid4()
+    uncertainty_id = uuid.uuid4()
+    return IssueOutgoingDto(
+        id=issue_id,
+        scenario_id=SCENARIO_ID,
+        name=name,
+        order=0,
+        type=Type.UNCERTAINTY.value,
+        boundary=Boundary.IN.value,
+        node=_node(issue_id, name),
+        decision=None,
+        uncertainty=UncertaintyOutgoingDto(
+            id=uncertainty_id,
+            issue_id=issue_id,
+            outcomes=[
+                OutcomeOutgoingDto(name=f"{name} {n}", uncertainty_id=uncertainty_id, utility=random.random())
+                for n in range(num_outcomes)
+            ],
+        ),
+        utility=None,
+        value_metric=None,
+    )
+
+
+def create_edge(tail: IssueOutgoingDto, head: IssueOutgoingDto) -> EdgeOutgoingDto:
+    def node(issue: IssueOutgoingDto) -> NodeOutgoingDto:
+        return NodeOutgoingDto(
+            id=issue.node.id,
+            scenario_id=SCENARIO_ID,
+            issue_id=issue.id,
+            name=issue.name,
+            node_style=issue.node.node_style,
+            issue=IssueViaNodeOutgoingDto(
+                **issue.model_dump(exclude={"node"}),
+            ),
+        )
+
+    return EdgeOutgoingDto(
+        tail_id=tail.node.id,
+        head_id=head.node.id,
+        scenario_id=SCENARIO_ID,
+        tail_issue_id=tail.id,
+        head_issue_id=head.id,
+        tail_node=node(tail),
+        head_node=node(head),
+    )
+
+
+def _states(issue: IssueOutgoingDto) -> list[uuid.UUID]:
+    if issue.decision is not None:
+        return [x.id for x in issue.decision.options]
+    assert issue.uncertainty is not None
+    return [x.id for x in issue.uncertainty.outcomes]
+
+
+def fill_probabilities(child: IssueOutgoingDto, parents: list[IssueOutgoingDto]) -> None:
+    """Adds a complete, normalized probability table to the child uncertainty."""
+    assert child.uncertainty is not None
+    outcomes = child.uncertainty.outcomes
+    decision_parents = [x for x in parents if x.type == Type.DECISION.value]
+    uncertainty_parents = [x for x in parents if x.type == Type.UNCERTAINTY.value]
+    probabilities: list[DiscreteProbabilityOutgoingDto] = []
+    for combination in product(*[_states(x) for x in uncertainty_parents + decision_parents]):
+        weights = [random.random() for _ in outcomes]
+        for outcome, weight in zip(outcomes, weights):
+            probabilities.append(
+                DiscreteProbabilityOutgoingDto(
+                    uncertainty_id=child.uncertainty.id,
+                    outcome_id=outcome.id,
+                    probability=weight / sum(weights),
+                    parent_outcome_ids=list(combination[: len(uncertainty_parents)]),
+                    parent_option_ids=list(combination[len(uncertainty_parents):]),
+                )
+            )
+    child.uncertainty.discrete_probabilities = probabilities
+
+
+def create_star_diagram(
+    num_parents: int, num_states: int
+) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
+    """One uncertainty with num_parents parents, alternating uncertainties and decisions."""
+    parents = [
+        create_uncertainty(f"parent {n}", num_states) if n % 2 == 0 else create_decision(f"parent {n}", num_states)
+        for n in range(num_parents)
+    ]
+    child = create_uncertainty("child", num_states)
+    for parent in parents:
+        if parent.uncertainty is not None:
+            fill_probabilities(parent, [])
+    fill_probabilities(child, parents)
+    return parents + [child], [create_edge(parent, child) for parent in parents]
+
+
+def create_utility(name: str) -> IssueOutgoingDto:
+    issue_id = uuid.uuid4()
+    return IssueOutgoingDto(
+        id=issue_id,
+        scenario_id=SCENARIO_ID,
+        name=name,
+        order=0,
+        type=Type.UTILITY.value,
+        boundary=Boundary.IN.value,
+        node=_node(issue_id, name),
+        decision=None,
+        uncertainty=None,
+        utility=None,
+        value_metric=None,
+    )
+
+
+def create_random_diagram(
+    num_issues: int, num_parents: int = 3, seed: int = 0
+) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
+    """
+    A random acyclic diagram of decisions, uncertainties and utilities, listed in random order.
+    Every issue gets up to num_parents parents among the issues created before it, and the
+    utilities only have parents.
+    """
+    rng = random.Random(seed)
+    issues: list[IssueOutgoingDto] = []
+    edges: list[EdgeOutgoingDto] = []
+    for n in range(num_issues):
+        kind = rng.random()
+        if kind < 0.3:
+            issue = create_decision(f"decision {n}", 2)
+        elif kind < 0.85:
+            issue = create_uncertainty(f"uncertainty {n}", 2)
+        else:
+            issue = create_utility(f"utility {n}")
+        parents = [x for x in issues if x.type != Type.UTILITY.value]
+        for parent in rng.sample(parents, min(len(parents), rng.randint(0, num_parents))):
+            edges.append(create_edge(parent, issue))
+        issues.append(issue)
+    rng.shuffle(issues)
+    return issues, edges
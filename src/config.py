@@ -61,11 +61,39 @@ class Config(BaseSettings):
     # Database token duration in seconds (default: 50 minutes)
     DB_TOKEN_DURATION: int = 3000
     DEBUG: bool = False
+    # Send batched inserts to SQL Server in a single round trip (pyodbc/aioodbc with the Microsoft ODBC driver)
+    DB_FAST_EXECUTEMANY: bool = True
 
     # Cache for 60 minutes
     CACHE_DURATION: int = 3600
     CACHE_MAX_SIZE: int = 256
 
+    # Number of solved influence diagrams kept in memory
+    SOLUTION_CACHE_MAX_SIZE: int = 128
+
+    # Number of scenarios whose partial order and decision tree are kept in memory
+    STRUCTURE_CACHE_MAX_SIZE: int = 64
+    # Serialized decision trees and expansions larger than this are built every time instead of being cached
+    STRUCTURE_CACHE_MAX_TREE_BYTES: int = 8 * 1024 * 1024
+    # Total size of the cached decision tree expansions and json, least recently used are dropped first
+    STRUCTURE_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+
+    # Decision trees with more nodes or json bytes than this are not returned in full
+    DECISION_TREE_MAX_NODES: int = 2_000_000
+    DECISION_TREE_MAX_BYTES: int = 512 * 1024 * 1024
+    # What is returned instead: "refuse", "compressed" or "lazy" which expands the levels that fit
+    DECISION_TREE_OVERSIZE_MODE: str = "lazy"
+
+    # Influence diagrams are solved in a pool of worker processes
+    SOLVER_USE_PROCESSES: bool = True
+    SOLVER_MAX_WORKERS: int = 2
+    # Maximum number of queued and running solves before new solves are refused
+    SOLVER_MAX_QUEUE_DEPTH: int = 16
+    # Timeout for a single solve in seconds
+    SOLVER_TIMEOUT: float = 120
+    # Maximum number of scenarios solved in one batch, their ids are loaded in one IN-list
+    SOLVER_BATCH_MAX_SCENARIOS: int = 100
+
     # use to enable PyInstrumentMiddleWare
     # this will generate a profile.html at repository root
     PROFILE: bool = False
@@ -42,12 +42,68 @@ class DatabaseConstants(int, Enum):
     MAX_SHORT_STRING_LENGTH = 60
     MAX_LONG_STRING_LENGTH = 600
 
+class DecisionTreeMode(str, Enum):
+    FULL = "full"
+    COMPRESSED = "compressed"
+    # expanded to the depth that fits, deeper levels are requested by path
+    LAZY = "lazy"
+    REFUSE = "refuse"
+
 class NodeStates(str, Enum):
     OPTION = "option"
     OUTCOME = "outcome"
 
 
 class SwaggerDocumentationConstants:
+    CURSOR_DOC = """
+    cursor: str (Optional)
+        The next_cursor of the previous page. Leave empty to get the first page.
+    """
+
+    FIELDS_DOC = """
+    fields: str (Optional)
+        Comma separated fields to return, for example "id,name". Leave empty to return every field.
+    """
+
+    EXPAND_DOC = """
+    expand: str (Optional)
+        Comma separated relationships to return. When fields or expand is given, only the listed relationships are loaded.
+    """
+
+    TREE_PATH_DOC = """
+    path: list[uuid] (Optional)
+        Option and outcome ids from the root to the tree node to start at, one per issue of the
+        partial order. Leave empty to start at the root.
+    """
+
+    TREE_DEPTH_DOC = """
+    depth: int (Optional)
+        Number of levels to expand below the start node. Nodes at the limit are returned without
+        children and can be expanded by requesting their path. Leave empty to expand to the endpoints.
+    """
+
+    TREE_COMPRESSED_DOC = """
+    compressed: bool (Optional)
+        Return the tree with identical subtrees stored once. The tree nodes refer to their issue by
+        position in the partial order and to their children by position in the list of tree nodes.
+    """
+
+    TREE_ROLL_BACK_DOC = """
+    roll_back: bool (Optional)
+        Roll back the tree with the option and outcome utilities, giving the expected value of every
+        tree node and the optimal option of every decision.
+    """
+
+    TREE_SIZE_COMPRESSED_DOC = """
+    compressed: bool (Optional)
+        Give the mode the decision tree endpoint would use when the compressed tree is requested.
+    """
+
+    LIMIT_DOC = """
+    limit: int (Optional)
+        Maximum number of items in the page.
+    """
+
     FILTER_DOC = """
     filter: str (Optional)
         String for applying OData filtering.
@@ -80,3 +136,8 @@ class SwaggerDocumentationConstants:
 
 class PageSize:
     DEFAULT: int = 1000000
+    # number of items returned by the list endpoints when the client does not set a limit
+    PAGE_DEFAULT: int = 100
+    PAGE_MAX: int = 1000
+    # number of rows fetched from the database per batch when a list endpoint is streamed
+    STREAM_BATCH: int = 500
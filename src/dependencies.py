@@ -1,4 +1,5 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable, Coroutine, Optional
+from fastapi import HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.session_manager import sessionmanager
 from sqlalchemy import create_engine, Engine
@@ -22,6 +23,10 @@ from src.services.user_service import UserService
 from src.services.solver_service import SolverService
 from src.services.structure_service import StructureService
 from src.config import config
+from src.constants import PageSize, SwaggerDocumentationConstants
+from src.dtos.page_dtos import PageRequestDto
+from src.utils.keyset_cursor import decode_cursor, InvalidCursorError
+from src.utils.field_selection import FieldSelection, SelectableFields, InvalidFieldSelectionError
 from src.database import get_connection_string_and_token, build_connection_url
 
 
@@ -46,6 +51,41 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise e
 
 
+async def get_page_request(
+    cursor: Optional[str] = Query(None, description=SwaggerDocumentationConstants.CURSOR_DOC),
+    limit: int = Query(
+        PageSize.PAGE_DEFAULT, ge=1, le=PageSize.PAGE_MAX, description=SwaggerDocumentationConstants.LIMIT_DOC
+    ),
+) -> PageRequestDto:
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return PageRequestDto(cursor=cursor, limit=limit)
+
+
+def get_field_selection(
+    selectable_fields: SelectableFields[Any],
+) -> Callable[..., Coroutine[Any, Any, FieldSelection]]:
+    """
+    Creates the dependency reading the fields and expand parameters for the dto of selectable_fields.
+    """
+
+    async def field_selection(
+        fields: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FIELDS_DOC),
+        expand: Optional[str] = Query(None, description=SwaggerDocumentationConstants.EXPAND_DOC),
+    ) -> FieldSelection:
+        selection = FieldSelection.parse(fields, expand)
+        try:
+            selectable_fields.names(selection)
+        except InvalidFieldSelectionError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return selection
+
+    return field_selection
+
+
 async def get_project_service() -> ProjectService:
     return ProjectService()
 
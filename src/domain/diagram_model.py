@@ -0,0 +1,47 @@
+import uuid
+from typing import Iterable
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.dtos.option_dtos import OptionOutgoingDto
+from src.dtos.outcome_dtos import OutcomeOutgoingDto
+
+
+class DiagramModel:
+    """
+    The issues and edges of an influence diagram indexed by id.
+    Built once from the dtos, so finding an issue, node, option or outcome is a dict lookup
+    instead of a scan of the issues. The issues and edges keep the order they were given in.
+    """
+
+    def __init__(self, issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]) -> None:
+        self.issues = issues
+        self.edges = edges
+        self.issues_by_id: dict[uuid.UUID, IssueOutgoingDto] = {}
+        self.issues_by_node_id: dict[uuid.UUID, IssueOutgoingDto] = {}
+        self.options_by_id: dict[uuid.UUID, OptionOutgoingDto] = {}
+        self.outcomes_by_id: dict[uuid.UUID, OutcomeOutgoingDto] = {}
+        for issue in issues:
+            self.issues_by_id[issue.id] = issue
+            self.issues_by_node_id[issue.node.id] = issue
+            if issue.decision is not None:
+                self.options_by_id.update((x.id, x) for x in issue.decision.options)
+            if issue.uncertainty is not None:
+                self.outcomes_by_id.update((x.id, x) for x in issue.uncertainty.outcomes)
+
+    def get_issue(self, issue_id: uuid.UUID) -> IssueOutgoingDto:
+        issue = self.issues_by_id.get(issue_id)
+        if issue is None:
+            raise KeyError(f"Issue {issue_id} is not part of the influence diagram")
+        return issue
+
+    def get_edge_issues(self, edge: EdgeOutgoingDto) -> tuple[IssueOutgoingDto, IssueOutgoingDto]:
+        """The tail and head issue of the edge."""
+        return self.get_issue(edge.tail_node.issue_id), self.get_issue(edge.head_node.issue_id)
+
+    def subset(self, issue_ids: Iterable[uuid.UUID]) -> "DiagramModel":
+        """The model of the given issues and the edges between them."""
+        issue_ids = set(issue_ids)
+        return DiagramModel(
+            [x for x in self.issues if x.id in issue_ids],
+            [x for x in self.edges if x.tail_issue_id in issue_ids and x.head_issue_id in issue_ids],
+        )
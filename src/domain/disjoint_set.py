@@ -0,0 +1,51 @@
+from typing import Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class DisjointSet(Generic[T]):
+    """
+    Union-find over hashable elements. With union by size and path halving a sequence of
+    unions and finds takes near-linear time, so groups of connected elements are found
+    without comparing the groups with each other.
+    """
+
+    def __init__(self, elements: Iterable[T] = ()) -> None:
+        self.parent: dict[T, T] = {}
+        self.size: dict[T, int] = {}
+        for element in elements:
+            self.add(element)
+
+    def add(self, element: T) -> None:
+        if element not in self.parent:
+            self.parent[element] = element
+            self.size[element] = 1
+
+    def find(self, element: T) -> T:
+        """The representative of the group of the element, which must have been added."""
+        parent = self.parent
+        while parent[element] != element:
+            # path halving, every other element on the path is pointed to its grandparent
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a: T, b: T) -> T:
+        """Merges the groups of a and b, adding them when needed, and returns the new representative."""
+        self.add(a)
+        self.add(b)
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+    def groups(self) -> list[set[T]]:
+        """The groups, ordered by the element of each group that was added first."""
+        groups: dict[T, set[T]] = {}
+        for element in self.parent:
+            groups.setdefault(self.find(element), set()).add(element)
+        return list(groups.values())
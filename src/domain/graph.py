@@ -1,5 +1,8 @@
 import uuid
 from collections import defaultdict
+from typing import Optional
+from src.domain.disjoint_set import DisjointSet
+from src.domain.indexed_graph import IndexedGraph
 
 class Graph:
 
@@ -7,75 +10,82 @@ class Graph:
 
         # Default dictionary to store graph
         self.graph: defaultdict[uuid.UUID, list[uuid.UUID]] = defaultdict(list[uuid.UUID])
+        self._indexed: Optional[IndexedGraph[uuid.UUID]] = None
 
     def addEdge(self, tail_vertex_id: uuid.UUID, head_vertex_id: uuid.UUID):
         self.graph[tail_vertex_id].append(head_vertex_id)
+        self._indexed = None
 
-    
-    def DFSUtil(self, vertex: uuid.UUID, visited: set[uuid.UUID]):
-        visited.add(vertex)
+    def indexed(self) -> IndexedGraph[uuid.UUID]:
         """
-        Depth first search graph traversal utility.
-        Recursive method, with cyclical validation.
+        The graph in integer indexed form for the traversals, built on first use after a change.
         """
+        if self._indexed is None:
+            self._indexed = IndexedGraph(
+                self.vertices(),
+                ((tail, head) for tail, heads in list(self.graph.items()) for head in heads),
+            )
+        return self._indexed
 
-        # Recur for all the vertices
-        # adjacent to this vertex
-        for neighbour in self.graph[vertex]:
-            if neighbour not in visited:
-                self.DFSUtil(neighbour, visited)
+    def DFS(self, v: uuid.UUID) -> set[uuid.UUID]:
+        """
+        Depth first search graph traversal, the vertices reachable from v including v.
+        Iterative, so long chains do not reach the recursion limit.
+        """
+        indexed = self.indexed()
+        if v not in indexed.index:
+            return {v}
+        vertex = indexed.index[v]
+        return {v, *indexed.get_ids(indexed.descendants(vertex))}
 
-    
-    def DFS(self, v: uuid.UUID):
+    def detectCycle(self) -> bool:
         """
-        Depth first search graph traversal.
-        Uses a recursive method
+        Detects if the graph contains a cycle.
         """
+        return self.indexed().has_cycle()
 
-        # Create a set to store visited vertices
-        visited: set[uuid.UUID] = set()
+    def findCycle(self) -> Optional[list[uuid.UUID]]:
+        """
+        The vertices along a cycle of the graph, None when the graph is acyclic.
+        """
+        cycle = self.indexed().find_cycle()
+        return None if cycle is None else self.indexed().get_ids(cycle)
 
-        # Call the recursive helper function
-        self.DFSUtil(v, visited)
-        return visited
-    
-    def detectCycleUtil(self, vertex: uuid.UUID, visited: set[uuid.UUID], recStack: set[uuid.UUID]) -> bool:
+    def topologicalSort(self) -> list[uuid.UUID]:
         """
-        Utility function to detect cycles in a directed graph using DFS.
+        The vertices with every vertex before the vertices it has edges to.
+        Vertices on a cycle and the vertices after them are left out.
         """
-        # Mark the current node as visited and add it to the recursion stack
-        visited.add(vertex)
-        recStack.add(vertex)
+        indexed = self.indexed()
+        return indexed.get_ids(indexed.topological_order())
 
-        # Recur for all the vertices adjacent to this vertex
-        for neighbour in self.graph[vertex]:
-            # If the neighbour is not visited, recurse on it
-            if neighbour not in visited:
-                if self.detectCycleUtil(neighbour, visited, recStack):
-                    return True
-            # If the neighbour is in the recursion stack, a cycle is detected
-            elif neighbour in recStack:
-                return True
+    def descendants(self, v: uuid.UUID) -> set[uuid.UUID]:
+        indexed = self.indexed()
+        if v not in indexed.index:
+            return set()
+        return set(indexed.get_ids(indexed.descendants(indexed.index[v])))
 
-        # Remove the vertex from the recursion stack
-        recStack.remove(vertex)
-        return False
+    def ancestors(self, v: uuid.UUID) -> set[uuid.UUID]:
+        indexed = self.indexed()
+        if v not in indexed.index:
+            return set()
+        return set(indexed.get_ids(indexed.ancestors(indexed.index[v])))
 
-    def detectCycle(self) -> bool:
+    def vertices(self) -> list[uuid.UUID]:
+        """The vertices with an edge, in the order they were first added."""
+        vertices: dict[uuid.UUID, None] = {}
+        for tail_vertex_id, head_vertex_ids in list(self.graph.items()):
+            vertices[tail_vertex_id] = None
+            vertices.update(dict.fromkeys(head_vertex_ids))
+        return list(vertices)
+
+    def weaklyConnectedComponents(self) -> list[set[uuid.UUID]]:
         """
-        Detects if the graph contains a cycle.
+        The vertices connected by edges in either direction, grouped with a union-find over the
+        edges in near-linear time. Ordered by the first added vertex of each component.
         """
-        visited: set[uuid.UUID] = set()
-        recStack: set[uuid.UUID] = set()
-
-        # Check for cycles in each connected component
-        # Create a copy of the keys to avoid "dictionary changed size during iteration"
-        vertices = list(self.graph.keys())
-        for vertex in vertices:
-            if vertex not in visited:
-                try:
-                    if self.detectCycleUtil(vertex, visited, recStack):
-                        return True
-                except Exception as e:
-                    raise e
-        return False
+        components: DisjointSet[uuid.UUID] = DisjointSet(self.vertices())
+        for tail_vertex_id, head_vertex_ids in list(self.graph.items()):
+            for head_vertex_id in head_vertex_ids:
+                components.union(tail_vertex_id, head_vertex_id)
+        return components.groups()
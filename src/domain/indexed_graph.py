@@ -0,0 +1,149 @@
+from typing import Any, Generic, Hashable, Iterable, Optional, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class EdgeCycleError(ValueError):
+    """Raised when edges would create a cycle, cycle holds the vertices along it."""
+
+    def __init__(self, cycle: list[Any]) -> None:
+        self.cycle = cycle
+        path = " -> ".join(str(x) for x in [*cycle, cycle[0]])
+        super().__init__(f"The edges would create the cycle {path}")
+
+
+class IndexedGraph(Generic[T]):
+    """
+    A directed graph with its vertices numbered, and the successors and predecessors of every
+    vertex stored in compressed sparse row form: the neighbours of vertex i are
+    targets[offsets[i]:offsets[i + 1]]. The algorithms work on these integer lists with explicit
+    stacks and queues, so long chains do not reach the recursion limit and no dicts are hashed
+    per step. The graph is built once and not changed, build a new one after changes.
+    Vertex lists are returned as indexes, vertex_ids maps them back.
+    """
+
+    def __init__(self, vertex_ids: Iterable[T], edges: Iterable[tuple[T, T]]) -> None:
+        self.vertex_ids: list[T] = list(dict.fromkeys(vertex_ids))
+        self.index: dict[T, int] = {x: i for i, x in enumerate(self.vertex_ids)}
+        edge_indexes: list[tuple[int, int]] = []
+        for tail, head in edges:
+            edge_indexes.append((self.get_or_add_index(tail), self.get_or_add_index(head)))
+
+        self.offsets, self.targets = self._compress(edge_indexes)
+        self.reverse_offsets, self.sources = self._compress([(h, t) for t, h in edge_indexes])
+
+    def get_or_add_index(self, vertex_id: T) -> int:
+        index = self.index.get(vertex_id)
+        if index is None:
+            index = len(self.vertex_ids)
+            self.index[vertex_id] = index
+            self.vertex_ids.append(vertex_id)
+        return index
+
+    def _compress(self, edge_indexes: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+        """Counting sort of the edges by tail, keeping the order of the edges of every tail."""
+        offsets = [0] * (len(self.vertex_ids) + 1)
+        for tail, _ in edge_indexes:
+            offsets[tail + 1] += 1
+        for i in range(len(self.vertex_ids)):
+            offsets[i + 1] += offsets[i]
+        targets = [0] * len(edge_indexes)
+        positions = offsets[:-1]
+        for tail, head in edge_indexes:
+            targets[positions[tail]] = head
+            positions[tail] += 1
+        return offsets, targets
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertex_ids)
+
+    def successors(self, vertex: int) -> list[int]:
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def predecessors(self, vertex: int) -> list[int]:
+        return self.sources[self.reverse_offsets[vertex]:self.reverse_offsets[vertex + 1]]
+
+    def _adjacency(self, reverse: bool) -> tuple[list[int], list[int]]:
+        return (self.reverse_offsets, self.sources) if reverse else (self.offsets, self.targets)
+
+    def topological_order(self, reverse: bool = False) -> list[int]:
+        """
+        The vertices with every vertex before its successors, or before its predecessors when
+        reverse, by Kahn's algorithm. Vertices on a cycle, and the vertices after them, are left
+        out.
+        """
+        offsets, targets = self._adjacency(reverse)
+        in_offsets, _ = self._adjacency(not reverse)
+        in_degree = [in_offsets[i + 1] - in_offsets[i] for i in range(self.vertex_count)]
+        order = [i for i, degree in enumerate(in_degree) if degree == 0]
+        position = 0
+        while position < len(order):
+            vertex = order[position]
+            position += 1
+            for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    order.append(target)
+        return order
+
+    def find_cycle(self) -> Optional[list[int]]:
+        """A cycle as the vertices along it, None when the graph is acyclic. Iterative DFS."""
+        # 0 not visited, 1 on the stack of the current search, 2 done
+        state = [0] * self.vertex_count
+        parent = [-1] * self.vertex_count
+        for root in range(self.vertex_count):
+            if state[root] != 0:
+                continue
+            state[root] = 1
+            # the vertex and the position of the next successor to visit
+            stack = [(root, self.offsets[root])]
+            while stack:
+                vertex, position = stack[-1]
+                if position == self.offsets[vertex + 1]:
+                    state[vertex] = 2
+                    stack.pop()
+                    continue
+                stack[-1] = (vertex, position + 1)
+                target = self.targets[position]
+                if state[target] == 0:
+                    state[target] = 1
+                    parent[target] = vertex
+                    stack.append((target, self.offsets[target]))
+                elif state[target] == 1:
+                    cycle = [vertex]
+                    while cycle[-1] != target:
+                        cycle.append(parent[cycle[-1]])
+                    return cycle[::-1]
+        return None
+
+    def has_cycle(self) -> bool:
+        return len(self.topological_order()) < self.vertex_count
+
+    def reachable(self, sources: Iterable[int], reverse: bool = False) -> list[bool]:
+        """Whether each vertex can be reached from the sources, against the edges when reverse."""
+        offsets, targets = self._adjacency(reverse)
+        reached = [False] * self.vertex_count
+        stack = list(sources)
+        for source in stack:
+            reached[source] = True
+        while stack:
+            vertex = stack.pop()
+            for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+                if not reached[target]:
+                    reached[target] = True
+                    stack.append(target)
+        return reached
+
+    def descendants(self, vertex: int) -> list[int]:
+        """The vertices reachable from the vertex, without the vertex unless it is on a cycle."""
+        reached = self.reachable(self.successors(vertex))
+        return [i for i, x in enumerate(reached) if x]
+
+    def ancestors(self, vertex: int) -> list[int]:
+        """The vertices the vertex is reached from, without the vertex unless it is on a cycle."""
+        reached = self.reachable(self.predecessors(vertex), reverse=True)
+        return [i for i, x in enumerate(reached) if x]
+
+    def get_ids(self, vertices: Iterable[int]) -> list[T]:
+        return [self.vertex_ids[x] for x in vertices]
@@ -1,151 +1,150 @@
 import uuid
+from dataclasses import dataclass, field
+from typing import Optional
 from src.constants import Type
 from src.domain.graph import Graph
+from src.domain.diagram_model import DiagramModel
 from src.dtos.issue_dtos import IssueOutgoingDto
 from src.dtos.edge_dtos import EdgeOutgoingDto
-from src.utils.set_joins import join_sets_with_common_elements
+
+
+@dataclass
+class InfluenceDiagramDiagnostics:
+    """
+    What validating an influence diagram found. The diagram is valid when there are no errors,
+    the first error is the one validate_diagram raises.
+    """
+    start_nodes: set[uuid.UUID] = field(default_factory=set[uuid.UUID])
+    end_nodes: set[uuid.UUID] = field(default_factory=set[uuid.UUID])
+    cycle: Optional[list[uuid.UUID]] = None
+    components: list[set[uuid.UUID]] = field(default_factory=list[set[uuid.UUID]])
+    # issues outside the largest component, which are left out of the diagram
+    removed_issue_ids: list[uuid.UUID] = field(default_factory=list[uuid.UUID])
+    uncertainties_without_outcomes: list[uuid.UUID] = field(default_factory=list[uuid.UUID])
+    decisions_without_options: list[uuid.UUID] = field(default_factory=list[uuid.UUID])
+    errors: list[str] = field(default_factory=list[str])
+
+    @property
+    def is_valid(self) -> bool:
+        return len(self.errors) == 0
+
 
 class InfluenceDiagramDOT:
     """
     DOT applications light-weight Influence diagram format
     """
-    # since this class can reconstruct itself this counter is checked 
-    # and iterated on every init to prevent infinite loops
-    init_counter: int = 0
-    max_reconstructions = 5
-    tail_to_head_lookup: dict[uuid.UUID, uuid.UUID]
-    head_to_tail_lookup: dict[uuid.UUID, uuid.UUID]
     start_nodes: set[uuid.UUID]
     end_nodes: set[uuid.UUID]
     graph: Graph
+    model: DiagramModel
 
     def __init__(self, edges: list[EdgeOutgoingDto], issues: list[IssueOutgoingDto]) -> None:
-        self.constructor(edges, issues)
-
-    def constructor(self, edges: list[EdgeOutgoingDto], issues: list[IssueOutgoingDto]):
-        if self.init_counter > self.max_reconstructions:
-            raise RecursionError(
-                f"Cyclical reconstruction of InfluenceDiagramDOT object detected. "
-                f"Init counter is {self.init_counter}. This prevents infinite recursion "
-                f"during object reconstruction in validate_diagram method."
-            )
-
-        self.init_counter += 1
-
         self.edges = edges
         self.issues = issues
-        self.tail_to_head_lookup = {}
-        self.head_to_tail_lookup = {}
-        self._construct_lookups()
-        self._find_start_and_end_nodes()
+        self.model = DiagramModel(issues, edges)
         self._build_graph()
-    
-    def _construct_lookup(self, edge: EdgeOutgoingDto):
-        self.tail_to_head_lookup[edge.tail_issue_id] = edge.head_issue_id
-        self.head_to_tail_lookup[edge.head_issue_id] = edge.tail_issue_id
-
-    def _construct_lookups(self):
-        list(map(self._construct_lookup, self.edges))
-        
-    def _find_start_and_end_nodes(self):
-        all_tail_ids = set(self.tail_to_head_lookup.keys())
-        all_head_ids = set(self.head_to_tail_lookup.keys())
-        self.start_nodes = all_tail_ids - all_head_ids  # Nodes with no incoming edges
-        self.end_nodes = all_head_ids - all_tail_ids  # Nodes with no outgoing edges
-        
+
+    def _build_graph(self):
+        self.graph = Graph()
+        for edge in self.edges:
+            self.graph.addEdge(edge.tail_issue_id, edge.head_issue_id)
+        indexed = self.graph.indexed()
+        self.start_nodes = {
+            x for i, x in enumerate(indexed.vertex_ids) if len(indexed.predecessors(i)) == 0
+        }
+        self.end_nodes = {
+            x for i, x in enumerate(indexed.vertex_ids) if len(indexed.successors(i)) == 0
+        }
+
+    def diagnose(self) -> InfluenceDiagramDiagnostics:
+        """
+        Checks the diagram in one pass over the indexed graph and one over the issues.
+        When the diagram has separate parts only the largest is kept, which is found with the
+        union-find components of the graph, and the issues are checked for options and outcomes.
+        """
+        diagnostics = InfluenceDiagramDiagnostics(
+            start_nodes=self.start_nodes, end_nodes=self.end_nodes
+        )
+        errors = diagnostics.errors
         if len(self.start_nodes) == 0 and len(self.end_nodes) == 0:
-            raise ValueError(
+            errors.append(
                 f"Invalid influence diagram: no start nodes (nodes with no incoming edges) "
                 f"and no end nodes (nodes with no outgoing edges) found. "
             )
         elif len(self.start_nodes) == 0:
-            raise ValueError(
+            errors.append(
                 f"Invalid influence diagram: no start nodes (nodes with no incoming edges) found. "
             )
         elif len(self.end_nodes) == 0:
-            raise ValueError(
+            errors.append(
                 f"Invalid influence diagram: no end nodes (nodes with no outgoing edges) found. "
             )
-
-    def _build_graph(self):
-        self.graph = Graph()
-        for edge in self.edges:
-            self.graph.addEdge(edge.tail_issue_id, edge.head_issue_id)
-
-    def _reconstruct_for_longest_node_path(self):
-        seperated_graphs = self.find_seperated_graphs()
-        
-        if len(seperated_graphs) > 1:
-
-            # find the path with the most amount of nodes (longest path)
-            longest_path_nodes = max(seperated_graphs, key=len)
-            
-            if len(longest_path_nodes) == 0:
-                raise ValueError(
-                    f"Longest path contains no nodes. "
-                )
-            
-            # filter issues to only include those in the longest path
-            filtered_issues = [issue for issue in self.issues if issue.id in longest_path_nodes]
-            
-            # filter edges to only include those where both tail and head are in the longest path
-            filtered_edges = [
-                edge for edge in self.edges 
-                if edge.tail_issue_id in longest_path_nodes and edge.head_issue_id in longest_path_nodes
+        if len(self.edges) == 0:
+            errors.append(f"Invalid influence diagram: no edges found. ")
+        if len(self.issues) == 0:
+            errors.append(f"Invalid influence diagram: no issues found. ")
+
+        indexed = self.graph.indexed()
+        if len(indexed.topological_order()) < indexed.vertex_count:
+            diagnostics.cycle = indexed.get_ids(indexed.find_cycle() or [])
+            cycle_names = [
+                self.model.issues_by_id[x].name if x in self.model.issues_by_id else str(x)
+                for x in diagnostics.cycle
             ]
-            
-            # reconstruct the instance with filtered data
-            self.constructor(filtered_edges, filtered_issues)
-            self.validate_diagram()
-            self.init_counter=0
+            errors.append(f"Cycle in Influence diagram detected: {' -> '.join(cycle_names)}")
 
-    def validate_diagram(self):
-        if len(self.edges) == 0:
-            raise ValueError(
-                f"Invalid influence diagram: no edges found. "
-            )
+        diagnostics.components = self.find_seperated_graphs()
+        # the largest component is kept, the first one when several are as large
+        kept_component: Optional[set[uuid.UUID]] = None
+        if len(diagnostics.components) > 1:
+            kept_component = max(diagnostics.components, key=len)
 
-        if len(self.issues) == 0:
-            raise ValueError(
-                f"Invalid influence diagram: no issues found. "
-            )
-        
-        # checks for cyclical paths
-        is_cyclical = self.graph.detectCycle()
-        if is_cyclical:
-            raise ValueError("Cycle in Influence diagram detected")
-        
-        self._reconstruct_for_longest_node_path()
-        
-        # check that for the final issues, have at least 1 option/outcome
         validation_message = ""
+        kept_issues = 0
         for issue in self.issues:
-
-            if issue.type == Type.UNCERTAINTY and (issue.uncertainty is None or len(issue.uncertainty.outcomes) == 0):
+            if kept_component is not None and issue.id not in kept_component:
+                diagnostics.removed_issue_ids.append(issue.id)
+                continue
+            kept_issues += 1
+
+            if issue.type == Type.UNCERTAINTY and (
+                issue.uncertainty is None or len(issue.uncertainty.outcomes) == 0
+            ):
+                diagnostics.uncertainties_without_outcomes.append(issue.id)
                 validation_message += f"No Outcomes found for Uncertainty {issue.name}. \n"
-                
-            if issue.type == Type.DECISION and( issue.decision is None or len(issue.decision.options) == 0):
+
+            if issue.type == Type.DECISION and (
+                issue.decision is None or len(issue.decision.options) == 0
+            ):
+                diagnostics.decisions_without_options.append(issue.id)
                 validation_message += f"No Options found for Decision {issue.name}. \n"
 
+        if kept_issues == 0 and len(self.issues) > 0:
+            errors.append(f"Invalid influence diagram: no issues found. ")
         if validation_message != "":
-            raise ValueError(validation_message)
-            
-        
-
-    def traverse_graph_paths(self):
-        paths: dict[uuid.UUID, set[uuid.UUID]] = {}
-        for start_node in self.start_nodes:
-            path = self.graph.DFS(start_node)
-            paths[start_node]=path
-
-        return paths
-    
-    def find_seperated_graphs(self) -> list[set[uuid.UUID]]:
-        paths = self.traverse_graph_paths()
-        seperated_graphs: list[set[uuid.UUID]] = []
-        
-        seperated_graphs = [path for path in paths.values()]
-
-        seperated_graphs = join_sets_with_common_elements(seperated_graphs)
+            errors.append(validation_message)
+        return diagnostics
+
+    def validate_diagram(self) -> InfluenceDiagramDiagnostics:
+        """
+        Raises the first error of the diagnostics, otherwise leaves out the issues and edges
+        outside the largest part of the diagram.
+        """
+        diagnostics = self.diagnose()
+        if not diagnostics.is_valid:
+            raise ValueError(diagnostics.errors[0])
+
+        if diagnostics.removed_issue_ids:
+            removed_issue_ids = set(diagnostics.removed_issue_ids)
+            self.issues = [x for x in self.issues if x.id not in removed_issue_ids]
+            kept_vertex_ids = max(diagnostics.components, key=len)
+            self.edges = [x for x in self.edges if x.tail_issue_id in kept_vertex_ids]
+            self.model = DiagramModel(self.issues, self.edges)
+        return diagnostics
 
-        return seperated_graphs
+    def find_seperated_graphs(self) -> list[set[uuid.UUID]]:
+        """
+        The issues of the separate parts of the diagram. In an acyclic diagram the issues reached
+        from overlapping start nodes are the weakly connected components of the graph.
+        """
+        return self.graph.weaklyConnectedComponents()
@@ -1,15 +1,10 @@
 import uuid
 from typing import List, Optional
 from pydantic import BaseModel, Field
+from src.constants import DecisionTreeMode
 from src.dtos.issue_dtos import IssueOutgoingDto
 
 
-class EdgeUUIDDto(BaseModel):
-    tail: uuid.UUID
-    head: uuid.UUID | None
-    name: str = ""
-
-
 class EndPointNodeDto(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     scenario_id: uuid.UUID
@@ -27,6 +22,9 @@ class TreeNodeDto(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     issue: IssueOutgoingDto | EndPointNodeDto
     probabilities: Optional[list[ProbabilityDto]] = None
+    # from rolling back the tree, the option taken at decisions is the optimal branch
+    expected_value: Optional[float] = None
+    optimal_branch_id: Optional[uuid.UUID] = None
 
 class DecisionTreeDTO(BaseModel):
     tree_node: TreeNodeDto
@@ -35,3 +33,38 @@ class DecisionTreeDTO(BaseModel):
 class PartialOrderDTO(BaseModel):
     # list of issue ids
     issue_ids: Optional[List[uuid.UUID]] = None
+
+class CompressedTreeNodeDto(BaseModel):
+    # position of the issue in the partial order, the length of the partial order for endpoints
+    issue_index: int
+    probabilities: Optional[list[ProbabilityDto]] = None
+    # index of the tree node reached by each option or outcome of the issue
+    children: Optional[List[int]] = None
+    expected_value: Optional[float] = None
+    optimal_branch_id: Optional[uuid.UUID] = None
+
+class CompressedDecisionTreeDTO(BaseModel):
+    # the option and outcome ids from the root to the first tree node
+    path: List[uuid.UUID] = []
+    # the issues of the partial order, the tree nodes refer to them by position
+    issues: List[IssueOutgoingDto]
+    # identical subtrees are stored once, the first tree node is the root
+    tree_nodes: List[CompressedTreeNodeDto]
+    endpoint: EndPointNodeDto
+
+class DecisionTreeSizeDTO(BaseModel):
+    path: List[uuid.UUID] = []
+    depth: Optional[int] = None
+    # number of tree nodes on each level from the start node, down to the endpoints or the depth
+    level_sizes: List[int]
+    node_count: int
+    leaf_count: int
+    compressed_level_sizes: List[int]
+    compressed_node_count: int
+    estimated_bytes: int
+    estimated_compressed_bytes: int
+    estimated_seconds: float
+    estimated_compressed_seconds: float
+    # how the decision tree endpoint returns the tree within the configured limits, to which depth
+    mode: DecisionTreeMode
+    mode_depth: Optional[int] = None
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import List
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+
+
+class DiagramSnapshotDto(BaseModel):
+    issues: List[IssueOutgoingDto]
+    edges: List[EdgeOutgoingDto]
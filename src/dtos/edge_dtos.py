@@ -1,5 +1,6 @@
 import uuid
 from pydantic import BaseModel, Field
+from typing import Any, Callable
 from src.models.edge import Edge
 from src.dtos.node_dtos import NodeMapper, NodeOutgoingDto
 
@@ -23,6 +24,18 @@ class EdgeOutgoingDto(EdgeDto):
 
 
 class EdgeMapper:
+    @staticmethod
+    def field_mappers() -> dict[str, Callable[[Edge], Any]]:
+        """
+        Mapping of the EdgeOutgoingDto fields read through the nodes, used when only some fields are requested.
+        """
+        return {
+            "head_issue_id": lambda entity: entity.head_node.issue_id,
+            "tail_issue_id": lambda entity: entity.tail_node.issue_id,
+            "head_node": lambda entity: NodeMapper.to_outgoing_dto(entity.head_node),
+            "tail_node": lambda entity: NodeMapper.to_outgoing_dto(entity.tail_node),
+        }
+
     @staticmethod
     def to_outgoing_dto(entity: Edge) -> EdgeOutgoingDto:
         return EdgeOutgoingDto(
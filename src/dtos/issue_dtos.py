@@ -1,6 +1,6 @@
 import uuid
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional, Annotated
+from typing import Any, Callable, Optional, Annotated
 from src.constants import Type, Boundary
 from src.models.issue import Issue
 from src.dtos.decision_dtos import (
@@ -75,6 +75,30 @@ class IssueViaNodeOutgoingDto(IssueDto):
 
 
 class IssueMapper:
+    @staticmethod
+    def field_mappers() -> dict[str, Callable[[Issue], Any]]:
+        """
+        Mapping of the IssueOutgoingDto fields which are not plain attributes, used when only some fields are requested.
+        """
+        return {
+            "type": lambda entity: Type.UNASSIGNED.value
+            if entity.type in DepricatedIssueTypes._value2member_map_
+            else entity.type,
+            "node": lambda entity: NodeMapper.to_outgoing_dto_via_issue(entity.node),
+            "decision": lambda entity: DecisionMapper.to_outgoing_dto(entity.decision)
+            if entity.decision
+            else None,
+            "uncertainty": lambda entity: UncertaintyMapper.to_outgoing_dto(entity.uncertainty)
+            if entity.uncertainty
+            else None,
+            "utility": lambda entity: UtilityMapper.to_outgoing_dto(entity.utility)
+            if entity.utility
+            else None,
+            "value_metric": lambda entity: ValueMetricMapper.to_outgoing_dto(entity.value_metric)
+            if entity.value_metric
+            else None,
+        }
+
     @staticmethod
     def to_outgoing_dto(entity: Issue) -> IssueOutgoingDto:
         if entity.type in DepricatedIssueTypes._value2member_map_:
@@ -1,5 +1,6 @@
+import uuid
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from src.dtos.option_dtos import OptionOutgoingDto
 
 
@@ -7,3 +8,9 @@ class SolutionDto(BaseModel):
     optimal_options: List[OptionOutgoingDto]
     utility_mean: float
     utility_variance: float
+
+
+class ScenarioSolutionDto(BaseModel):
+    scenario_id: uuid.UUID
+    solution: Optional[SolutionDto] = None
+    error: Optional[str] = None
@@ -1,6 +1,6 @@
 import uuid
 from pydantic import BaseModel, Field
-from typing import Optional, Annotated, TYPE_CHECKING
+from typing import Any, Callable, Optional, Annotated, TYPE_CHECKING
 from src.models.node import Node
 from src.constants import DatabaseConstants
 
@@ -35,6 +35,18 @@ class NodeViaIssueOutgoingDto(NodeDto):
 
 
 class NodeMapper:
+    @staticmethod
+    def field_mappers() -> dict[str, Callable[[Node], Any]]:
+        """
+        Mapping of the NodeOutgoingDto relationships, used when only some fields are requested.
+        """
+        from src.dtos.issue_dtos import IssueMapper
+
+        return {
+            "issue": lambda entity: IssueMapper.to_outgoing_dto_via_node(entity.issue),
+            "node_style": lambda entity: NodeStyleMapper.to_outgoing_dto(entity.node_style),
+        }
+
     @staticmethod
     def to_outgoing_dto(entity: Node) -> NodeOutgoingDto:
         from src.dtos.issue_dtos import IssueMapper
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Any, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PageDto(BaseModel, Generic[T]):
+    items: List[T]
+    # pass as cursor to get the next page, None on the last page
+    next_cursor: Optional[str] = None
+
+
+# a page of dtos with only the fields and relationships selected with fields and expand
+SelectedFieldsPageDto = PageDto[dict[str, Any]]
+
+
+class PageRequestDto(BaseModel):
+    cursor: Optional[str] = None
+    limit: int
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Annotated
+from typing import Annotated, Any, Callable
 from src.dtos.project_roles_dtos import (
     ProjectRoleCreateDto,
     ProjectRoleIncomingDto,
@@ -51,6 +51,16 @@ class PopulatedProjectDto(ProjectDto):
 
 
 class ProjectMapper:
+    @staticmethod
+    def field_mappers() -> dict[str, Callable[[Project], Any]]:
+        """
+        Mapping of the ProjectOutgoingDto relationships, used when only some fields are requested.
+        """
+        return {
+            "users": lambda entity: ProjectRoleMapper.to_outgoing_dtos(entity.project_role),
+            "scenarios": lambda entity: ScenarioMapper.to_outgoing_dtos(entity.scenarios),
+        }
+
     @staticmethod
     def from_create_to_entity(dto: ProjectCreateDto, user_id: int) -> Project:
         return Project(
@@ -1,6 +1,6 @@
 import uuid
 from pydantic import BaseModel, Field
-from typing import Annotated
+from typing import Annotated, Any, Callable
 from src.models.scenario import Scenario
 from src.dtos.opportunity_dtos import (
     OpportunityMapper,
@@ -59,6 +59,13 @@ class PopulatedScenarioDto(ScenarioOutgoingDto):
 
 
 class ScenarioMapper:
+    @staticmethod
+    def field_mappers() -> dict[str, Callable[[Scenario], Any]]:
+        """
+        Mapping of the ScenarioOutgoingDto relationships, used when only some fields are requested.
+        """
+        return {"objectives": lambda entity: ObjectiveMapper.to_outgoing_dtos(entity.objectives)}
+
     @staticmethod
     def from_create_via_project_to_entity(
         dto: ScenarioCreateViaProjectDto, user_id: int, project_id: uuid.UUID
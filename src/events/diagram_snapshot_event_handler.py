@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+
+from src.models import Scenario
+from src.repositories import diagram_snapshot_repository
+from src.utils.session_info_handler import SessionInfoHandler
+
+class DiagramSnapshotEventHandler:
+    """
+    Creates the diagram snapshots of new scenarios, and marks the snapshots of changed scenarios as stale.
+    The snapshots are not rebuilt here, the DiagramSnapshotService rebuilds them on the next read.
+    """
+
+    def process_session_changes_after_flush(self, session: Session) -> None:
+        """Must run after the ScenarioChangeEventHandler has registered the affected scenarios of the flush."""
+        session_info = SessionInfoHandler.get_session_info(session)
+
+        new_scenarios = {entity.id for entity in session.new if isinstance(entity, Scenario)}
+        stale_scenarios = session_info.affected_scenarios - session_info.stale_snapshots - new_scenarios
+        if not (new_scenarios or stale_scenarios):
+            return
+
+        diagram_snapshot_repository.create_snapshots(session, new_scenarios)
+        # the version only has to be incremented once per transaction, as it is not visible to others before the commit
+        diagram_snapshot_repository.mark_snapshots_stale(session, stale_scenarios)
+
+        session_info.stale_snapshots.update(new_scenarios | stale_scenarios)
+        SessionInfoHandler.update_session_info(session, session_info)
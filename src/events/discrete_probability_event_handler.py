@@ -200,5 +200,4 @@ class DiscreteProbabilityEventHandler:
         if not session_info.affected_uncertainties:
             return
         
-        for uncertainty_id in session_info.affected_uncertainties:
-            uncertainty_repository.recalculate_discrete_probability_table(session, uncertainty_id)
\ No newline at end of file
+        uncertainty_repository.recalculate_discrete_probability_tables(session, session_info.affected_uncertainties)
\ No newline at end of file
@@ -0,0 +1,85 @@
+import uuid
+
+from typing import Any
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import select
+
+from src.models import (
+    Edge, Issue, Node, Outcome, Option, Uncertainty, Decision, DiscreteProbability, Utility, ValueMetric,
+)
+from src.utils.session_info_handler import SessionInfoHandler
+from src.utils.scenario_cache import invalidate_scenario_caches
+
+class ScenarioChangeEventHandler:
+    """Tracks which scenarios are changed by a session, and invalidates scenario caches on commit."""
+
+    subscribed_entities = [Issue, Node, Edge, Decision, Uncertainty, Option, Outcome, DiscreteProbability, Utility, ValueMetric]
+
+    def process_session_changes_before_flush(self, session: Session) -> None:
+        """Modified and deleted entities must be resolved before the flush removes them."""
+        self._register_affected_scenarios(session, [*session.dirty, *session.deleted])
+
+    def process_session_changes_after_flush(self, session: Session) -> None:
+        """New entities are resolved after the flush so that they can be found by the queries."""
+        self._register_affected_scenarios(session, list(session.new))
+
+    def invalidate_affected_scenarios(self, session: Session) -> None:
+        session_info = SessionInfoHandler.get_session_info(session)
+        invalidate_scenario_caches(session_info.affected_scenarios)
+
+    def _register_affected_scenarios(self, session: Session, entities: list[Any]) -> None:
+        subscribed = [
+            entity for entity in entities
+            if any(isinstance(entity, entity_type) for entity_type in self.subscribed_entities)
+        ]
+        if not subscribed:
+            return
+
+        session_info = SessionInfoHandler.get_session_info(session)
+        session_info.affected_scenarios.update(self._find_affected_scenarios(session, subscribed))
+        SessionInfoHandler.update_session_info(session, session_info)
+
+    def _find_affected_scenarios(self, session: Session, entities: list[Any]) -> set[uuid.UUID]:
+        scenario_ids: set[uuid.UUID] = set()
+        issue_ids: set[uuid.UUID] = set()
+        decision_ids: set[uuid.UUID] = set()
+        uncertainty_ids: set[uuid.UUID] = set()
+
+        for entity in entities:
+            if isinstance(entity, (Issue, Node, Edge)):
+                if entity.scenario_id is not None:
+                    scenario_ids.add(entity.scenario_id)
+            elif isinstance(entity, (Utility, ValueMetric)):
+                issue_ids.add(entity.issue_id)
+            elif isinstance(entity, Decision):
+                decision_ids.add(entity.id)
+            elif isinstance(entity, Option):
+                decision_ids.add(entity.decision_id)
+            elif isinstance(entity, Uncertainty):
+                uncertainty_ids.add(entity.id)
+            elif isinstance(entity, (Outcome, DiscreteProbability)):
+                uncertainty_ids.add(entity.uncertainty_id)
+
+        issue_ids.discard(None) # type: ignore
+        decision_ids.discard(None) # type: ignore
+        uncertainty_ids.discard(None) # type: ignore
+
+        if issue_ids:
+            scenario_ids.update(session.scalars(
+                select(Issue.scenario_id).where(Issue.id.in_(issue_ids))
+            ).all())
+
+        if decision_ids:
+            scenario_ids.update(session.scalars(
+                select(Issue.scenario_id).join(Decision, Decision.issue_id == Issue.id)
+                .where(Decision.id.in_(decision_ids))
+            ).all())
+
+        if uncertainty_ids:
+            scenario_ids.update(session.scalars(
+                select(Issue.scenario_id).join(Uncertainty, Uncertainty.issue_id == Issue.id)
+                .where(Uncertainty.id.in_(uncertainty_ids))
+            ).all())
+
+        return scenario_ids
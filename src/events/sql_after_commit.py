@@ -1,7 +1,9 @@
 from sqlalchemy import event
 from sqlalchemy.orm import Session
+from src.events.scenario_change_event_handler import ScenarioChangeEventHandler
 
 @event.listens_for(Session, 'after_commit')
 def after_commit_event_handler(session: Session) -> None:
+    ScenarioChangeEventHandler().invalidate_affected_scenarios(session)
     # Clear the session info after successful commit
     session.info.clear()
\ No newline at end of file
@@ -2,7 +2,11 @@ from typing import Any
 from sqlalchemy import event
 from sqlalchemy.orm import Session
 from src.events.discrete_probability_event_handler import DiscreteProbabilityEventHandler
+from src.events.scenario_change_event_handler import ScenarioChangeEventHandler
+from src.events.diagram_snapshot_event_handler import DiagramSnapshotEventHandler
 
 @event.listens_for(Session, 'after_flush')
 def after_flush_event_handler(session: Session, flush_context: Any) -> None:
-    DiscreteProbabilityEventHandler().process_session_changes_after_flush(session)
\ No newline at end of file
+    DiscreteProbabilityEventHandler().process_session_changes_after_flush(session)
+    ScenarioChangeEventHandler().process_session_changes_after_flush(session)
+    DiagramSnapshotEventHandler().process_session_changes_after_flush(session)
\ No newline at end of file
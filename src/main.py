@@ -22,6 +22,7 @@ import src.routes.solver_routes as solver_routes
 import src.routes.structure_routes as structure_routes
 from src.config import config
 from src.session_manager import sessionmanager
+from src.services.solver_pool import solver_pool
 from src.middleware.py_instrument_middle_ware import PyInstrumentMiddleWare
 from fastapi.middleware.cors import CORSMiddleware
 from azure.monitor.opentelemetry import configure_azure_monitor  # type: ignore
@@ -38,6 +39,7 @@ async def lifespan(app: FastAPI):
     await sessionmanager.init_db()
     yield
 
+    solver_pool.shutdown()
     await sessionmanager.close()
 
 
@@ -21,3 +21,4 @@ from src.models.discrete_probability import (
     DiscreteProbabilityParentOption, # type: ignore
     DiscreteProbability, # type: ignore
 )  
+from src.models.diagram_snapshot import DiagramSnapshot  # type: ignore
@@ -0,0 +1,25 @@
+import uuid
+from typing import Optional
+from sqlalchemy import ForeignKey, Integer, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+from src.models.guid import GUID
+
+
+class DiagramSnapshot(Base):
+    """
+    Serialized influence diagram of a scenario, as consumed by the solver and the decision tree.
+    The version is incremented by the session hooks whenever the diagram of the scenario changes,
+    which also clears the data. Data is only stored if the version is unchanged since it was read.
+    """
+    __tablename__ = "diagram_snapshot"
+    scenario_id: Mapped[uuid.UUID] = mapped_column(GUID(), ForeignKey("scenario.id", ondelete="CASCADE"), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0)
+    format_version: Mapped[int] = mapped_column(Integer, default=0)
+    data: Mapped[Optional[bytes]] = mapped_column(LargeBinary, default=None, nullable=True)
+
+    def __init__(self, scenario_id: uuid.UUID, version: int = 0, format_version: int = 0, data: Optional[bytes] = None):
+        self.scenario_id = scenario_id
+        self.version = version
+        self.format_version = format_version
+        self.data = data
@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
-from sqlalchemy.sql import ColumnElement, Select, select, desc
+from sqlalchemy.sql import ColumnElement, Select, select, desc, and_, or_
 from sqlalchemy.orm.strategy_options import _AbstractLoad  # type: ignore
 from typing import (
     Type,
@@ -15,10 +15,12 @@ from typing import (
     Union,
     Optional,
     Tuple,
+    AsyncIterator,
     cast,
 )
 from odata_query.sqlalchemy.shorthand import apply_odata_query
 from src.constants import PageSize
+from src.utils.keyset_cursor import encode_cursor, decode_cursor
 from src.models import (
     Uncertainty,
     Decision,
@@ -69,6 +71,21 @@ class BaseRepository(Generic[T, IDType]):
         )
         return list((await self.session.scalars(query)).unique().all())
 
+    def _filtered_query(
+        self,
+        model_filter: List[ColumnElement[bool]],
+        odata_query: Optional[str],
+        load_options: Optional[LoadOptions] = None,
+    ) -> Select[Tuple[T]]:
+        query = select(self.model).options(
+            *(load_options if load_options is not None else self.query_extension_method())
+        )
+        if len(model_filter) != 0:
+            query = query.filter(*model_filter)
+        if odata_query is not None:
+            query = cast(Select[Tuple[T]], apply_odata_query(query, odata_query))
+        return query
+
     async def get_all(
         self,
         model_filter: List[ColumnElement[bool]] = [],
@@ -76,14 +93,57 @@ class BaseRepository(Generic[T, IDType]):
         skip: int = 0,
         take: int = PageSize.DEFAULT,
     ) -> List[T]:
-        query = select(self.model).options(*self.query_extension_method())
-        if len(model_filter) != 0:
-            query = query.filter(*model_filter)
-        if odata_query is not None:
-            query = cast(Select[Tuple[T]], apply_odata_query(query, odata_query))
-        query = query.order_by(desc(self.model.created_at)).offset(skip).limit(take)
+        query = self._filtered_query(model_filter, odata_query)
+        query = query.order_by(desc(self.model.created_at), desc(self.model.id)).offset(skip).limit(take)
         return list((await self.session.scalars(query)).unique().all())
 
+    async def get_page(
+        self,
+        model_filter: List[ColumnElement[bool]] = [],
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+        load_options: Optional[LoadOptions] = None,
+    ) -> Tuple[List[T], Optional[str]]:
+        """
+        Keyset pagination on (created_at, id) in descending order.
+        Returns the entities after the cursor and the cursor of the next page, which is None on the last page.
+        load_options replaces the relationship loads of the repository, to load only what is requested.
+        """
+        query = self._filtered_query(model_filter, odata_query, load_options)
+        if cursor is not None:
+            created_at, id = decode_cursor(cursor)
+            query = query.where(
+                or_(
+                    self.model.created_at < created_at,
+                    and_(self.model.created_at == created_at, self.model.id < id),
+                )
+            )
+        # one extra entity tells whether there is a next page
+        query = query.order_by(desc(self.model.created_at), desc(self.model.id)).limit(take + 1)
+        entities = list((await self.session.scalars(query)).unique().all())
+
+        if len(entities) <= take:
+            return entities, None
+        entities = entities[:take]
+        return entities, encode_cursor(entities[-1].created_at, entities[-1].id)
+
+    async def stream(
+        self,
+        model_filter: List[ColumnElement[bool]] = [],
+        odata_query: Optional[str] = None,
+        batch_size: int = PageSize.STREAM_BATCH,
+    ) -> AsyncIterator[List[T]]:
+        """
+        Yields all entities in batches of a single query, with the rows fetched from the database cursor
+        as the batches are consumed (yield_per). The eager loads of the repository must not join collections, which yield_per does not support.
+        """
+        query = self._filtered_query(model_filter, odata_query)
+        query = query.order_by(desc(self.model.created_at), desc(self.model.id))
+        result = await self.session.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for entities in result.partitions():
+            yield list(entities)
+
     async def delete(self, ids: List[IDType]) -> None:
         entities = await self.get(ids)
         for entity in entities:
@@ -0,0 +1,92 @@
+import uuid
+from typing import Iterable, Optional
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import select
+from src.models import DiagramSnapshot
+
+
+class DiagramSnapshotRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, scenario_id: uuid.UUID) -> Optional[tuple[int, int, Optional[bytes]]]:
+        """
+        Returns the version, format version and data of the snapshot, without loading it into the session.
+        """
+        row = (await self.session.execute(
+            select(DiagramSnapshot.version, DiagramSnapshot.format_version, DiagramSnapshot.data)
+            .where(DiagramSnapshot.scenario_id == scenario_id)
+        )).first()
+        return None if row is None else (row[0], row[1], row[2])
+
+    async def get_many(
+        self, scenario_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[int, int, Optional[bytes]]]:
+        """
+        The version, format version and data of the snapshots of the scenarios, by scenario id.
+        """
+        rows = (await self.session.execute(
+            select(
+                DiagramSnapshot.scenario_id,
+                DiagramSnapshot.version,
+                DiagramSnapshot.format_version,
+                DiagramSnapshot.data,
+            ).where(DiagramSnapshot.scenario_id.in_(scenario_ids))
+        )).all()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    async def get_version(self, scenario_id: uuid.UUID) -> Optional[int]:
+        """
+        The version is incremented whenever the diagram of the scenario changes,
+        so together with the scenario id it identifies the content of the diagram.
+        """
+        return (await self.session.execute(
+            select(DiagramSnapshot.version).where(DiagramSnapshot.scenario_id == scenario_id)
+        )).scalar_one_or_none()
+
+    async def store(self, scenario_id: uuid.UUID, version: Optional[int], format_version: int, data: bytes) -> bool:
+        """
+        Stores the data if the snapshot still has the version it had when the data was read,
+        version None meaning that there was no snapshot. Returns whether the data was stored.
+        """
+        if version is None:
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(
+                        insert(DiagramSnapshot).values(scenario_id=scenario_id, version=0, format_version=format_version, data=data)
+                    )
+                return True
+            except IntegrityError:
+                # created concurrently
+                return False
+
+        result = await self.session.execute(
+            update(DiagramSnapshot)
+            .where(DiagramSnapshot.scenario_id == scenario_id, DiagramSnapshot.version == version)
+            .values(format_version=format_version, data=data)
+        )
+        return result.rowcount == 1 # type: ignore
+
+
+def create_snapshots(session: Session, scenario_ids: Iterable[uuid.UUID]):
+    scenario_ids = set(scenario_ids)
+    if not scenario_ids:
+        return
+    session.execute(insert(DiagramSnapshot.__table__), [{"scenario_id": x, "version": 0, "format_version": 0} for x in scenario_ids])
+
+def mark_snapshots_stale(session: Session, scenario_ids: Iterable[uuid.UUID]):
+    """
+    Increments the version of the snapshots and clears their data, so that a snapshot read
+    before the change can not be stored afterwards.
+    """
+    scenario_ids = set(scenario_ids)
+    if not scenario_ids:
+        return
+    session.execute(
+        update(DiagramSnapshot.__table__)
+        .where(DiagramSnapshot.scenario_id.in_(scenario_ids))
+        .values(version=DiagramSnapshot.version + 1, data=None)
+    )
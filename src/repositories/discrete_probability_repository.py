@@ -1,6 +1,10 @@
 import uuid
-from src.models.discrete_probability import DiscreteProbability
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+from src.models.discrete_probability import DiscreteProbability, DiscreteProbabilityParentOutcome, DiscreteProbabilityParentOption
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import select
 from src.repositories.base_repository import BaseRepository
 from src.repositories.query_extensions import QueryExtensions
 
@@ -36,4 +40,104 @@ class DiscreteProbabilityRepository(BaseRepository[DiscreteProbability, uuid.UUI
 
         await self.session.flush()
         return entities_to_update
-    
\ No newline at end of file
+    
+
+# stays below the 2100 parameter limit of SQL Server for the IN clauses
+BULK_CHUNK_SIZE = 1000
+
+
+class DiscreteProbabilityRow(NamedTuple):
+    id: uuid.UUID
+    uncertainty_id: uuid.UUID
+    outcome_id: uuid.UUID
+    probability: Optional[float]
+    parent_outcome_ids: list[uuid.UUID]
+    parent_option_ids: list[uuid.UUID]
+
+
+def _chunks(values: list[Any], size: int = BULK_CHUNK_SIZE) -> Iterator[list[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def get_discrete_probability_rows(session: Session, uncertainty_ids: Iterable[uuid.UUID]) -> list[DiscreteProbabilityRow]:
+    """
+    Read the probability tables of the uncertainties as plain rows, without loading ORM entities.
+    """
+    rows: dict[uuid.UUID, DiscreteProbabilityRow] = {}
+    for chunk in _chunks(list(set(uncertainty_ids))):
+        for id, uncertainty_id, outcome_id, probability in session.execute(
+            select(DiscreteProbability.id, DiscreteProbability.uncertainty_id, DiscreteProbability.outcome_id, DiscreteProbability.probability)
+            .where(DiscreteProbability.uncertainty_id.in_(chunk))
+        ):
+            rows[id] = DiscreteProbabilityRow(id, uncertainty_id, outcome_id, probability, [], [])
+
+        for discrete_probability_id, parent_outcome_id in session.execute(
+            select(DiscreteProbabilityParentOutcome.discrete_probability_id, DiscreteProbabilityParentOutcome.parent_outcome_id)
+            .join(DiscreteProbability, DiscreteProbability.id == DiscreteProbabilityParentOutcome.discrete_probability_id)
+            .where(DiscreteProbability.uncertainty_id.in_(chunk))
+        ):
+            rows[discrete_probability_id].parent_outcome_ids.append(parent_outcome_id)
+
+        for discrete_probability_id, parent_option_id in session.execute(
+            select(DiscreteProbabilityParentOption.discrete_probability_id, DiscreteProbabilityParentOption.parent_option_id)
+            .join(DiscreteProbability, DiscreteProbability.id == DiscreteProbabilityParentOption.discrete_probability_id)
+            .where(DiscreteProbability.uncertainty_id.in_(chunk))
+        ):
+            rows[discrete_probability_id].parent_option_ids.append(parent_option_id)
+
+    return list(rows.values())
+
+
+def bulk_insert_discrete_probabilities(session: Session, rows: list[DiscreteProbabilityRow]) -> None:
+    """
+    Insert the rows and their parent relations as one batched INSERT per table,
+    executed with executemany (fast_executemany on pyodbc/aioodbc).
+    The parent relations are inserted after the probabilities they reference.
+    """
+    if not rows:
+        return
+    session.execute(
+        insert(DiscreteProbability.__table__),
+        [
+            {
+                "id": row.id,
+                "uncertainty_id": row.uncertainty_id,
+                "outcome_id": row.outcome_id,
+                "probability": row.probability,
+            }
+            for row in rows
+        ],
+    )
+    parent_outcomes = [
+        {"discrete_probability_id": row.id, "parent_outcome_id": parent_outcome_id}
+        for row in rows for parent_outcome_id in row.parent_outcome_ids
+    ]
+    if parent_outcomes:
+        session.execute(insert(DiscreteProbabilityParentOutcome.__table__), parent_outcomes)
+    parent_options = [
+        {"discrete_probability_id": row.id, "parent_option_id": parent_option_id}
+        for row in rows for parent_option_id in row.parent_option_ids
+    ]
+    if parent_options:
+        session.execute(insert(DiscreteProbabilityParentOption.__table__), parent_options)
+
+
+def bulk_delete_discrete_probabilities(session: Session, ids: Iterable[uuid.UUID]) -> None:
+    """
+    Delete the probabilities together with their parent relations, which is the cascade
+    the ORM would apply. The relations are deleted first to satisfy the foreign keys.
+    """
+    for chunk in _chunks(list(set(ids))):
+        session.execute(
+            delete(DiscreteProbabilityParentOutcome.__table__)
+            .where(DiscreteProbabilityParentOutcome.discrete_probability_id.in_(chunk))
+        )
+        session.execute(
+            delete(DiscreteProbabilityParentOption.__table__)
+            .where(DiscreteProbabilityParentOption.discrete_probability_id.in_(chunk))
+        )
+        session.execute(
+            delete(DiscreteProbability.__table__)
+            .where(DiscreteProbability.id.in_(chunk))
+        )
@@ -29,6 +29,16 @@ class EdgeRepository(BaseRepository[Edge, uuid.UUID]):
         await self.session.flush()
         return entities_to_update
 
+    async def get_node_ids_by_scenario(
+        self, scenario_ids: list[uuid.UUID]
+    ) -> list[tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]]:
+        """The id, scenario id, tail node id and head node id of every edge of the scenarios."""
+        query = select(Edge.id, Edge.scenario_id, Edge.tail_id, Edge.head_id).where(
+            Edge.scenario_id.in_(scenario_ids)
+        )
+        result = await self.session.execute(query)
+        return [(x.id, x.scenario_id, x.tail_id, x.head_id) for x in result.all()]
+
 def find_effected_uncertainties(session: Session, ids: set[uuid.UUID]) -> set[uuid.UUID]:
     uncertainty_ids: set[uuid.UUID] = set()
     query = select(Edge).where(Edge.id.in_(ids)).options(
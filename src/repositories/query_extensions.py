@@ -41,33 +41,53 @@ class QueryExtensions:
             selectinload(DiscreteProbability.parent_outcomes),
         ]
 
+    @staticmethod
+    def issue_field_loads() -> dict[str, list[_AbstractLoad]]:
+        """
+        Loads of the relationships of IssueOutgoingDto by field, used when only some fields are requested.
+        """
+        return {
+            "decision": [
+                joinedload(Issue.decision).options(*QueryExtensions.load_decision_with_relationships())
+            ],
+            "uncertainty": [
+                joinedload(Issue.uncertainty).options(
+                    *QueryExtensions.load_uncertainty_with_relationships()
+                )
+            ],
+            "utility": [joinedload(Issue.utility)],
+            "value_metric": [joinedload(Issue.value_metric)],
+            "node": [joinedload(Issue.node).options(joinedload(Node.node_style))],
+        }
+
     @staticmethod
     def load_issue_with_relationships() -> list[_AbstractLoad]:
-        return [
-            joinedload(Issue.decision).options(*QueryExtensions.load_decision_with_relationships()),
-            joinedload(Issue.uncertainty).options(
-                *QueryExtensions.load_uncertainty_with_relationships()
-            ),
-            joinedload(Issue.utility),
-            joinedload(Issue.value_metric),
-            joinedload(Issue.node).options(joinedload(Node.node_style)),
-        ]
+        return [x for loads in QueryExtensions.issue_field_loads().values() for x in loads]
+
+    @staticmethod
+    def node_field_loads() -> dict[str, list[_AbstractLoad]]:
+        """
+        Loads of the relationships of NodeOutgoingDto by field, used when only some fields are requested.
+        """
+        return {
+            "issue": [
+                joinedload(Node.issue).options(
+                    joinedload(Issue.decision).options(
+                        *QueryExtensions.load_decision_with_relationships()
+                    ),
+                    joinedload(Issue.uncertainty).options(
+                        *QueryExtensions.load_uncertainty_with_relationships()
+                    ),
+                    joinedload(Issue.utility),
+                    joinedload(Issue.value_metric),
+                )
+            ],
+            "node_style": [joinedload(Node.node_style)],
+        }
 
     @staticmethod
     def load_node_with_relationships() -> list[_AbstractLoad]:
-        return [
-            joinedload(Node.issue).options(
-                joinedload(Issue.decision).options(
-                    *QueryExtensions.load_decision_with_relationships()
-                ),
-                joinedload(Issue.uncertainty).options(
-                    *QueryExtensions.load_uncertainty_with_relationships()
-                ),
-                joinedload(Issue.utility),
-                joinedload(Issue.value_metric),
-            ),
-            joinedload(Node.node_style),
-        ]
+        return [x for loads in QueryExtensions.node_field_loads().values() for x in loads]
     
     @staticmethod
     def load_node_with_edge_relationships() -> list[_AbstractLoad]:
@@ -98,6 +118,13 @@ class QueryExtensions:
             )
         ]
 
+    @staticmethod
+    def scenario_field_loads() -> dict[str, list[_AbstractLoad]]:
+        """
+        Loads of the relationships of ScenarioOutgoingDto by field, used when only some fields are requested.
+        """
+        return {"objectives": [selectinload(Scenario.objectives)]}
+
     @staticmethod
     def load_scenario_with_relationships() -> list[_AbstractLoad]:
         return [
@@ -109,6 +136,22 @@ class QueryExtensions:
             joinedload(Scenario.issues).options(*QueryExtensions.load_issue_with_relationships()),
         ]
 
+    @staticmethod
+    def edge_field_loads() -> dict[str, list[_AbstractLoad]]:
+        """
+        Loads of the fields of EdgeOutgoingDto read through relationships, used when only some fields are requested.
+        """
+        return {
+            "head_issue_id": [joinedload(Edge.head_node)],
+            "tail_issue_id": [joinedload(Edge.tail_node)],
+            "head_node": [
+                joinedload(Edge.head_node).options(*QueryExtensions.load_node_with_relationships())
+            ],
+            "tail_node": [
+                joinedload(Edge.tail_node).options(*QueryExtensions.load_node_with_relationships())
+            ],
+        }
+
     @staticmethod
     def load_edge_with_relationships() -> list[_AbstractLoad]:
         return [
@@ -116,6 +159,20 @@ class QueryExtensions:
             joinedload(Edge.head_node).options(*QueryExtensions.load_node_with_relationships()),
         ]
 
+    @staticmethod
+    def project_field_loads() -> dict[str, list[_AbstractLoad]]:
+        """
+        Loads of the relationships of ProjectOutgoingDto by field, used when only some fields are requested.
+        """
+        return {
+            "users": [selectinload(Project.project_role).options(*QueryExtensions.load_role_with_user())],
+            "scenarios": [
+                selectinload(Project.scenarios).options(
+                    *QueryExtensions.scenario_field_loads()["objectives"]
+                )
+            ],
+        }
+
     @staticmethod
     def load_project_with_relationships() -> list[_AbstractLoad]:
         return [
@@ -1,12 +1,19 @@
 import uuid
-from typing import List
+from collections import defaultdict
+from typing import Iterable, List
 from itertools import product, chain
-from src.models import Uncertainty, DiscreteProbability, DiscreteProbabilityParentOption, DiscreteProbabilityParentOutcome
+from src.models import Uncertainty
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload, Session
 from sqlalchemy.sql import select
 from src.repositories.base_repository import BaseRepository
 from src.repositories.query_extensions import QueryExtensions
+from src.repositories.discrete_probability_repository import (
+    DiscreteProbabilityRow,
+    get_discrete_probability_rows,
+    bulk_insert_discrete_probabilities,
+    bulk_delete_discrete_probabilities,
+)
 from src.constants import Type, DecisionHierarchy, Boundary
 
 from src.models import Issue, Node, Edge, Decision, Uncertainty
@@ -42,15 +49,20 @@ class UncertaintyRepository(BaseRepository[Uncertainty, uuid.UUID]):
 
         await self.session.flush()
 
-def recalculate_discrete_probability_table(session: Session, id: uuid.UUID):
+def recalculate_discrete_probability_tables(session: Session, ids: Iterable[uuid.UUID]):
+    """
+    Brings the discrete probability tables of the uncertainties in line with their current parents.
+    Rows whose outcome and parent combination are still valid keep their id and probability,
+    only rows for new combinations are added and rows for combinations that no longer exist are removed.
+    The tables are read and written with batched statements, which only see flushed changes.
+    """
+    ids = set(ids)
+    if not ids:
+        return
 
     query = (
-        select(Uncertainty).where(Uncertainty.id == id).options(
+        select(Uncertainty).where(Uncertainty.id.in_(ids)).options(
             selectinload(Uncertainty.outcomes),
-            selectinload(Uncertainty.discrete_probabilities).options(
-                selectinload(DiscreteProbability.parent_options),
-                selectinload(DiscreteProbability.parent_outcomes),
-            ),
             joinedload(Uncertainty.issue).options(
                 joinedload(Issue.node).options(
                     selectinload(Node.head_edges).options(
@@ -66,21 +78,30 @@ def recalculate_discrete_probability_table(session: Session, id: uuid.UUID):
                         )
                     ),
                 ),
-                joinedload(Issue.uncertainty).options(
-                    selectinload(Uncertainty.outcomes)
-                ),                    
-                joinedload(Issue.decision).options(
-                    selectinload(Decision.options)
-                ),            
             )
         )
     )
-    entity: Uncertainty = (session.scalars(query)).unique().first()
-    if entity is None:
-        return
+    entities: list[Uncertainty] = list((session.scalars(query)).unique().all())
+
+    existing_rows: dict[uuid.UUID, list[DiscreteProbabilityRow]] = defaultdict(list)
+    for row in get_discrete_probability_rows(session, [entity.id for entity in entities]):
+        existing_rows[row.uncertainty_id].append(row)
+
+    rows_to_insert: list[DiscreteProbabilityRow] = []
+    ids_to_delete: list[uuid.UUID] = []
+    for entity in entities:
+        new_rows, obsolete_ids = _compare_discrete_probability_table(entity, existing_rows[entity.id])
+        rows_to_insert.extend(new_rows)
+        ids_to_delete.extend(obsolete_ids)
+
+    bulk_delete_discrete_probabilities(session, ids_to_delete)
+    bulk_insert_discrete_probabilities(session, rows_to_insert)
 
-    entity.discrete_probabilities = []
+    # loaded probability collections no longer match the tables
+    for entity in entities:
+        session.expire(entity, [Uncertainty.discrete_probabilities.key])
 
+def _find_parent_states(entity: Uncertainty) -> tuple[List[List[uuid.UUID]], List[List[uuid.UUID]]]:
     parent_outcomes_list: List[List[uuid.UUID]] = []
     parent_options_list: List[List[uuid.UUID]] = []
 
@@ -100,31 +121,51 @@ def recalculate_discrete_probability_table(session: Session, id: uuid.UUID):
             if not issue.decision or issue.decision.type != DecisionHierarchy.FOCUS.value: continue
             parent_options_list.append([x.id for x in issue.decision.options])
 
-    # check if no valid edges and thus cannot be empty, but should be 1 row
-    if len(parent_outcomes_list) == 0 and len(parent_options_list) == 0:
-        entity.discrete_probabilities = [DiscreteProbability(id = uuid.uuid4(), uncertainty_id=entity.id, outcome_id=x.id, probability=0) for x in entity.outcomes]
-        return
-    
-    parent_combinations = list(product(*parent_outcomes_list, *parent_options_list))
-    # get all options and outcomes to filter on later
-    all_options: List[uuid.UUID] = list(chain(*parent_options_list))
-    all_outcomes: List[uuid.UUID] = list(chain(*parent_outcomes_list))
+    return parent_outcomes_list, parent_options_list
+
+def _compare_discrete_probability_table(
+    entity: Uncertainty, existing_rows: list[DiscreteProbabilityRow]
+) -> tuple[list[DiscreteProbabilityRow], list[uuid.UUID]]:
+    """
+    Returns the rows to add and the ids of the rows to remove from the probability table of the uncertainty.
+    """
+    if entity.issue is None or entity.issue.node is None:
+        return [], []
 
+    parent_outcomes_list, parent_options_list = _find_parent_states(entity)
+    # with no valid parents the table is not empty, but has a single row
+    parent_combinations = list(product(*parent_outcomes_list, *parent_options_list))
+    all_options: set[uuid.UUID] = set(chain(*parent_options_list))
+
+    # a row is identified by its outcome and the set of parent states
+    required_rows: set[tuple[uuid.UUID, frozenset[uuid.UUID]]] = {
+        (outcome.id, frozenset(parent_combination))
+        for outcome in entity.outcomes
+        for parent_combination in parent_combinations
+    }
+
+    kept_rows: set[tuple[uuid.UUID, frozenset[uuid.UUID]]] = set()
+    ids_to_delete: list[uuid.UUID] = []
+    for row in existing_rows:
+        key = (row.outcome_id, frozenset(row.parent_outcome_ids + row.parent_option_ids))
+        if key in required_rows and key not in kept_rows:
+            kept_rows.add(key)
+        else:
+            ids_to_delete.append(row.id)
+
+    rows_to_insert: list[DiscreteProbabilityRow] = []
     for outcome in entity.outcomes:
         for parent_combination in parent_combinations:
-            parent_option_ids = filter(lambda x: x in all_options, parent_combination)
-            parent_outcome_ids = filter(lambda x: x in all_outcomes, parent_combination)
-            probability_id = uuid.uuid4() 
-            entity.discrete_probabilities.append(
-                DiscreteProbability(
-                    id = probability_id,
+            if (outcome.id, frozenset(parent_combination)) in kept_rows: continue
+            rows_to_insert.append(
+                DiscreteProbabilityRow(
+                    id=uuid.uuid4(),
                     uncertainty_id=entity.id,
                     outcome_id=outcome.id,
                     probability=0,
-                    parent_outcomes=[DiscreteProbabilityParentOutcome(discrete_probability_id=probability_id, parent_outcome_id=x) for x in parent_outcome_ids],
-                    parent_options=[DiscreteProbabilityParentOption(discrete_probability_id=probability_id, parent_option_id=x) for x in parent_option_ids],
+                    parent_outcome_ids=[x for x in parent_combination if x not in all_options],
+                    parent_option_ids=[x for x in parent_combination if x in all_options],
                 )
             )
 
-    return
-
+    return rows_to_insert, ids_to_delete
@@ -7,7 +7,8 @@ from src.dtos.decision_dtos import DecisionIncomingDto, DecisionOutgoingDto
 from src.services.decision_service import DecisionService
 from src.dependencies import get_decision_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["decisions"])
@@ -34,11 +35,12 @@ async def get_decision(
 async def get_all_decision(
     decision_service: DecisionService = Depends(get_decision_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[DecisionOutgoingDto]:
+) -> PageDto[DecisionOutgoingDto]:
     try:
-        decisions: list[DecisionOutgoingDto] = await decision_service.get_all(
-            session, odata_query=filter
+        decisions: PageDto[DecisionOutgoingDto] = await decision_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return decisions
     except Exception as e:
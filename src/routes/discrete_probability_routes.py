@@ -1,6 +1,6 @@
 import uuid
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.dtos.discrete_probability_dtos import (
@@ -10,7 +10,9 @@ from src.dtos.discrete_probability_dtos import (
 from src.services.discrete_probability_service import DiscreteProbabilityService
 from src.dependencies import get_discrete_probability_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
+from src.utils.ndjson_stream import accepts_ndjson, ndjson_response
 
 
 router = APIRouter(tags=["discrete_probabilities"])
@@ -37,11 +39,25 @@ async def get_discrete_probability(
 async def get_all_discrete_probability(
     discrete_probability_service: DiscreteProbabilityService = Depends(get_discrete_probability_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    accept: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_db),
-) -> list[DiscreteProbabilityOutgoingDto]:
+) -> PageDto[DiscreteProbabilityOutgoingDto]:
+    """
+    Returns a page of discrete probabilities. With the header "Accept: application/x-ndjson" all
+    discrete probabilities are instead streamed as newline delimited json, one per line, and the paging parameters are ignored.
+    """
+    if accepts_ndjson(accept):
+        return ndjson_response(  # type: ignore
+            lambda stream_session: discrete_probability_service.stream(
+                stream_session, odata_query=filter
+            )
+        )
     try:
-        discrete_probabilities: list[DiscreteProbabilityOutgoingDto] = await discrete_probability_service.get_all(
-            session, odata_query=filter
+        discrete_probabilities: PageDto[
+            DiscreteProbabilityOutgoingDto
+        ] = await discrete_probability_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return discrete_probabilities
     except Exception as e:
@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional
+from typing import Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,9 +8,13 @@ from src.dtos.edge_dtos import (
     EdgeOutgoingDto,
 )
 from src.services.edge_service import EdgeService
+from src.domain.indexed_graph import EdgeCycleError
 from src.dependencies import get_edge_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request, get_field_selection
+from src.dtos.page_dtos import PageDto, SelectedFieldsPageDto, PageRequestDto
+from src.utils.field_selection import FieldSelection
+from src.services.edge_service import EDGE_FIELDS
 
 
 router = APIRouter(tags=["edges"])
@@ -26,6 +30,8 @@ async def create_edges(
         result = list(await edge_service.create(session, dtos))
         await session.commit()
         return result
+    except EdgeCycleError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -52,11 +58,15 @@ async def get_edge(
 async def get_all_edge(
     edge_service: EdgeService = Depends(get_edge_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(EDGE_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[EdgeOutgoingDto]:
+) -> Union[PageDto[EdgeOutgoingDto], SelectedFieldsPageDto]:
     try:
-        edges: list[EdgeOutgoingDto] = await edge_service.get_all(session, odata_query=filter)
-        return edges
+        edges: PageDto[EdgeOutgoingDto] = await edge_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit, selection=selection
+        )
+        return selection.to_response(edges)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -95,5 +105,7 @@ async def update_edges(
         result = list(await edge_service.update(session, dtos))
         await session.commit()
         return result
+    except EdgeCycleError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,6 +1,6 @@
 import uuid
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.dtos.issue_dtos import IssueIncomingDto, IssueOutgoingDto
@@ -10,7 +10,11 @@ from src.services.user_service import get_current_user
 from src.dtos.user_dtos import UserIncomingDto
 from src.models.filters.issues_filter import IssueFilter
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request, get_field_selection
+from src.dtos.page_dtos import PageDto, SelectedFieldsPageDto, PageRequestDto
+from src.utils.field_selection import FieldSelection
+from src.services.issue_service import ISSUE_FIELDS
+from src.utils.ndjson_stream import accepts_ndjson, ndjson_response
 
 
 router = APIRouter(tags=["issues"])
@@ -57,11 +61,24 @@ async def get_issue(
 async def get_all_issue(
     issue_service: IssueService = Depends(get_issue_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(ISSUE_FIELDS)),
+    accept: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_db),
-) -> list[IssueOutgoingDto]:
+) -> Union[PageDto[IssueOutgoingDto], SelectedFieldsPageDto]:
+    """
+    Returns a page of issues. With the header "Accept: application/x-ndjson" all issues are instead
+    streamed as newline delimited json, one issue per line, and the paging parameters are ignored.
+    """
+    if accepts_ndjson(accept):
+        return ndjson_response(  # type: ignore
+            lambda stream_session: issue_service.stream(stream_session, odata_query=filter)
+        )
     try:
-        issues: list[IssueOutgoingDto] = await issue_service.get_all(session, odata_query=filter)
-        return issues
+        issues: PageDto[IssueOutgoingDto] = await issue_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit, selection=selection
+        )
+        return selection.to_response(issues)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -71,13 +88,20 @@ async def get_all_issues_from_project(
     project_id: uuid.UUID,
     issue_service: IssueService = Depends(get_issue_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(ISSUE_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[IssueOutgoingDto]:
+) -> Union[PageDto[IssueOutgoingDto], SelectedFieldsPageDto]:
     try:
-        issues: list[IssueOutgoingDto] = await issue_service.get_all(
-            session, IssueFilter(project_ids=[project_id]), odata_query=filter
+        issues: PageDto[IssueOutgoingDto] = await issue_service.get_all(
+            session,
+            IssueFilter(project_ids=[project_id]),
+            odata_query=filter,
+            cursor=page.cursor,
+            take=page.limit,
+            selection=selection,
         )
-        return issues
+        return selection.to_response(issues)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -87,15 +111,20 @@ async def get_all_issues_from_scenario(
     scenario_id: uuid.UUID,
     issue_service: IssueService = Depends(get_issue_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(ISSUE_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[IssueOutgoingDto]:
+) -> Union[PageDto[IssueOutgoingDto], SelectedFieldsPageDto]:
     try:
-        issues: list[IssueOutgoingDto] = await issue_service.get_all(
+        issues: PageDto[IssueOutgoingDto] = await issue_service.get_all(
             session,
             IssueFilter(scenario_ids=[scenario_id]),
             odata_query=filter,
+            cursor=page.cursor,
+            take=page.limit,
+            selection=selection,
         )
-        return issues
+        return selection.to_response(issues)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional
+from typing import Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +8,10 @@ from src.services.node_service import NodeService
 from src.dependencies import get_node_service
 from src.models.filters.node_filter import NodeFilter
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request, get_field_selection
+from src.dtos.page_dtos import PageDto, SelectedFieldsPageDto, PageRequestDto
+from src.utils.field_selection import FieldSelection
+from src.services.node_service import NODE_FIELDS
 
 
 router = APIRouter(tags=["nodes"])
@@ -35,11 +38,15 @@ async def get_node(
 async def get_all_node(
     node_service: NodeService = Depends(get_node_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(NODE_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[NodeOutgoingDto]:
+) -> Union[PageDto[NodeOutgoingDto], SelectedFieldsPageDto]:
     try:
-        nodes: list[NodeOutgoingDto] = await node_service.get_all(session, odata_query=filter)
-        return nodes
+        nodes: PageDto[NodeOutgoingDto] = await node_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit, selection=selection
+        )
+        return selection.to_response(nodes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -49,13 +56,20 @@ async def get_all_nodes_from_project(
     project_id: uuid.UUID,
     node_service: NodeService = Depends(get_node_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(NODE_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[NodeOutgoingDto]:
+) -> Union[PageDto[NodeOutgoingDto], SelectedFieldsPageDto]:
     try:
-        nodes: list[NodeOutgoingDto] = await node_service.get_all(
-            session, NodeFilter(project_ids=[project_id]), odata_query=filter
+        nodes: PageDto[NodeOutgoingDto] = await node_service.get_all(
+            session,
+            NodeFilter(project_ids=[project_id]),
+            odata_query=filter,
+            cursor=page.cursor,
+            take=page.limit,
+            selection=selection,
         )
-        return nodes
+        return selection.to_response(nodes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -65,13 +79,20 @@ async def get_all_nodes_from_scenario(
     scenario_id: uuid.UUID,
     node_service: NodeService = Depends(get_node_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(NODE_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[NodeOutgoingDto]:
+) -> Union[PageDto[NodeOutgoingDto], SelectedFieldsPageDto]:
     try:
-        nodes: list[NodeOutgoingDto] = await node_service.get_all(
-            session, NodeFilter(scenario_ids=[scenario_id]), odata_query=filter
+        nodes: PageDto[NodeOutgoingDto] = await node_service.get_all(
+            session,
+            NodeFilter(scenario_ids=[scenario_id]),
+            odata_query=filter,
+            cursor=page.cursor,
+            take=page.limit,
+            selection=selection,
         )
-        return nodes
+        return selection.to_response(nodes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -7,7 +7,8 @@ from src.dtos.node_style_dtos import NodeStyleIncomingDto, NodeStyleOutgoingDto
 from src.services.node_style_service import NodeStyleService
 from src.dependencies import get_node_style_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["node_styles"])
@@ -34,11 +35,12 @@ async def get_node_style(
 async def get_all_node_style(
     node_style_service: NodeStyleService = Depends(get_node_style_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[NodeStyleOutgoingDto]:
+) -> PageDto[NodeStyleOutgoingDto]:
     try:
-        node_styles: list[NodeStyleOutgoingDto] = await node_style_service.get_all(
-            session, odata_query=filter
+        node_styles: PageDto[NodeStyleOutgoingDto] = await node_style_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return node_styles
     except Exception as e:
@@ -9,7 +9,8 @@ from src.dependencies import get_objective_service
 from src.services.user_service import get_current_user
 from src.dtos.user_dtos import UserIncomingDto
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["objectives"])
@@ -51,11 +52,12 @@ async def get_objective(
 async def get_all_objective(
     objective_service: ObjectiveService = Depends(get_objective_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[ObjectiveOutgoingDto]:
+) -> PageDto[ObjectiveOutgoingDto]:
     try:
-        objectives: list[ObjectiveOutgoingDto] = await objective_service.get_all(
-            session, odata_query=filter
+        objectives: PageDto[ObjectiveOutgoingDto] = await objective_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return objectives
     except Exception as e:
@@ -12,7 +12,8 @@ from src.dependencies import get_opportunity_service
 from src.services.user_service import get_current_user
 from src.dtos.user_dtos import UserIncomingDto
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["opportunities"])
@@ -54,11 +55,12 @@ async def get_opportunity(
 async def get_all_opportunity(
     opportunity_service: OpportunityService = Depends(get_opportunity_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[OpportunityOutgoingDto]:
+) -> PageDto[OpportunityOutgoingDto]:
     try:
-        opportunities: list[OpportunityOutgoingDto] = await opportunity_service.get_all(
-            session, odata_query=filter
+        opportunities: PageDto[OpportunityOutgoingDto] = await opportunity_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return opportunities
     except Exception as e:
@@ -7,7 +7,8 @@ from src.dtos.option_dtos import OptionIncomingDto, OptionOutgoingDto
 from src.services.option_service import OptionService
 from src.dependencies import get_option_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["options"])
@@ -48,10 +49,13 @@ async def get_option(
 async def get_all_option(
     option_service: OptionService = Depends(get_option_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[OptionOutgoingDto]:
+) -> PageDto[OptionOutgoingDto]:
     try:
-        options: list[OptionOutgoingDto] = await option_service.get_all(session, odata_query=filter)
+        options: PageDto[OptionOutgoingDto] = await option_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
+        )
         return options
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
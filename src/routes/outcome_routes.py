@@ -7,7 +7,8 @@ from src.dtos.outcome_dtos import OutcomeIncomingDto, OutcomeOutgoingDto
 from src.services.outcome_service import OutcomeService
 from src.dependencies import get_outcome_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["outcomes"])
@@ -48,11 +49,12 @@ async def get_outcome(
 async def get_all_outcome(
     outcome_service: OutcomeService = Depends(get_outcome_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[OutcomeOutgoingDto]:
+) -> PageDto[OutcomeOutgoingDto]:
     try:
-        outcomes: list[OutcomeOutgoingDto] = await outcome_service.get_all(
-            session, odata_query=filter
+        outcomes: PageDto[OutcomeOutgoingDto] = await outcome_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return outcomes
     except Exception as e:
@@ -10,7 +10,8 @@ from src.services.user_service import get_current_user
 from src.services.project_role_service import ProjectRoleService
 from src.dependencies import get_project_role_service
 from src.dtos.user_dtos import UserIncomingDto
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["project-roles"])
@@ -19,10 +20,13 @@ router = APIRouter(tags=["project-roles"])
 @router.get("/project-roles/")
 async def get_all_project_roles(
     project_role_service: ProjectRoleService = Depends(get_project_role_service),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[ProjectRoleOutgoingDto]:
+) -> PageDto[ProjectRoleOutgoingDto]:
     try:
-        project_roles: list[ProjectRoleOutgoingDto] = await project_role_service.get_all(session)
+        project_roles: PageDto[ProjectRoleOutgoingDto] = await project_role_service.get_all(
+            session, cursor=page.cursor, take=page.limit
+        )
         return project_roles
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
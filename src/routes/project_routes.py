@@ -1,6 +1,6 @@
 import uuid
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.dtos.project_dtos import (
@@ -14,7 +14,11 @@ from src.dependencies import get_project_service
 from src.services.user_service import get_current_user
 from src.dtos.user_dtos import UserIncomingDto
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request, get_field_selection
+from src.dtos.page_dtos import PageDto, SelectedFieldsPageDto, PageRequestDto
+from src.utils.field_selection import FieldSelection
+from src.services.project_service import PROJECT_FIELDS
+from src.utils.ndjson_stream import accepts_ndjson, ndjson_response
 
 
 router = APIRouter(tags=["projects"])
@@ -80,11 +84,23 @@ async def get_populated_project(
 async def get_all_populated_project(
     project_service: ProjectService = Depends(get_project_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    accept: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_db),
-) -> list[PopulatedProjectDto]:
+) -> PageDto[PopulatedProjectDto]:
+    """
+    Returns a page of populated projects. With the header "Accept: application/x-ndjson" all projects
+    are instead streamed as newline delimited json, one project per line, and the paging parameters are ignored.
+    """
+    if accepts_ndjson(accept):
+        return ndjson_response(  # type: ignore
+            lambda stream_session: project_service.stream_populated_projects(
+                stream_session, odata_query=filter
+            )
+        )
     try:
-        projects: list[PopulatedProjectDto] = await project_service.get_all_populated_projects(
-            session, odata_query=filter
+        projects: PageDto[PopulatedProjectDto] = await project_service.get_all_populated_projects(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return projects
     except Exception as e:
@@ -96,13 +112,20 @@ async def get_all_project(
     project_service: ProjectService = Depends(get_project_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
     current_user: UserIncomingDto = Depends(get_current_user),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(PROJECT_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[ProjectOutgoingDto]:
+) -> Union[PageDto[ProjectOutgoingDto], SelectedFieldsPageDto]:
     try:
-        projects: list[ProjectOutgoingDto] = await project_service.get_all(
-            session, odata_query=filter, user_dto=current_user
+        projects: PageDto[ProjectOutgoingDto] = await project_service.get_all(
+            session,
+            odata_query=filter,
+            user_dto=current_user,
+            cursor=page.cursor,
+            take=page.limit,
+            selection=selection,
         )
-        return projects
+        return selection.to_response(projects)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
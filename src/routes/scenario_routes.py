@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional
+from typing import Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,7 +15,10 @@ from src.services.user_service import get_current_user
 from src.dtos.user_dtos import UserIncomingDto
 from src.models.filters.scenario_filter import ScenarioFilter
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request, get_field_selection
+from src.dtos.page_dtos import PageDto, SelectedFieldsPageDto, PageRequestDto
+from src.utils.field_selection import FieldSelection
+from src.services.scenario_service import SCENARIO_FIELDS
 
 
 router = APIRouter(tags=["scenarios"])
@@ -78,13 +81,15 @@ async def get_scenario_populated(
 async def get_all_scenario(
     scenario_service: ScenarioService = Depends(get_scenario_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(SCENARIO_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[ScenarioOutgoingDto]:
+) -> Union[PageDto[ScenarioOutgoingDto], SelectedFieldsPageDto]:
     try:
-        scenarios: list[ScenarioOutgoingDto] = await scenario_service.get_all(
-            session, odata_query=filter
+        scenarios: PageDto[ScenarioOutgoingDto] = await scenario_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit, selection=selection
         )
-        return scenarios
+        return selection.to_response(scenarios)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -93,12 +98,13 @@ async def get_all_scenario(
 async def get_all_scenarios_populated(
     scenario_service: ScenarioService = Depends(get_scenario_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[PopulatedScenarioDto]:
+) -> PageDto[PopulatedScenarioDto]:
     try:
         # raise Exception("test")
-        scenarios: list[PopulatedScenarioDto] = await scenario_service.get_all_populated(
-            session, odata_query=filter
+        scenarios: PageDto[PopulatedScenarioDto] = await scenario_service.get_all_populated(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return scenarios
     except Exception as e:
@@ -110,15 +116,20 @@ async def get_all_scenario_from_project(
     project_id: uuid.UUID,
     scenario_service: ScenarioService = Depends(get_scenario_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
+    selection: FieldSelection = Depends(get_field_selection(SCENARIO_FIELDS)),
     session: AsyncSession = Depends(get_db),
-) -> list[ScenarioOutgoingDto]:
+) -> Union[PageDto[ScenarioOutgoingDto], SelectedFieldsPageDto]:
     try:
-        scenarios: list[ScenarioOutgoingDto] = await scenario_service.get_all(
+        scenarios: PageDto[ScenarioOutgoingDto] = await scenario_service.get_all(
             session,
             ScenarioFilter(project_ids=[project_id]),
             odata_query=filter,
+            cursor=page.cursor,
+            take=page.limit,
+            selection=selection,
         )
-        return scenarios
+        return selection.to_response(scenarios)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -128,13 +139,16 @@ async def get_all_scenarios_populated_from_project(
     project_id: uuid.UUID,
     scenario_service: ScenarioService = Depends(get_scenario_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[PopulatedScenarioDto]:
+) -> PageDto[PopulatedScenarioDto]:
     try:
-        scenarios: list[PopulatedScenarioDto] = await scenario_service.get_all_populated(
+        scenarios: PageDto[PopulatedScenarioDto] = await scenario_service.get_all_populated(
             session,
             ScenarioFilter(project_ids=[project_id]),
             odata_query=filter,
+            cursor=page.cursor,
+            take=page.limit,
         )
         return scenarios
     except Exception as e:
@@ -1,20 +1,85 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from src.services.solver_service import SolverService
+import asyncio
+from typing import Any, Awaitable, TypeVar
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from src.services.solver_service import SolverService, SolverBatchTooLargeError
+from src.services.solver_pool import SolverQueueFullError, SolverTimeoutError
 from src.dependencies import get_solver_service
 from src.services.user_service import get_current_user
 from src.dtos.user_dtos import UserIncomingDto
 
 router = APIRouter(tags=["solvers"])
 
+T = TypeVar("T")
+
+# seconds between checks for a disconnected client
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    """
+    Awaits the solve while polling the connection, and cancels it if the client disconnects.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                raise HTTPException(status_code=499, detail="Client disconnected")
+    finally:
+        if not task.done():
+            task.cancel()
+
 
 @router.get("/solvers/scenario/{scenario_id}")
 async def get_optimal_decisions_for_scenario(
     scenario_id: uuid.UUID,
+    request: Request,
+    solver_service: SolverService = Depends(get_solver_service),
+    current_user: UserIncomingDto = Depends(get_current_user),
+):
+    try:
+        return await cancel_on_disconnect(
+            request, solver_service.find_optimal_decision_pyagrum(scenario_id)
+        )
+    except HTTPException as e:
+        raise e
+    except SolverQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except SolverTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/solvers/scenarios")
+async def get_optimal_decisions_for_scenarios(
+    scenario_ids: list[uuid.UUID],
     solver_service: SolverService = Depends(get_solver_service),
     current_user: UserIncomingDto = Depends(get_current_user),
 ):
+    """
+    Solves the scenarios and streams a ScenarioSolutionDto per scenario as json lines,
+    in the order the solves finish.
+    """
     try:
-        return await solver_service.find_optimal_decision_pyagrum(scenario_id)
+        solutions = await solver_service.find_optimal_decisions_pyagrum(scenario_ids)
+        return StreamingResponse(
+            (x.model_dump_json() + "\n" async for x in solutions),
+            media_type="application/x-ndjson",
+        )
+    except SolverBatchTooLargeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/solvers/cache")
+async def get_solver_cache_statistics(
+    solver_service: SolverService = Depends(get_solver_service),
+) -> dict[str, Any]:
+    return solver_service.get_cache_statistics()
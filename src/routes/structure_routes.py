@@ -1,9 +1,18 @@
 import uuid
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from src.services.structure_service import StructureService
+from src.services.decision_tree.decision_tree_expansion import InvalidTreePathError
+from src.services.decision_tree.decision_tree_size import DecisionTreeTooLargeError
 from src.dependencies import get_structure_service
-from src.dtos.decision_tree_dtos import DecisionTreeDTO, PartialOrderDTO
+from src.constants import DecisionTreeMode, SwaggerDocumentationConstants
+from src.dtos.decision_tree_dtos import (
+    DecisionTreeDTO,
+    PartialOrderDTO,
+    CompressedDecisionTreeDTO,
+    DecisionTreeSizeDTO,
+)
 
 
 router = APIRouter(tags=["structure"])
@@ -11,10 +20,48 @@ router = APIRouter(tags=["structure"])
 @router.get("/structure/{scenario_id}/decision_tree")
 async def get_decision_tree(
     scenario_id: uuid.UUID,
+    response: Response,
+    path: list[uuid.UUID] = Query([], description=SwaggerDocumentationConstants.TREE_PATH_DOC),
+    depth: Optional[int] = Query(None, ge=0, description=SwaggerDocumentationConstants.TREE_DEPTH_DOC),
+    compressed: bool = Query(False, description=SwaggerDocumentationConstants.TREE_COMPRESSED_DOC),
+    roll_back: bool = Query(False, description=SwaggerDocumentationConstants.TREE_ROLL_BACK_DOC),
     structure_service: StructureService = Depends(get_structure_service)
-) -> Optional[DecisionTreeDTO]:
+) -> Optional[Union[DecisionTreeDTO, CompressedDecisionTreeDTO]]:
     try:
-        return await structure_service.create_decision_tree_dtos(scenario_id)
+        # the size is checked before anything is built, a tree above the limits is refused
+        # or returned in the configured mode, which is given in the X-Decision-Tree-Mode header
+        size = await structure_service.get_decision_tree_size(scenario_id, path, depth)
+        mode, depth = size.get_mode(compressed, roll_back)
+        headers = {"X-Decision-Tree-Mode": mode.value}
+        if mode == DecisionTreeMode.COMPRESSED:
+            response.headers.update(headers)
+            return await structure_service.create_compressed_decision_tree(
+                scenario_id, path, depth, roll_back
+            )
+        chunks = await structure_service.stream_decision_tree(scenario_id, path, depth, roll_back)
+        # the tree is written to the response while it is walked, starlette iterates it in a thread
+        return StreamingResponse(chunks, media_type="application/json", headers=headers)  # type: ignore
+    except InvalidTreePathError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DecisionTreeTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/structure/{scenario_id}/decision_tree/size")
+async def get_decision_tree_size(
+    scenario_id: uuid.UUID,
+    path: list[uuid.UUID] = Query([], description=SwaggerDocumentationConstants.TREE_PATH_DOC),
+    depth: Optional[int] = Query(None, ge=0, description=SwaggerDocumentationConstants.TREE_DEPTH_DOC),
+    compressed: bool = Query(False, description=SwaggerDocumentationConstants.TREE_SIZE_COMPRESSED_DOC),
+    roll_back: bool = Query(False, description=SwaggerDocumentationConstants.TREE_ROLL_BACK_DOC),
+    structure_service: StructureService = Depends(get_structure_service)
+) -> DecisionTreeSizeDTO:
+    try:
+        size = await structure_service.get_decision_tree_size(scenario_id, path, depth)
+        return size.to_decision_tree_size_dto(compressed, roll_back)
+    except InvalidTreePathError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -27,3 +74,9 @@ async def get_partial_order(
         return await structure_service.create_partial_order(scenario_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/structure/cache")
+async def get_structure_cache_statistics(
+    structure_service: StructureService = Depends(get_structure_service)
+) -> dict[str, Any]:
+    return structure_service.get_cache_statistics()
@@ -10,7 +10,8 @@ from src.dtos.uncertainty_dtos import (
 from src.services.uncertainty_service import UncertaintyService
 from src.dependencies import get_uncertainty_service
 from src.constants import SwaggerDocumentationConstants
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["uncertainties"])
@@ -37,11 +38,12 @@ async def get_uncertainty(
 async def get_all_uncertainty(
     uncertainty_service: UncertaintyService = Depends(get_uncertainty_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[UncertaintyOutgoingDto]:
+) -> PageDto[UncertaintyOutgoingDto]:
     try:
-        uncertainties: list[UncertaintyOutgoingDto] = await uncertainty_service.get_all(
-            session, odata_query=filter
+        uncertainties: PageDto[UncertaintyOutgoingDto] = await uncertainty_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return uncertainties
     except Exception as e:
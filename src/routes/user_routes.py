@@ -8,7 +8,8 @@ from src.services.user_service import UserService
 from src.constants import SwaggerDocumentationConstants
 from src.dtos.user_dtos import UserOutgoingDto, UserIncomingDto
 from src.dependencies import get_user_service
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["user"])
@@ -26,10 +27,13 @@ async def get_me(token: str = Depends(verify_token)) -> UserIncomingDto:
 async def get_users(
     user_service: UserService = Depends(get_user_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[UserOutgoingDto]:
+) -> PageDto[UserOutgoingDto]:
     try:
-        return await user_service.get_all(session, odata_query=filter)
+        return await user_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
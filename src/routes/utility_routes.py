@@ -7,7 +7,8 @@ from src.dtos.utility_dtos import UtilityIncomingDto, UtilityOutgoingDto
 from src.services.utility_service import UtilityService
 from src.constants import SwaggerDocumentationConstants
 from src.dependencies import get_utility_service
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["utilities"])
@@ -34,11 +35,12 @@ async def get_utility(
 async def get_all_utility(
     utility_service: UtilityService = Depends(get_utility_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[UtilityOutgoingDto]:
+) -> PageDto[UtilityOutgoingDto]:
     try:
-        utilities: list[UtilityOutgoingDto] = await utility_service.get_all(
-            session, odata_query=filter
+        utilities: PageDto[UtilityOutgoingDto] = await utility_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return utilities
     except Exception as e:
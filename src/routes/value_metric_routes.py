@@ -10,7 +10,8 @@ from src.dtos.value_metric_dtos import (
 from src.services.value_metric_service import ValueMetricService
 from src.constants import SwaggerDocumentationConstants
 from src.dependencies import get_value_metric_service
-from src.dependencies import get_db
+from src.dependencies import get_db, get_page_request
+from src.dtos.page_dtos import PageDto, PageRequestDto
 
 
 router = APIRouter(tags=["value-metrics"])
@@ -37,11 +38,12 @@ async def get_value_metric(
 async def get_all_value_metric(
     value_metric_service: ValueMetricService = Depends(get_value_metric_service),
     filter: Optional[str] = Query(None, description=SwaggerDocumentationConstants.FILTER_DOC),
+    page: PageRequestDto = Depends(get_page_request),
     session: AsyncSession = Depends(get_db),
-) -> list[ValueMetricOutgoingDto]:
+) -> PageDto[ValueMetricOutgoingDto]:
     try:
-        value_metrics: list[ValueMetricOutgoingDto] = await value_metric_service.get_all(
-            session, odata_query=filter
+        value_metrics: PageDto[ValueMetricOutgoingDto] = await value_metric_service.get_all(
+            session, odata_query=filter, cursor=page.cursor, take=page.limit
         )
         return value_metrics
     except Exception as e:
@@ -2,6 +2,8 @@ import uuid
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.decision import Decision
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.decision_dtos import (
     DecisionIncomingDto,
     DecisionOutgoingDto,
@@ -40,10 +42,14 @@ class DecisionService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[DecisionOutgoingDto]:
-        decisions: list[Decision] = await DecisionRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[DecisionOutgoingDto]:
+        decisions, next_cursor = await DecisionRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = DecisionMapper.to_outgoing_dtos(decisions)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -0,0 +1,180 @@
+import uuid
+import numpy as np
+from numpy.typing import NDArray
+from typing import Optional
+from src.constants import Type
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.decision_tree_dtos import (
+    CompressedDecisionTreeDTO,
+    CompressedTreeNodeDto,
+    EndPointNodeDto,
+)
+from src.services.decision_tree.decision_tree_expansion import (
+    get_branch_ids,
+    get_probability_index,
+    validate_tree_path,
+)
+
+
+class CompressedDecisionTree:
+    """
+    A subtree of the decision tree of a partial order, with identical subtrees stored once.
+
+    The tree below a node only differs from the tree below another node of the same issue by
+    the probabilities, which depend on the options and outcomes on the path that are parents of
+    the uncertainties at or below the node. Restricted to these relevant branches, the path is
+    the key of the subtree, so the tree is built level by level with one tree node per key and
+    a model where the later issues do not depend on the earlier ones grows linearly instead of
+    exponentially. Path and depth select the subtree as for DecisionTreeExpansion.
+    """
+
+    def __init__(
+        self,
+        scenario_id: uuid.UUID,
+        partial_order: list[IssueOutgoingDto],
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+    ) -> None:
+        self.scenario_id = scenario_id
+        self.issues = partial_order
+        self.branch_ids: list[list[uuid.UUID]] = [get_branch_ids(x) for x in partial_order]
+        self.probability_indexes = [get_probability_index(x, self.branch_ids) for x in partial_order]
+        self.path = path or []
+        validate_tree_path(self.issues, self.branch_ids, self.path)
+
+        # relevant_branches[level] holds the parents of the uncertainties from level down
+        self.relevant_branches: list[frozenset[uuid.UUID]] = [frozenset()]
+        for probability_index in reversed(self.probability_indexes):
+            parent_ids = probability_index.parent_ids if probability_index else frozenset()
+            self.relevant_branches.insert(0, self.relevant_branches[0] | parent_ids)
+
+        start_depth = len(self.path)
+        end_depth = len(self.issues)
+        if depth is not None:
+            end_depth = min(start_depth + depth, end_depth)
+        self.start_depth = start_depth
+        self.end_depth = end_depth
+        self.tree_nodes: list[CompressedTreeNodeDto] = []
+        self.keys: list[frozenset[uuid.UUID]] = []
+        # the tree nodes are added level by level, level start_depth + i starts at level_offsets[i]
+        self.level_offsets = [0]
+        root_key = self.relevant_branches[start_depth].intersection(self.path)
+        level_nodes = {root_key: self.add_tree_node(start_depth, root_key)}
+        for level in range(start_depth, end_depth):
+            self.level_offsets.append(len(self.tree_nodes))
+            relevant_branches = self.relevant_branches[level + 1]
+            next_level_nodes: dict[frozenset[uuid.UUID], int] = {}
+            for key, tree_node in level_nodes.items():
+                children: list[int] = []
+                for branch_id in self.branch_ids[level]:
+                    child_key = key & relevant_branches
+                    if branch_id in relevant_branches:
+                        child_key = child_key | {branch_id}
+                    if child_key not in next_level_nodes:
+                        next_level_nodes[child_key] = self.add_tree_node(level + 1, child_key)
+                    children.append(next_level_nodes[child_key])
+                self.tree_nodes[tree_node].children = children or None
+            level_nodes = next_level_nodes
+        self.level_offsets.append(len(self.tree_nodes))
+
+    def add_tree_node(self, level: int, key: frozenset[uuid.UUID]) -> int:
+        probability_index = self.probability_indexes[level] if level < len(self.issues) else None
+        self.tree_nodes.append(CompressedTreeNodeDto(
+            issue_index=level,
+            probabilities=probability_index.get(key) if probability_index else None,
+        ))
+        self.keys.append(key)
+        return len(self.tree_nodes) - 1
+
+    def get_level_range(self, level: int) -> tuple[int, int]:
+        """The start and end of the tree nodes of a level in tree_nodes."""
+        return (
+            self.level_offsets[level - self.start_depth],
+            self.level_offsets[level - self.start_depth + 1],
+        )
+
+    def get_children_table(self, level: int) -> NDArray[np.intp]:
+        """The children of the tree nodes of a level, one row per tree node of the level."""
+        start, end = self.get_level_range(level)
+        table = np.full((end - start, len(self.branch_ids[level])), -1, dtype=np.intp)
+        for row, tree_node in enumerate(self.tree_nodes[start:end]):
+            if tree_node.children is not None:
+                table[row] = tree_node.children
+        return table
+
+    def get_branch_probabilities(self, level: int) -> NDArray[np.float64]:
+        """
+        The probability of every outcome of the uncertainty of a level, one row per tree node.
+        Rows are normalized to sum to 1, so the expected values agree with the solver, and the
+        outcomes are equally likely when the uncertainty has no discrete probabilities or the
+        probabilities of a row sum to 0.
+        """
+        start, end = self.get_level_range(level)
+        outcome_ids = self.branch_ids[level]
+        probability_index = self.probability_indexes[level]
+        if probability_index is None:
+            return np.full((end - start, len(outcome_ids)), 1 / len(outcome_ids))
+        distributions = [probability_index.get_distribution(x) for x in self.keys[start:end]]
+        probabilities = np.array(
+            [[distribution.get(x, 0.0) for x in outcome_ids] for distribution in distributions],
+            dtype=np.float64,
+        ).reshape(end - start, len(outcome_ids))
+        sums = probabilities.sum(axis=1, keepdims=True)
+        return np.where(sums > 0, probabilities / np.where(sums > 0, sums, 1), 1 / len(outcome_ids))
+
+    def roll_back(self) -> None:
+        """
+        Sets the expected value of every tree node by rolling back from the endpoints. The value of
+        a branch is the utility of its option or outcome plus the expected value of its child.
+        Uncertainties take the expectation over their outcomes and decisions the best option, which
+        is the optimal branch. Children are added after their parents, so one pass over the levels
+        from the bottom up is enough, and each level is computed with array operations.
+        """
+        if self.end_depth < len(self.issues):
+            raise ValueError("Only a decision tree expanded to the endpoints can be rolled back")
+
+        values = np.zeros(len(self.tree_nodes), dtype=np.float64)
+        for level in reversed(range(self.start_depth, self.end_depth)):
+            start, end = self.get_level_range(level)
+            issue = self.issues[level]
+            branch_ids = self.branch_ids[level]
+            if len(branch_ids) == 0:
+                continue
+            if issue.type == Type.DECISION:
+                utilities = [x.utility for x in issue.decision.options]  # type: ignore
+            else:
+                utilities = [x.utility for x in issue.uncertainty.outcomes]  # type: ignore
+            branch_values = values[self.get_children_table(level)] + np.array(utilities)
+            if issue.type == Type.DECISION:
+                optimal_branches = branch_values.argmax(axis=1)
+                values[start:end] = branch_values[np.arange(end - start), optimal_branches]
+                for tree_node, branch in zip(self.tree_nodes[start:end], optimal_branches):
+                    tree_node.optimal_branch_id = branch_ids[branch]
+            else:
+                probabilities = self.get_branch_probabilities(level)
+                values[start:end] = (branch_values * probabilities).sum(axis=1)
+
+        for tree_node, value in zip(self.tree_nodes, values.tolist()):
+            tree_node.expected_value = value
+
+    def to_compressed_decision_tree_dto(
+        self, depth: Optional[int] = None
+    ) -> Optional[CompressedDecisionTreeDTO]:
+        """
+        The levels are stored in order, so the tree limited to depth is the tree nodes of its levels
+        with the children of the last level left out.
+        """
+        if not self.issues:
+            return None
+        tree_nodes = self.tree_nodes
+        if depth is not None and self.start_depth + depth < self.end_depth:
+            start, end = self.level_offsets[depth], self.level_offsets[depth + 1]
+            tree_nodes = tree_nodes[:start] + [
+                x.model_copy(update={"children": None}) for x in tree_nodes[start:end]
+            ]
+        return CompressedDecisionTreeDTO(
+            path=self.path,
+            issues=self.issues,
+            tree_nodes=tree_nodes,
+            endpoint=EndPointNodeDto(scenario_id=self.scenario_id),
+        )
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+import uuid
+import numpy as np
+from numpy.typing import NDArray
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+from pydantic import TypeAdapter
+from src.constants import Type
+from src.seed_database import GenerateUuid
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.decision_tree_dtos import EndPointNodeDto, DecisionTreeDTO, TreeNodeDto, ProbabilityDto
+from src.services.decision_tree.probability_index import ProbabilityIndex
+
+if TYPE_CHECKING:
+    from src.services.decision_tree.compressed_decision_tree import CompressedDecisionTree
+
+
+probabilities_adapter = TypeAdapter(list[ProbabilityDto])
+
+
+class InvalidTreePathError(ValueError):
+    """Raised when a path does not follow the options and outcomes of the partial order."""
+
+
+def get_branch_ids(issue: IssueOutgoingDto) -> list[uuid.UUID]:
+    """The options or outcomes leading out of the tree nodes of an issue."""
+    if issue.type == Type.DECISION:
+        return [x.id for x in issue.decision.options] if issue.decision else []
+    if issue.type == Type.UNCERTAINTY:
+        return [x.id for x in issue.uncertainty.outcomes] if issue.uncertainty else []
+    return []
+
+
+def get_probability_index(
+    issue: IssueOutgoingDto, branch_ids: list[list[uuid.UUID]]
+) -> Optional[ProbabilityIndex]:
+    """branch_ids holds the options or outcomes of every issue of the partial order."""
+    if (issue.type != Type.UNCERTAINTY or issue.uncertainty is None
+        or len(issue.uncertainty.discrete_probabilities) == 0):
+        return None
+    return ProbabilityIndex(issue, branch_ids)
+
+
+def validate_tree_path(
+    issues: list[IssueOutgoingDto], branch_ids: list[list[uuid.UUID]], path: list[uuid.UUID]
+) -> None:
+    if len(path) > len(issues):
+        raise InvalidTreePathError(
+            f"Path has {len(path)} branches, but the decision tree is {len(issues)} issues deep"
+        )
+    for level, branch_id in enumerate(path):
+        if branch_id not in branch_ids[level]:
+            raise InvalidTreePathError(
+                f"{branch_id} is not an option or outcome of issue {issues[level].id} "
+                f"at position {level} of the partial order"
+            )
+
+
+class DecisionTreeExpansion:
+    """
+    A subtree of the decision tree of a partial order, expanded synchronously into flat arrays.
+
+    The subtree starts at the tree node reached by following path, a list of option and outcome
+    ids from the root, and is expanded depth levels down, or to the endpoints when depth is None.
+    Every node on a level of the tree belongs to the same issue of the partial order and has the
+    same number of branches, so the nodes are stored level by level and the children of a node
+    are contiguous on the level below. The level after the last issue holds the endpoints.
+    For every node the arrays hold its parent index (-1 for the subtree root), the index of the
+    branch leading to it among the options or outcomes of its parent, and its depth in the full
+    tree, which is also the index of its issue in the partial order.
+    When a rolled back compressed tree of the same subtree is given, the expected values and
+    optimal branches are read from the compressed tree node of every node.
+    """
+
+    def __init__(
+        self,
+        scenario_id: uuid.UUID,
+        partial_order: list[IssueOutgoingDto],
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+        rolled_back: Optional[CompressedDecisionTree] = None,
+    ) -> None:
+        self.scenario_id = scenario_id
+        self.issues = partial_order
+        self.branch_ids: list[list[uuid.UUID]] = [get_branch_ids(x) for x in partial_order]
+        self.branch_counts = [len(x) for x in self.branch_ids]
+        self.probability_indexes = [get_probability_index(x, self.branch_ids) for x in partial_order]
+        self.path = path or []
+        validate_tree_path(self.issues, self.branch_ids, self.path)
+
+        self.start_depth = len(self.path)
+        self.end_depth = len(self.issues)
+        if depth is not None:
+            self.end_depth = min(self.start_depth + depth, self.end_depth)
+        self.level_sizes = [1]
+        for count in self.branch_counts[self.start_depth:self.end_depth]:
+            self.level_sizes.append(self.level_sizes[-1] * count)
+        self.level_offsets: list[int] = np.concatenate(([0], np.cumsum(self.level_sizes))).tolist()
+
+        node_count = self.level_offsets[-1]
+        self.parent: NDArray[np.intp] = np.full(node_count, -1, dtype=np.intp)
+        self.branch: NDArray[np.intp] = np.full(node_count, -1, dtype=np.intp)
+        self.depth: NDArray[np.intp] = np.repeat(
+            np.arange(self.start_depth, self.end_depth + 1, dtype=np.intp), self.level_sizes
+        )
+        for level in range(len(self.level_sizes) - 1):
+            count = self.branch_counts[self.start_depth + level]
+            start, end = self.level_offsets[level], self.level_offsets[level + 1]
+            children = slice(end, self.level_offsets[level + 2])
+            self.parent[children] = np.repeat(np.arange(start, end, dtype=np.intp), count)
+            self.branch[children] = np.tile(np.arange(count, dtype=np.intp), end - start)
+        self.probability_codes = [self.get_probability_codes(x) for x in range(len(self.level_sizes))]
+
+        self.rolled_back = rolled_back
+        self.compressed_nodes: Optional[NDArray[np.intp]] = None
+        if rolled_back is not None:
+            self.compressed_nodes = self.get_compressed_nodes(rolled_back)
+
+    def get_compressed_nodes(self, compressed: CompressedDecisionTree) -> NDArray[np.intp]:
+        """The index of the compressed tree node of every node, following the children down."""
+        compressed_nodes = np.zeros(self.node_count, dtype=np.intp)
+        for level in range(len(self.level_sizes) - 1):
+            count = self.branch_counts[self.start_depth + level]
+            start, end = self.level_offsets[level], self.level_offsets[level + 1]
+            rows = compressed_nodes[start:end] - compressed.level_offsets[level]
+            compressed_nodes[end:self.level_offsets[level + 2]] = compressed.get_children_table(
+                self.start_depth + level
+            )[np.repeat(rows, count), np.tile(np.arange(count, dtype=np.intp), end - start)]
+        return compressed_nodes
+
+    def get_roll_back(self, node: int) -> tuple[Optional[float], Optional[uuid.UUID]]:
+        """The expected value and optimal branch of the node, None when not rolled back."""
+        if self.rolled_back is None or self.compressed_nodes is None:
+            return None, None
+        tree_node = self.rolled_back.tree_nodes[self.compressed_nodes[node]]
+        return tree_node.expected_value, tree_node.optimal_branch_id
+
+    @property
+    def node_count(self) -> int:
+        return self.level_offsets[-1]
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the arrays of the expansion."""
+        arrays = [self.parent, self.branch, self.depth, self.compressed_nodes, *self.probability_codes]
+        return sum(x.nbytes for x in arrays if x is not None)
+
+    def get_probability_codes(self, level: int) -> Optional[NDArray[np.intp]]:
+        """
+        The parent state code in the probability index of the uncertainty of a level for every node
+        of the level, None for other issues. The code is a sum of one digit per level above, and
+        the branch a node descends from on a level above follows from its position, so the digits
+        are added for the whole level at once without visiting the ancestors of every node.
+        """
+        tree_depth = self.start_depth + level
+        probability_index = self.probability_indexes[tree_depth] if tree_depth < len(self.issues) else None
+        if probability_index is None:
+            return None
+        codes = np.full(self.level_sizes[level], probability_index.get_code(self.path), dtype=np.intp)
+        positions = np.arange(self.level_sizes[level], dtype=np.intp)
+        # the number of nodes of the level below each node of the ancestor level
+        stride = 1
+        for ancestor_level in reversed(range(level)):
+            ancestor_depth = self.start_depth + ancestor_level
+            count = self.branch_counts[ancestor_depth]
+            digits = np.array(
+                [probability_index.digits.get(x, (0, 0))[1] for x in self.branch_ids[ancestor_depth]],
+                dtype=np.intp,
+            )
+            if digits.any():
+                codes += digits[(positions // stride) % count]
+            stride *= count
+        return codes
+
+    def get_probabilities(self, level: int, position: int) -> Optional[list[ProbabilityDto]]:
+        """
+        The discrete probabilities of an uncertainty whose parent options and outcomes are all on
+        the path to the node at the position of the level, None for other issues.
+        """
+        codes = self.probability_codes[level]
+        if codes is None:
+            return None
+        probability_index = self.probability_indexes[self.start_depth + level]
+        return probability_index.get_by_code(int(codes[position]))  # type: ignore
+
+    def get_id_strings(self) -> list[list[str]]:
+        """The names the tree node ids are generated from by level, the branch ids from the root down."""
+        id_strings = [[self.get_root_id_string()]]
+        for level in range(len(self.level_sizes) - 1):
+            names = [str(x) for x in self.branch_ids[self.start_depth + level]]
+            id_strings.append([f"{parent} - {name}" for parent in id_strings[level] for name in names])
+        return id_strings
+
+    def get_root_id_string(self) -> str:
+        return " - ".join(["root"] + [str(x) for x in self.path])
+
+    def to_decision_tree_dto(self) -> Optional[DecisionTreeDTO]:
+        """
+        Builds the nested dtos bottom up, level by level, so no recursion is needed.
+        The issue dtos are shared by the tree nodes of a level instead of being copied.
+        Nodes at the depth limit have no children, they are expanded by requesting their path.
+        """
+        if not self.issues:
+            return None
+
+        id_strings = self.get_id_strings()
+        endpoint = EndPointNodeDto(scenario_id=self.scenario_id)
+        children: list[DecisionTreeDTO] = []
+        for level in reversed(range(len(id_strings))):
+            tree_depth = self.start_depth + level
+            is_endpoint = tree_depth == len(self.issues)
+            count = self.branch_counts[tree_depth] if tree_depth < self.end_depth else 0
+            offset = self.level_offsets[level]
+            dtos: list[DecisionTreeDTO] = []
+            for position, id_string in enumerate(id_strings[level]):
+                expected_value, optimal_branch_id = self.get_roll_back(offset + position)
+                tree_node = TreeNodeDto.model_construct(
+                    id=GenerateUuid.as_uuid(id_string),
+                    issue=endpoint if is_endpoint else self.issues[tree_depth],
+                    probabilities=self.get_probabilities(level, position),
+                    expected_value=expected_value,
+                    optimal_branch_id=optimal_branch_id,
+                )
+                dtos.append(DecisionTreeDTO.model_construct(
+                    tree_node=tree_node,
+                    children=children[position * count:(position + 1) * count] or None,
+                ))
+            children = dtos
+        return children[0]
+
+    def iter_json(self, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        """
+        The json of to_decision_tree_dto, written depth first in chunks of about chunk_size bytes.
+        No dtos are built for the tree nodes and an explicit stack is used instead of recursion,
+        so memory follows the depth of the tree rather than its size. The json of the issues and
+        of the shared probability lists is only serialized once.
+        """
+        if not self.issues:
+            yield b"null"
+            return
+
+        issues_json = [x.model_dump_json() for x in self.issues]
+        issues_json.append(EndPointNodeDto(scenario_id=self.scenario_id).model_dump_json())
+        branch_names = [[str(x) for x in branch_ids] for branch_ids in self.branch_ids]
+        probabilities_json: dict[int, str] = {}
+
+        buffer: list[str] = []
+        buffered = 0
+        # a tree node as (level, position on the level, id string) or json closing its children
+        stack: list[Union[tuple[int, int, str], str]] = [(0, 0, self.get_root_id_string())]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                buffer.append(item)
+                buffered += len(item)
+                continue
+
+            level, position, id_string = item
+            node = self.level_offsets[level] + position
+            tree_depth = self.start_depth + level
+            probabilities = self.get_probabilities(level, position)
+            if probabilities is None:
+                probabilities_string = "null"
+            else:
+                probabilities_string = probabilities_json.get(id(probabilities), "")
+                if not probabilities_string:
+                    probabilities_string = probabilities_adapter.dump_json(probabilities).decode()
+                    probabilities_json[id(probabilities)] = probabilities_string
+
+            expected_value, optimal_branch_id = self.get_roll_back(node)
+            optimal_branch_string = f'"{optimal_branch_id}"' if optimal_branch_id else "null"
+            node_json = (
+                f'{{"tree_node":{{"id":"{GenerateUuid.as_uuid(id_string)}",'
+                f'"issue":{issues_json[tree_depth]},"probabilities":{probabilities_string},'
+                f'"expected_value":{json.dumps(expected_value)},'
+                f'"optimal_branch_id":{optimal_branch_string}}},'
+                f'"children":'
+            )
+            count = self.branch_counts[tree_depth] if tree_depth < self.end_depth else 0
+            if count == 0:
+                node_json += "null}"
+            else:
+                node_json += "["
+                stack.append("]}")
+                names = branch_names[tree_depth]
+                for branch in reversed(range(count)):
+                    stack.append((level + 1, position * count + branch, f"{id_string} - {names[branch]}"))
+                    if branch > 0:
+                        stack.append(",")
+            buffer.append(node_json)
+            buffered += len(node_json)
+
+            if buffered >= chunk_size:
+                yield "".join(buffer).encode()
+                buffer, buffered = [], 0
+        yield "".join(buffer).encode()
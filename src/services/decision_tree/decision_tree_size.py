@@ -0,0 +1,199 @@
+import uuid
+from typing import Optional
+from src.config import config
+from src.constants import DecisionTreeMode
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.decision_tree_dtos import DecisionTreeSizeDTO
+from src.services.decision_tree.probability_index import ProbabilityIndex
+from src.services.decision_tree.decision_tree_expansion import (
+    get_branch_ids,
+    get_probability_index,
+    probabilities_adapter,
+    validate_tree_path,
+)
+
+# json of a tree node without its issue and probabilities, and of a compressed tree node
+# without its probabilities and children
+TREE_NODE_JSON_BYTES = 160
+COMPRESSED_TREE_NODE_JSON_BYTES = 120
+CHILD_INDEX_JSON_BYTES = 6
+# measured time to write the json of a tree node and to build a compressed tree node
+TREE_NODE_SECONDS = 5e-6
+COMPRESSED_TREE_NODE_SECONDS = 2e-5
+
+
+class DecisionTreeTooLargeError(ValueError):
+    """Raised when a decision tree is above the configured limits and is not returned in part."""
+
+
+class DecisionTreeSize:
+    """
+    The exact size of a subtree of the decision tree of a partial order, without expanding it.
+
+    Every tree node of a level has one child per option or outcome of its issue, so the level sizes
+    of the full tree are products of the branch counts. A compressed tree has one tree node per
+    distinct key on a level, the path restricted to the relevant branches of the level, and every
+    issue above the level contributes one of its relevant branches or, when it has other branches,
+    none, so the number of keys is a product as well. Path and depth select the subtree as for
+    DecisionTreeExpansion. The json size and time are estimated from these counts.
+    """
+
+    def __init__(
+        self,
+        partial_order: list[IssueOutgoingDto],
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+    ) -> None:
+        self.issues = partial_order
+        self.branch_ids: list[list[uuid.UUID]] = [get_branch_ids(x) for x in partial_order]
+        self.probability_indexes = [get_probability_index(x, self.branch_ids) for x in partial_order]
+        self.path = path or []
+        validate_tree_path(self.issues, self.branch_ids, self.path)
+        self.depth = depth
+
+        self.start_depth = len(self.path)
+        self.end_depth = len(self.issues)
+        if depth is not None:
+            self.end_depth = min(self.start_depth + depth, self.end_depth)
+
+        # the parents of the uncertainties from a level down, as in CompressedDecisionTree
+        relevant_branches: list[frozenset[uuid.UUID]] = [frozenset()]
+        for probability_index in reversed(self.probability_indexes):
+            parent_ids = probability_index.parent_ids if probability_index else frozenset()
+            relevant_branches.insert(0, relevant_branches[0] | parent_ids)
+
+        self.level_sizes = [1]
+        for level in range(self.start_depth, self.end_depth):
+            self.level_sizes.append(self.level_sizes[-1] * len(self.branch_ids[level]))
+        # rolling back needs the compressed tree to the endpoints, so it is counted to the end
+        self.endpoint_compressed_level_sizes = [1]
+        for level in range(self.start_depth, len(self.issues)):
+            key_count = 1
+            for issue_branch_ids in self.branch_ids[self.start_depth:level + 1]:
+                relevant_count = len(relevant_branches[level + 1].intersection(issue_branch_ids))
+                key_count *= relevant_count + (relevant_count < len(issue_branch_ids))
+            self.endpoint_compressed_level_sizes.append(key_count)
+        self.compressed_level_sizes = self.endpoint_compressed_level_sizes[:len(self.level_sizes)]
+
+        self.issues_json_bytes = [len(x.model_dump_json()) for x in self.issues]
+        self.probabilities_json_bytes = [
+            self.get_probabilities_json_bytes(x, y) for x, y in zip(self.issues, self.probability_indexes)
+        ]
+
+    @staticmethod
+    def get_probabilities_json_bytes(
+        issue: IssueOutgoingDto, probability_index: Optional[ProbabilityIndex]
+    ) -> int:
+        """The json size of the probabilities of a tree node, about one per outcome."""
+        if probability_index is None or not probability_index.rows:
+            return 4
+        rows = [x for _, x in probability_index.rows]
+        outcome_count = len(issue.uncertainty.outcomes)  # type: ignore
+        rows_json_bytes = len(probabilities_adapter.dump_json(rows))
+        return rows_json_bytes * min(outcome_count, len(rows)) // len(rows)
+
+    @property
+    def node_count(self) -> int:
+        return sum(self.level_sizes)
+
+    @property
+    def leaf_count(self) -> int:
+        return self.level_sizes[-1]
+
+    @property
+    def compressed_node_count(self) -> int:
+        return sum(self.compressed_level_sizes)
+
+    def get_json_bytes(self, levels: Optional[int] = None) -> int:
+        """The estimated json size of the full tree, of its first levels when levels is given."""
+        json_bytes = 0
+        for level, size in enumerate(self.level_sizes[:levels]):
+            tree_depth = self.start_depth + level
+            node_bytes = TREE_NODE_JSON_BYTES
+            if tree_depth < len(self.issues):
+                node_bytes += self.issues_json_bytes[tree_depth]
+                node_bytes += self.probabilities_json_bytes[tree_depth]
+            json_bytes += size * node_bytes
+        return json_bytes
+
+    def get_compressed_json_bytes(self) -> int:
+        json_bytes = sum(self.issues_json_bytes)
+        for level, size in enumerate(self.compressed_level_sizes):
+            tree_depth = self.start_depth + level
+            node_bytes = COMPRESSED_TREE_NODE_JSON_BYTES
+            if tree_depth < self.end_depth:
+                node_bytes += len(self.branch_ids[tree_depth]) * CHILD_INDEX_JSON_BYTES
+            if tree_depth < len(self.issues):
+                node_bytes += self.probabilities_json_bytes[tree_depth]
+            json_bytes += size * node_bytes
+        return json_bytes
+
+    def fits(self, compressed: bool) -> bool:
+        if compressed:
+            return (self.compressed_node_count <= config.DECISION_TREE_MAX_NODES
+                    and self.get_compressed_json_bytes() <= config.DECISION_TREE_MAX_BYTES)
+        return (self.node_count <= config.DECISION_TREE_MAX_NODES
+                and self.get_json_bytes() <= config.DECISION_TREE_MAX_BYTES)
+
+    def get_max_depth(self) -> int:
+        """The most levels below the start node that fit in the limits of the full tree."""
+        max_depth = 0
+        node_count = 1
+        for levels in range(2, len(self.level_sizes) + 1):
+            node_count += self.level_sizes[levels - 1]
+            if (node_count > config.DECISION_TREE_MAX_NODES
+                    or self.get_json_bytes(levels) > config.DECISION_TREE_MAX_BYTES):
+                break
+            max_depth = levels - 1
+        return max_depth
+
+    def get_mode(self, compressed: bool, roll_back: bool) -> tuple[DecisionTreeMode, Optional[int]]:
+        """
+        How to return the requested tree, and to which depth. A tree above the limits is refused or,
+        depending on DECISION_TREE_OVERSIZE_MODE, returned compressed or expanded as deep as fits.
+        Rolling back always builds the compressed tree to the endpoints, which has to fit.
+        """
+        requested_mode = DecisionTreeMode.COMPRESSED if compressed else DecisionTreeMode.FULL
+        if roll_back and sum(self.endpoint_compressed_level_sizes) > config.DECISION_TREE_MAX_NODES:
+            raise DecisionTreeTooLargeError(self.get_too_large_message())
+        if self.fits(compressed):
+            return requested_mode, self.depth
+
+        oversize_mode = DecisionTreeMode(config.DECISION_TREE_OVERSIZE_MODE)
+        if oversize_mode == DecisionTreeMode.REFUSE or compressed:
+            raise DecisionTreeTooLargeError(self.get_too_large_message())
+        if oversize_mode == DecisionTreeMode.COMPRESSED and self.fits(compressed=True):
+            return DecisionTreeMode.COMPRESSED, self.depth
+        return DecisionTreeMode.LAZY, self.get_max_depth()
+
+    def get_too_large_message(self) -> str:
+        return (
+            f"The decision tree has {self.node_count} nodes, about {self.get_json_bytes()} bytes "
+            f"of json, and {self.compressed_node_count} nodes when compressed, which is above the "
+            f"limit of {config.DECISION_TREE_MAX_NODES} nodes and "
+            f"{config.DECISION_TREE_MAX_BYTES} bytes. "
+            f"Request a path and depth to expand the tree in parts."
+        )
+
+    def to_decision_tree_size_dto(
+        self, compressed: bool = False, roll_back: bool = False
+    ) -> DecisionTreeSizeDTO:
+        try:
+            mode, depth = self.get_mode(compressed, roll_back)
+        except DecisionTreeTooLargeError:
+            mode, depth = DecisionTreeMode.REFUSE, None
+        return DecisionTreeSizeDTO(
+            path=self.path,
+            depth=self.depth,
+            level_sizes=self.level_sizes,
+            node_count=self.node_count,
+            leaf_count=self.leaf_count,
+            compressed_level_sizes=self.compressed_level_sizes,
+            compressed_node_count=self.compressed_node_count,
+            estimated_bytes=self.get_json_bytes(),
+            estimated_compressed_bytes=self.get_compressed_json_bytes(),
+            estimated_seconds=self.node_count * TREE_NODE_SECONDS,
+            estimated_compressed_seconds=self.compressed_node_count * COMPRESSED_TREE_NODE_SECONDS,
+            mode=mode,
+            mode_depth=depth,
+        )
@@ -0,0 +1,64 @@
+import uuid
+from src.constants import Type
+from src.domain.diagram_model import DiagramModel
+from src.domain.indexed_graph import IndexedGraph
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+
+
+def get_issue_graph(model: DiagramModel) -> IndexedGraph[uuid.UUID]:
+    """The issues of the diagram connected by its edges, vertex indexes follow the issue order."""
+    return IndexedGraph(
+        (x.id for x in model.issues),
+        ((tail.id, head.id) for tail, head in map(model.get_edge_issues, model.edges)),
+    )
+
+
+def decision_elimination_order(
+    graph: IndexedGraph[uuid.UUID], decision_ids: list[uuid.UUID]
+) -> list[uuid.UUID]:
+    """
+    The decisions in the order they are removed when the nodes without children are removed in
+    repeated passes over the nodes of the graph.
+    A node is removed in the pass its last child is removed, or in the next pass when that child
+    comes after it in the graph. So the pass of every node follows from its children, and one
+    pass over the nodes in reverse topological order of the indexed graph is enough.
+    """
+    removal_pass: list[int] = [-1] * graph.vertex_count
+    # nodes on a cycle, and the nodes before them, are never without children and left out
+    for node in graph.topological_order(reverse=True):
+        removal_pass[node] = max(
+            (removal_pass[x] + (x > node) for x in graph.successors(node)), default=0
+        )
+
+    decisions = [graph.index[x] for x in decision_ids]
+    if any(removal_pass[x] < 0 for x in decisions):
+        raise ValueError("Decisions are part of a cycle in the influence diagram")
+    return graph.get_ids(sorted(decisions, key=lambda x: (removal_pass[x], x)))
+
+
+def calculate_partial_order(
+    issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]
+) -> list[IssueOutgoingDto]:
+    """
+    Partial order algorithm, the decisions in the reverse of their elimination order, each after
+    the uncertainties observed before it, followed by the other uncertainties.
+    Utility nodes, like the other issues without options or outcomes, never branch the decision
+    tree. They are removed during the elimination as any other node and are left out here.
+    """
+    model = DiagramModel(issues, edges)
+    graph = get_issue_graph(model)
+    decision_ids = [x.id for x in issues if x.type == Type.DECISION.value]
+    uncertainty_ids = [x.id for x in issues if x.type == Type.UNCERTAINTY.value]
+    remaining_uncertainties = set(uncertainty_ids)
+    partial_order: list[uuid.UUID] = []
+
+    for decision in reversed(decision_elimination_order(graph, decision_ids)):
+        for parent in graph.get_ids(graph.predecessors(graph.index[decision])):
+            if parent in remaining_uncertainties:
+                partial_order.append(parent)
+                remaining_uncertainties.remove(parent)
+        partial_order.append(decision)
+
+    partial_order += [x for x in uncertainty_ids if x in remaining_uncertainties]
+    return [model.issues_by_id[x] for x in partial_order]
@@ -0,0 +1,100 @@
+import uuid
+from itertools import product
+from typing import Iterable
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.decision_tree_dtos import ProbabilityDto
+
+
+class ProbabilityIndex:
+    """
+    The discrete probabilities of an uncertainty by the options and outcomes on a decision tree path.
+
+    A probability applies to a tree node when all its parent options and outcomes are on the path
+    to the node. Only the parents of the uncertainty on the path decide which probabilities apply,
+    and a path holds at most one option or outcome of every issue. The parent state is therefore
+    numbered as a mixed radix code, with one digit per parent issue that is 0 when none of its
+    parent states is on the path. The probabilities and distributions are precomputed by code when
+    the index is built: every row is added to the codes of the states it applies to, which is one
+    code for a row giving a state of every parent. A lookup is then a sum of digits and a dict hit.
+    The returned lists are shared by the tree nodes with the same parent state.
+    """
+
+    def __init__(self, issue: IssueOutgoingDto, branch_ids: list[list[uuid.UUID]]) -> None:
+        """branch_ids holds the options or outcomes of every issue that can be on a path."""
+        outcome_names = {x.id: x.name for x in issue.uncertainty.outcomes} if issue.uncertainty else {}
+        discrete_probabilities = issue.uncertainty.discrete_probabilities if issue.uncertainty else []
+        self.rows: list[tuple[frozenset[uuid.UUID], ProbabilityDto]] = [
+            (
+                frozenset(dto.parent_option_ids).union(dto.parent_outcome_ids),
+                ProbabilityDto(
+                    outcome_name=outcome_names[dto.outcome_id],
+                    outcome_id=dto.outcome_id,
+                    probability_value=dto.probability,
+                    discrete_probability_id=dto.id,
+                ),
+            )
+            for dto in discrete_probabilities
+            # probabilities of outcomes that are no longer outcomes of the uncertainty never apply
+            if dto.probability is not None and dto.outcome_id in outcome_names
+        ]
+        self.parent_ids: frozenset[uuid.UUID] = frozenset().union(*(x for x, _ in self.rows))
+
+        # the digit and parent of every parent state, parents are numbered in the order of branch_ids
+        self.digits: dict[uuid.UUID, tuple[int, int]] = {}
+        parent_digits: list[list[int]] = []
+        stride = 1
+        for issue_branch_ids in branch_ids:
+            parent_states = [x for x in issue_branch_ids if x in self.parent_ids]
+            if not parent_states:
+                continue
+            for n, state_id in enumerate(parent_states):
+                self.digits[state_id] = (len(parent_digits), (n + 1) * stride)
+            parent_digits.append([n * stride for n in range(len(parent_states) + 1)])
+            stride *= len(parent_states) + 1
+
+        self.by_code: dict[int, list[ProbabilityDto]] = {}
+        for parents, dto in self.rows:
+            fixed_digits = [self.digits.get(x) for x in parents]
+            if None in fixed_digits or len({x[0] for x in fixed_digits}) < len(fixed_digits):  # type: ignore
+                # a parent state that is not on any path, or two states of the same parent
+                continue
+            digit_choices = [list(x) for x in parent_digits]
+            for parent, digit in fixed_digits:  # type: ignore
+                digit_choices[parent] = [digit]
+            for digits in product(*digit_choices):
+                self.by_code.setdefault(sum(digits), []).append(dto)
+
+        # the distribution takes every outcome from the matching row with the most parents
+        parent_counts = {dto.discrete_probability_id: len(parents) for parents, dto in self.rows}
+        self.distribution_by_code: dict[int, dict[uuid.UUID, float]] = {
+            code: {
+                dto.outcome_id: dto.probability_value  # type: ignore
+                for dto in sorted(probabilities, key=lambda x: parent_counts[x.discrete_probability_id])
+            }
+            for code, probabilities in self.by_code.items()
+        }
+        self.no_probabilities: list[ProbabilityDto] = []
+
+    def get_code(self, path: Iterable[uuid.UUID]) -> int:
+        """The code of the parent state on the path, ValueError when it has two states of a parent."""
+        code = 0
+        parents: set[int] = set()
+        for branch_id in path:
+            digit = self.digits.get(branch_id)
+            if digit is None:
+                continue
+            if digit[0] in parents:
+                raise ValueError(f"The path has more than one state of the parent of {branch_id}")
+            parents.add(digit[0])
+            code += digit[1]
+        return code
+
+    def get_by_code(self, code: int) -> list[ProbabilityDto]:
+        return self.by_code.get(code, self.no_probabilities)
+
+    def get(self, path: Iterable[uuid.UUID]) -> list[ProbabilityDto]:
+        return self.get_by_code(self.get_code(path))
+
+    def get_distribution(self, path: Iterable[uuid.UUID]) -> dict[uuid.UUID, float]:
+        """The probability of each outcome, from the matching row with the most parents."""
+        return self.distribution_by_code.get(self.get_code(path), {})
@@ -0,0 +1,111 @@
+import uuid
+import zlib
+from typing import Optional, Union
+from src.services.scenario_service import ScenarioService
+from src.session_manager import sessionmanager
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.dtos.diagram_snapshot_dtos import DiagramSnapshotDto
+from src.repositories.diagram_snapshot_repository import DiagramSnapshotRepository
+from src.logger import get_dot_api_logger
+
+logger = get_dot_api_logger()
+
+# increment when the content of DiagramSnapshotDto changes, older snapshots are then rebuilt
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class DiagramSnapshotService:
+    """
+    Serves the validated influence diagram of a scenario from its stored snapshot,
+    and rebuilds the snapshot when it has been marked stale by the session hooks.
+
+    The rebuild is lazy: the hooks only increment the version and clear the data, since they run
+    synchronously inside the flush of the writing request. The first read after an edit therefore
+    still runs the full issue and edge queries and the validation, and stores the snapshot again.
+    Only reads without an edit in between are served from the snapshot, so a workflow that edits
+    before every solve gets no speedup and pays for the version update and the snapshot write.
+    """
+
+    def __init__(self, scenario_service: ScenarioService):
+        self.scenario_service = scenario_service
+
+    @staticmethod
+    def serialize(issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]) -> bytes:
+        return zlib.compress(DiagramSnapshotDto(issues=issues, edges=edges).model_dump_json().encode())
+
+    @staticmethod
+    def deserialize(data: bytes) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
+        snapshot = DiagramSnapshotDto.model_validate_json(zlib.decompress(data))
+        return snapshot.issues, snapshot.edges
+
+    async def get_version(self, scenario_id: uuid.UUID) -> Optional[int]:
+        """The content version of the diagram, None when the scenario has no snapshot yet."""
+        version: Optional[int] = None
+        async for session in sessionmanager.get_session():
+            version = await DiagramSnapshotRepository(session).get_version(scenario_id)
+        return version
+
+    async def get_influence_diagram_data(
+        self, scenario_id: uuid.UUID
+    ) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
+        diagram = (await self.get_influence_diagrams_data([scenario_id]))[scenario_id]
+        if isinstance(diagram, Exception):
+            raise diagram
+        return diagram
+
+    async def get_influence_diagrams_data(
+        self, scenario_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, Union[tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]], Exception]]:
+        """
+        The validated diagrams of the scenarios in one session. The snapshots are read with one
+        query, and the diagrams of the stale snapshots are loaded together and stored. A diagram
+        that fails validation is returned as its error, so that the other scenarios are served.
+        """
+        diagrams: dict[
+            uuid.UUID, Union[tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]], Exception]
+        ] = {}
+        async for session in sessionmanager.get_session():
+            repository = DiagramSnapshotRepository(session)
+            snapshots = await repository.get_many(scenario_ids)
+            stale_ids: list[uuid.UUID] = []
+            for scenario_id in scenario_ids:
+                snapshot = snapshots.get(scenario_id)
+                if snapshot is not None:
+                    _, format_version, data = snapshot
+                    if data is not None and format_version == SNAPSHOT_FORMAT_VERSION:
+                        diagrams[scenario_id] = self.deserialize(data)
+                        continue
+                stale_ids.append(scenario_id)
+            if not stale_ids:
+                continue
+
+            scenario_service = self.scenario_service
+            unvalidated_diagrams = await scenario_service.get_unvalidated_influence_diagram_data(
+                session, stale_ids
+            )
+            any_stored = False
+            for scenario_id in stale_ids:
+                try:
+                    issues, edges = await scenario_service.validate_influence_diagram_data(
+                        *unvalidated_diagrams[scenario_id]
+                    )
+                except Exception as e:
+                    diagrams[scenario_id] = e
+                    continue
+                diagrams[scenario_id] = issues, edges
+
+                snapshot = snapshots.get(scenario_id)
+                stored = await repository.store(
+                    scenario_id,
+                    version=snapshot[0] if snapshot is not None else None,
+                    format_version=SNAPSHOT_FORMAT_VERSION,
+                    data=self.serialize(issues, edges),
+                )
+                if stored:
+                    any_stored = True
+                else:
+                    logger.info(f"Diagram of scenario {scenario_id} changed while its snapshot was created")
+            if any_stored:
+                await session.commit()
+        return diagrams
@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional
+from typing import AsyncIterator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.discrete_probability import DiscreteProbability
@@ -8,6 +8,8 @@ from src.dtos.discrete_probability_dtos import (
     DiscreteProbabilityOutgoingDto,
     DiscreteProbabilityMapper,
 )
+from src.dtos.page_dtos import PageDto
+from src.constants import PageSize
 from src.repositories.discrete_probability_repository import DiscreteProbabilityRepository
 
 
@@ -43,10 +45,22 @@ class DiscreteProbabilityService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[DiscreteProbabilityOutgoingDto]:
-        discrete_probabilities: list[DiscreteProbability] = await DiscreteProbabilityRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[DiscreteProbabilityOutgoingDto]:
+        discrete_probabilities, next_cursor = await DiscreteProbabilityRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = DiscreteProbabilityMapper.to_outgoing_dtos(discrete_probabilities)
-        return result
\ No newline at end of file
+        return PageDto(items=result, next_cursor=next_cursor)
+
+    async def stream(
+        self, session: AsyncSession, odata_query: Optional[str] = None
+    ) -> AsyncIterator[list[DiscreteProbabilityOutgoingDto]]:
+        async for discrete_probabilities in DiscreteProbabilityRepository(session).stream(
+            odata_query=odata_query
+        ):
+            yield DiscreteProbabilityMapper.to_outgoing_dtos(discrete_probabilities)
@@ -5,25 +5,66 @@ from src.models import (
     Edge,
     Node,
 )
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
+from src.utils.field_selection import FieldSelection, SelectableFields
+from src.repositories.query_extensions import QueryExtensions
 from src.dtos.edge_dtos import (
     EdgeMapper,
     EdgeIncomingDto,
     EdgeOutgoingDto,
 )
 from src.models.filters.edge_filter import EdgeFilter
+from src.domain.indexed_graph import IndexedGraph, EdgeCycleError
 from src.repositories.edge_repository import EdgeRepository
 from src.repositories.node_repository import NodeRepository
 
 
+EDGE_FIELDS = SelectableFields[Edge](
+    EdgeOutgoingDto,
+    QueryExtensions.edge_field_loads,
+    EdgeMapper.field_mappers,
+    EdgeMapper.to_outgoing_dtos,
+)
+
+
 class EdgeService:
     @staticmethod
     def _connect_nodes_to_edge(edge: Edge, tail_node: Node, head_node: Node):
         edge.tail_node, edge.head_node = tail_node, head_node
         return edge
 
+    @staticmethod
+    async def _validate_acyclic(session: AsyncSession, dtos: list[EdgeIncomingDto]) -> None:
+        """
+        Raises EdgeCycleError when the edges would create a cycle in their scenario.
+        The other edges of each scenario are loaded with one query of their node ids and searched
+        for a cycle together with the new edges. A scenario that already has a cycle is left to
+        the validation of the influence diagram.
+        """
+        dto_ids = {x.id for x in dtos}
+        scenario_ids = list({x.scenario_id for x in dtos})
+        edges_by_scenario: dict[uuid.UUID, list[tuple[uuid.UUID, uuid.UUID]]] = {
+            x: [] for x in scenario_ids
+        }
+        scenario_edges = await EdgeRepository(session).get_node_ids_by_scenario(scenario_ids)
+        for edge_id, scenario_id, tail_id, head_id in scenario_edges:
+            # edges that are updated are checked with their new nodes
+            if edge_id not in dto_ids:
+                edges_by_scenario[scenario_id].append((tail_id, head_id))
+
+        for scenario_id, edges in edges_by_scenario.items():
+            new_edges = [(x.tail_id, x.head_id) for x in dtos if x.scenario_id == scenario_id]
+            graph = IndexedGraph([], edges + new_edges)
+            cycle = graph.find_cycle()
+            # the other edges are only searched on their own when there is a cycle
+            if cycle is not None and not IndexedGraph([], edges).has_cycle():
+                raise EdgeCycleError(graph.get_ids(cycle))
+
     async def create(
         self, session: AsyncSession, dtos: list[EdgeIncomingDto]
     ) -> list[EdgeOutgoingDto]:
+        await self._validate_acyclic(session, dtos)
         entities: list[Edge] = await EdgeRepository(session).create(EdgeMapper.to_entities(dtos))
 
         tail_nodes = await NodeRepository(session).get([x.tail_id for x in dtos])
@@ -37,6 +78,7 @@ class EdgeService:
     async def update(
         self, session: AsyncSession, dtos: list[EdgeIncomingDto]
     ) -> list[EdgeOutgoingDto]:
+        await self._validate_acyclic(session, dtos)
         entities: list[Edge] = await EdgeRepository(session).update(EdgeMapper.to_entities(dtos))
         # get the dtos while the entities are still connected to the session
         result: list[EdgeOutgoingDto] = EdgeMapper.to_outgoing_dtos(entities)
@@ -55,10 +97,17 @@ class EdgeService:
         session: AsyncSession,
         odata_query: Optional[str] = None,
         filter: Optional[EdgeFilter] = None,
-    ) -> list[EdgeOutgoingDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+        selection: Optional[FieldSelection] = None,
+    ) -> PageDto[EdgeOutgoingDto]:
         model_filter = filter.construct_filters() if filter else []
-        edges: list[Edge] = await EdgeRepository(session).get_all(
-            odata_query=odata_query, model_filter=model_filter
+        edges, next_cursor = await EdgeRepository(session).get_page(
+            odata_query=odata_query,
+            model_filter=model_filter,
+            cursor=cursor,
+            take=take,
+            load_options=EDGE_FIELDS.load_options(selection),
         )
-        result = EdgeMapper.to_outgoing_dtos(edges)
-        return result
+        result = EDGE_FIELDS.to_dtos(edges, selection)
+        return PageDto(items=result, next_cursor=next_cursor)
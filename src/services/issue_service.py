@@ -1,6 +1,6 @@
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from src.models.issue import Issue
 from src.dtos.issue_dtos import (
@@ -29,6 +29,10 @@ from src.dtos.value_metric_dtos import (
     ValueMetricMapper,
     ValueMetricIncomingDto,
 )
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
+from src.utils.field_selection import FieldSelection, SelectableFields
+from src.repositories.query_extensions import QueryExtensions
 from src.dtos.user_dtos import (
     UserIncomingDto,
     UserMapper,
@@ -43,6 +47,14 @@ from src.repositories.user_repository import UserRepository
 from src.models.filters.issues_filter import IssueFilter
 
 
+ISSUE_FIELDS = SelectableFields[Issue](
+    IssueOutgoingDto,
+    QueryExtensions.issue_field_loads,
+    IssueMapper.field_mappers,
+    IssueMapper.to_outgoing_dtos,
+)
+
+
 class IssueService:
     def _extract_related_entities(
         self, dtos: list[IssueIncomingDto]
@@ -197,10 +209,29 @@ class IssueService:
         session: AsyncSession,
         filter: Optional[IssueFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[IssueOutgoingDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+        selection: Optional[FieldSelection] = None,
+    ) -> PageDto[IssueOutgoingDto]:
         model_filter = filter.construct_filters() if filter else []
-        issues: list[Issue] = await IssueRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        issues, next_cursor = await IssueRepository(session).get_page(
+            model_filter=model_filter,
+            odata_query=odata_query,
+            cursor=cursor,
+            take=take,
+            load_options=ISSUE_FIELDS.load_options(selection),
         )
-        result = IssueMapper.to_outgoing_dtos(issues)
-        return result
+        result = ISSUE_FIELDS.to_dtos(issues, selection)
+        return PageDto(items=result, next_cursor=next_cursor)
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        filter: Optional[IssueFilter] = None,
+        odata_query: Optional[str] = None,
+    ) -> AsyncIterator[list[IssueOutgoingDto]]:
+        model_filter = filter.construct_filters() if filter else []
+        async for issues in IssueRepository(session).stream(
+            model_filter=model_filter, odata_query=odata_query
+        ):
+            yield IssueMapper.to_outgoing_dtos(issues)
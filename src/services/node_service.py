@@ -4,10 +4,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.node import Node
 from src.dtos.node_dtos import NodeIncomingDto, NodeOutgoingDto, NodeMapper
+from src.dtos.page_dtos import PageDto
+from src.utils.field_selection import FieldSelection, SelectableFields
+from src.repositories.query_extensions import QueryExtensions
+from src.constants import PageSize
 from src.repositories.node_repository import NodeRepository
 from src.models.filters.node_filter import NodeFilter
 
 
+NODE_FIELDS = SelectableFields[Node](
+    NodeOutgoingDto,
+    QueryExtensions.node_field_loads,
+    NodeMapper.field_mappers,
+    NodeMapper.to_outgoing_dtos,
+)
+
+
 class NodeService:
     async def create(
         self, session: AsyncSession, dtos: list[NodeIncomingDto]
@@ -38,10 +50,17 @@ class NodeService:
         session: AsyncSession,
         filter: Optional[NodeFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[NodeOutgoingDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+        selection: Optional[FieldSelection] = None,
+    ) -> PageDto[NodeOutgoingDto]:
         model_filter = filter.construct_filters() if filter else []
-        nodes: list[Node] = await NodeRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        nodes, next_cursor = await NodeRepository(session).get_page(
+            model_filter=model_filter,
+            odata_query=odata_query,
+            cursor=cursor,
+            take=take,
+            load_options=NODE_FIELDS.load_options(selection),
         )
-        result = NodeMapper.to_outgoing_dtos(nodes)
-        return result
+        result = NODE_FIELDS.to_dtos(nodes, selection)
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -3,6 +3,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.node_style import NodeStyle
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.node_style_dtos import (
     NodeStyleIncomingDto,
     NodeStyleOutgoingDto,
@@ -41,10 +43,14 @@ class NodeStyleService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[NodeStyleOutgoingDto]:
-        node_styles: list[NodeStyle] = await NodeStyleRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[NodeStyleOutgoingDto]:
+        node_styles, next_cursor = await NodeStyleRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = NodeStyleMapper.to_outgoing_dtos(node_styles)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -8,6 +8,8 @@ from src.dtos.objective_dtos import (
     ObjectiveOutgoingDto,
     ObjectiveMapper,
 )
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.user_dtos import (
     UserIncomingDto,
     UserMapper,
@@ -54,10 +56,14 @@ class ObjectiveService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[ObjectiveOutgoingDto]:
-        objectives: list[Objective] = await ObjectiveRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[ObjectiveOutgoingDto]:
+        objectives, next_cursor = await ObjectiveRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = ObjectiveMapper.to_outgoing_dtos(objectives)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
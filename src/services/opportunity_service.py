@@ -8,6 +8,8 @@ from src.dtos.opportunity_dtos import (
     OpportunityOutgoingDto,
     OpportunityMapper,
 )
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.user_dtos import (
     UserIncomingDto,
     UserMapper,
@@ -56,10 +58,14 @@ class OpportunityService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[OpportunityOutgoingDto]:
-        opportunities: list[Opportunity] = await OpportunityRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[OpportunityOutgoingDto]:
+        opportunities, next_cursor = await OpportunityRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = OpportunityMapper.to_outgoing_dtos(opportunities)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -2,6 +2,8 @@ import uuid
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.option import Option
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.option_dtos import (
     OptionIncomingDto,
     OptionOutgoingDto,
@@ -40,8 +42,12 @@ class OptionService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[OptionOutgoingDto]:
-        options: list[Option] = await OptionRepository(session).get_all(odata_query=odata_query)
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[OptionOutgoingDto]:
+        options, next_cursor = await OptionRepository(session).get_page(odata_query=odata_query, cursor=cursor, take=take)
         result = OptionMapper.to_outgoing_dtos(options)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -2,6 +2,8 @@ import uuid
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.outcome import Outcome
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.outcome_dtos import (
     OutcomeIncomingDto,
     OutcomeOutgoingDto,
@@ -40,8 +42,12 @@ class OutcomeService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[OutcomeOutgoingDto]:
-        outcomes: list[Outcome] = await OutcomeRepository(session).get_all(odata_query=odata_query)
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[OutcomeOutgoingDto]:
+        outcomes, next_cursor = await OutcomeRepository(session).get_page(odata_query=odata_query, cursor=cursor, take=take)
         result = OutcomeMapper.to_outgoing_dtos(outcomes)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -6,8 +6,9 @@ from src.dtos.project_roles_dtos import (
     ProjectRoleMapper,
     ProjectRoleOutgoingDto,
 )
-from src.constants import ProjectRoleType
+from src.constants import ProjectRoleType, PageSize
 from src.dtos.user_dtos import UserIncomingDto
+from src.dtos.page_dtos import PageDto
 from src.repositories.project_role_repository import ProjectRoleRepository
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -46,10 +47,12 @@ class ProjectRoleService:
     async def get_all(
         self,
         session: AsyncSession,
-    ) -> list[ProjectRoleOutgoingDto]:
-        project_roles = await ProjectRoleRepository(session).get_all()
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[ProjectRoleOutgoingDto]:
+        project_roles, next_cursor = await ProjectRoleRepository(session).get_page(cursor=cursor, take=take)
         result: list[ProjectRoleOutgoingDto] = ProjectRoleMapper.to_outgoing_dtos(project_roles)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
 
     async def update(
         self,
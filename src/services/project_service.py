@@ -1,7 +1,7 @@
 import uuid
-from typing import Optional
+from typing import AsyncIterator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.constants import ProjectRoleType
+from src.constants import ProjectRoleType, PageSize
 from src.dtos.project_roles_dtos import ProjectRoleCreateDto, ProjectRoleMapper
 from src.models.project_role import ProjectRole
 from src.repositories.project_role_repository import ProjectRoleRepository
@@ -25,6 +25,9 @@ from src.dtos.opportunity_dtos import (
     OpportunityMapper,
     OpportunityViaProjectDto,
 )
+from src.dtos.page_dtos import PageDto
+from src.utils.field_selection import FieldSelection, SelectableFields
+from src.repositories.query_extensions import QueryExtensions
 from src.dtos.scenario_dtos import (
     ScenarioMapper,
     ScenarioCreateViaProjectDto,
@@ -37,6 +40,14 @@ from src.repositories.objective_repository import ObjectiveRepository
 from src.models.filters.project_filter import ProjectFilter
 
 
+PROJECT_FIELDS = SelectableFields[Project](
+    ProjectOutgoingDto,
+    QueryExtensions.project_field_loads,
+    ProjectMapper.field_mappers,
+    ProjectMapper.to_outgoing_dtos,
+)
+
+
 class ProjectService:
     async def _create_scenarios_for_project(
         self,
@@ -170,10 +181,13 @@ class ProjectService:
         user_dto: UserIncomingDto,
         filter: Optional[ProjectFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[ProjectOutgoingDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+        selection: Optional[FieldSelection] = None,
+    ) -> PageDto[ProjectOutgoingDto]:
         user = await UserRepository(session).get_or_create(UserMapper.to_entity(user_dto))
         if not user:
-            return []
+            return PageDto(items=[])
         if filter is None:
             filter = ProjectFilter()
 
@@ -183,11 +197,15 @@ class ProjectService:
         # Construct model filters
         model_filter = filter.construct_filters() if filter else []
         model_filter.append(project_access_filter)
-        projects: list[Project] = await ProjectRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        projects, next_cursor = await ProjectRepository(session).get_page(
+            model_filter=model_filter,
+            odata_query=odata_query,
+            cursor=cursor,
+            take=take,
+            load_options=PROJECT_FIELDS.load_options(selection),
         )
-        result = ProjectMapper.to_outgoing_dtos(projects)
-        return result
+        result = PROJECT_FIELDS.to_dtos(projects, selection)
+        return PageDto(items=result, next_cursor=next_cursor)
 
     async def get_populated_projects(
         self, session: AsyncSession, ids: list[uuid.UUID]
@@ -201,10 +219,24 @@ class ProjectService:
         session: AsyncSession,
         filter: Optional[ProjectFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[PopulatedProjectDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[PopulatedProjectDto]:
         model_filter = filter.construct_filters() if filter else []
-        projects: list[Project] = await ProjectRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        projects, next_cursor = await ProjectRepository(session).get_page(
+            model_filter=model_filter, odata_query=odata_query, cursor=cursor, take=take
         )
         result = ProjectMapper.to_populated_dtos(projects)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
+
+    async def stream_populated_projects(
+        self,
+        session: AsyncSession,
+        filter: Optional[ProjectFilter] = None,
+        odata_query: Optional[str] = None,
+    ) -> AsyncIterator[list[PopulatedProjectDto]]:
+        model_filter = filter.construct_filters() if filter else []
+        async for projects in ProjectRepository(session).stream(
+            model_filter=model_filter, odata_query=odata_query
+        ):
+            yield ProjectMapper.to_populated_dtos(projects)
@@ -1,8 +1,8 @@
 import pyagrum as gum # type: ignore
 import numpy as np
 from numpy.typing import NDArray
-from itertools import product
 from src.constants import Type
+from src.domain.diagram_model import DiagramModel
 from src.utils.discrete_probability_array_manager import DiscreteProbabilityArrayManager
 from src.dtos.issue_dtos import IssueOutgoingDto
 from src.dtos.edge_dtos import EdgeOutgoingDto
@@ -17,6 +17,7 @@ class PyagrumSolver:
     def __init__(self):
         self.node_lookup: dict[str, int] = {}
         self.diagram = gum.InfluenceDiagram()
+        self.model = DiagramModel([], [])
 
     def _reset_diagram(self):
         self.diagram = gum.InfluenceDiagram()
@@ -25,10 +26,11 @@ class PyagrumSolver:
         self.node_lookup[issue.id.__str__()] = node_id
 
     def build_influence_diagram(self, issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]):
-        self.add_nodes(issues)
-        self.add_edges(edges)
-        self.fill_cpts(issues)
-        self.add_utilities(issues)
+        self.model = DiagramModel(issues, edges)
+        self.add_nodes(self.model.issues)
+        self.add_edges(self.model.edges)
+        self.fill_cpts(self.model.issues)
+        self.add_utilities(self.model.issues)
 
     def _sort_state_dtos(self, dtos: list[T]) -> list[T]:
         return sorted(dtos, key=lambda x: x.id.__str__())
@@ -41,7 +43,7 @@ class PyagrumSolver:
             raise RuntimeError("Influence diagram is not solvable")
         ie.makeInference()
 
-        decision_issue_ids = [x.id.__str__() for x in issues if x.type == Type.DECISION]
+        decision_issue_ids = [x.id for x in self.model.issues if x.type == Type.DECISION]
         if len(decision_issue_ids) == 0:
             return SolutionDto(
                 utility_mean=ie.MEU()["mean"], # type: ignore
@@ -50,12 +52,12 @@ class PyagrumSolver:
             )
 
         data: list[NDArray[np.float64]] = [
-            ie.optimalDecision(x).toarray() for x in decision_issue_ids # type: ignore
+            ie.optimalDecision(x.__str__()).toarray() for x in decision_issue_ids # type: ignore
         ]
 
         optimal_options: list[OptionOutgoingDto] = []
         for array, decision_issue_id in zip(data, decision_issue_ids):
-            issue: IssueOutgoingDto = [x for x in issues if x.id.__str__() == decision_issue_id][0]
+            issue = self.model.get_issue(decision_issue_id)
             assert issue.decision is not None
             sorted_options = self._sort_state_dtos(issue.decision.options)
             optimal_options.append(sorted_options[array.argmax()])
@@ -104,39 +106,34 @@ class PyagrumSolver:
         if issue.type != Type.UNCERTAINTY:
             return
         assert issue.uncertainty is not None
+        if len(issue.uncertainty.discrete_probabilities) == 0:
+            raise ValueError(f"No probabilities found for Uncertainty {issue.name}")
 
         node_id = self.node_lookup[issue.id.__str__()]
-        parent_ids: list[int] = self.diagram.parents(node_id) # type: ignore
-        parent_labels = [self.diagram.variable(pid).labels() for pid in parent_ids] # type: ignore
+        cpt = self.diagram.cpt(node_id) # type: ignore
 
-        # Build all parent state combinations
-        parent_combinations = list(product(*parent_labels))
+        # the cpt variables are ordered as (child, *parents), and its array axes in reverse order
+        variable_names: list[str] = list(cpt.names) # type: ignore
+        parent_labels = [list(self.diagram.variableFromName(name).labels()) for name in variable_names[1:]] # type: ignore
+        outcome_labels = list(self.diagram.variable(node_id).labels()) # type: ignore
 
-        discrete_probability_manager = DiscreteProbabilityArrayManager(issue.uncertainty.discrete_probabilities)
+        # the labels are the option and outcome ids of the parent issues and of the uncertainty
+        discrete_probability_manager = DiscreteProbabilityArrayManager(
+            issue.uncertainty.discrete_probabilities, parent_labels, outcome_labels
+        )
+        table = self._probability_scaling(discrete_probability_manager.array)
 
-        cpt = self.diagram.cpt(node_id) # type: ignore
-        if len(parent_ids) == 0:
-            probabilities = discrete_probability_manager.get_probabilities_for_combination([])
-            probabilities = self._probability_scaling(probabilities)
-            cpt[:] = probabilities
-            return cpt
-        
-        for parent_state in parent_combinations:
-            probabilities = discrete_probability_manager.get_probabilities_for_combination(list(parent_state))
-            probabilities = self._probability_scaling(probabilities)
-            assign = {self.diagram.variable(parent_id).name(): outcome_id for parent_id, outcome_id in zip(parent_ids, parent_state)} # type: ignore
-            cpt[assign] = probabilities
+        # the table axes are (*parents, child), reverse the parent axes to match the cpt
+        parent_axes = list(range(len(parent_labels)))
+        cpt[:] = np.transpose(table, axes=parent_axes[::-1] + [len(parent_labels)])
         return cpt
-    
-    def _probability_scaling(self, probabilities: list[float], scale: bool = False):
+
+    def _probability_scaling(self, probabilities: NDArray[np.float64], scale: bool = False) -> NDArray[np.float64]:
         # always default to no scaling for now
-        if scale and len(probabilities) > 0:
-            total = sum(probabilities)
-            if total > 0:
-                probabilities = [p / total for p in probabilities]
-            else:
-                probabilities = [1.0 / len(probabilities)] * len(probabilities)
-            return probabilities
+        if scale and probabilities.shape[-1] > 0:
+            totals = probabilities.sum(axis=-1, keepdims=True)
+            uniform = np.full_like(probabilities, 1.0 / probabilities.shape[-1])
+            return np.where(totals > 0, probabilities / np.where(totals > 0, totals, 1.0), uniform)
         else: 
             return probabilities
 
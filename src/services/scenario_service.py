@@ -4,7 +4,7 @@ import asyncio
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.constants import Boundary, Type, DecisionHierarchy
+from src.constants import Boundary, Type, DecisionHierarchy, PageSize
 from src.models.scenario import Scenario
 from src.dtos.scenario_dtos import (
     ScenarioMapper,
@@ -23,6 +23,9 @@ from src.models.filters.edge_filter import EdgeFilter
 from src.models.filters.issues_filter import IssueFilter
 from src.dtos.issue_dtos import IssueOutgoingDto, IssueMapper
 from src.dtos.edge_dtos import EdgeOutgoingDto, EdgeMapper
+from src.dtos.page_dtos import PageDto
+from src.utils.field_selection import FieldSelection, SelectableFields
+from src.repositories.query_extensions import QueryExtensions
 
 from src.repositories.scenario_repository import ScenarioRepository
 from src.repositories.issue_repository import IssueRepository
@@ -34,6 +37,14 @@ from src.models.filters.scenario_filter import ScenarioFilter
 from src.domain.influence_diagram import InfluenceDiagramDOT
 
 
+SCENARIO_FIELDS = SelectableFields[Scenario](
+    ScenarioOutgoingDto,
+    QueryExtensions.scenario_field_loads,
+    ScenarioMapper.field_mappers,
+    ScenarioMapper.to_outgoing_dtos,
+)
+
+
 class ScenarioService:
     async def create(
         self,
@@ -97,39 +108,59 @@ class ScenarioService:
         session: AsyncSession,
         filter: Optional[ScenarioFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[ScenarioOutgoingDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+        selection: Optional[FieldSelection] = None,
+    ) -> PageDto[ScenarioOutgoingDto]:
         model_filter = filter.construct_filters() if filter else []
-        scenarios: list[Scenario] = await ScenarioRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        scenarios, next_cursor = await ScenarioRepository(session).get_page(
+            model_filter=model_filter,
+            odata_query=odata_query,
+            cursor=cursor,
+            take=take,
+            load_options=SCENARIO_FIELDS.load_options(selection),
         )
-        result = ScenarioMapper.to_outgoing_dtos(scenarios)
-        return result
+        result = SCENARIO_FIELDS.to_dtos(scenarios, selection)
+        return PageDto(items=result, next_cursor=next_cursor)
 
     async def get_all_populated(
         self,
         session: AsyncSession,
         filter: Optional[ScenarioFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[PopulatedScenarioDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[PopulatedScenarioDto]:
         model_filter = filter.construct_filters() if filter else []
-        scenarios: list[Scenario] = await ScenarioRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        scenarios, next_cursor = await ScenarioRepository(session).get_page(
+            model_filter=model_filter, odata_query=odata_query, cursor=cursor, take=take
         )
         result = ScenarioMapper.to_populated_dtos(scenarios)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
 
     async def get_influence_diagram_data(
         self, session: AsyncSession, scenario_id: uuid.UUID
     ) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
+        diagrams = await self.get_unvalidated_influence_diagram_data(session, [scenario_id])
+        issue_dtos, edge_dtos = diagrams[scenario_id]
+        return await self.validate_influence_diagram_data(issue_dtos, edge_dtos)
+
+    async def get_unvalidated_influence_diagram_data(
+        self, session: AsyncSession, scenario_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]]:
+        """
+        The issues and edges of the influence diagrams of the scenarios, loaded with one query
+        for the issues and one for the edges of all the scenarios.
+        """
         issue_filter = IssueFilter(
-            scenario_ids=[scenario_id],
+            scenario_ids=scenario_ids,
             boundaries=[Boundary.ON.value, Boundary.IN.value],
             types=[Type.DECISION.value, Type.UNCERTAINTY.value],
             decision_types=[DecisionHierarchy.FOCUS.value],
             is_key_uncertainties=[True],
         )
         edge_filter = EdgeFilter(
-            scenario_ids=[scenario_id],
+            scenario_ids=scenario_ids,
             issue_boundaries=[Boundary.ON.value, Boundary.IN.value],
             issue_types=[Type.DECISION.value, Type.UNCERTAINTY.value],
             decision_types=[DecisionHierarchy.FOCUS.value],
@@ -143,9 +174,19 @@ class ScenarioService:
             model_filter=edge_filter.construct_filters()
         )
 
-        issue_dtos = IssueMapper.to_outgoing_dtos(issues_entities)
-        edge_dtos = EdgeMapper.to_outgoing_dtos(edges_entities)
-        
+        diagrams: dict[uuid.UUID, tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]] = {
+            x: ([], []) for x in scenario_ids
+        }
+        for issue_dto in IssueMapper.to_outgoing_dtos(issues_entities):
+            diagrams[issue_dto.scenario_id][0].append(issue_dto)
+        for edge_dto in EdgeMapper.to_outgoing_dtos(edges_entities):
+            diagrams[edge_dto.scenario_id][1].append(edge_dto)
+        return diagrams
+
+    @staticmethod
+    async def validate_influence_diagram_data(
+        issue_dtos: list[IssueOutgoingDto], edge_dtos: list[EdgeOutgoingDto]
+    ) -> tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]]:
         # Run influence diagram creation and validation in a separate thread
         influence_diagram = await asyncio.to_thread(
             lambda: InfluenceDiagramDOT(edge_dtos, issue_dtos)
@@ -0,0 +1,118 @@
+import asyncio
+import multiprocessing
+import threading
+from typing import Optional
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from src.config import config
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.dtos.model_solution_dtos import SolutionDto
+from src.services.pyagrum_solver import PyagrumSolver
+from src.logger import get_dot_api_logger
+
+logger = get_dot_api_logger()
+
+
+class SolverQueueFullError(RuntimeError):
+    """Raised when the number of queued and running solves exceeds the configured limit."""
+
+
+class SolverTimeoutError(TimeoutError):
+    """Raised when a solve does not finish within the configured timeout."""
+
+
+def solve_influence_diagram(
+    issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]
+) -> SolutionDto:
+    """
+    Entry point executed by the pool workers, must be a module level function to be picklable.
+    """
+    return PyagrumSolver().find_optimal_decisions(issues=issues, edges=edges)
+
+
+class SolverPool:
+    """
+    Runs influence diagram solves outside of the event loop.
+    pyagrum inference is CPU-bound, so by default the solves are run in worker processes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_depth: int,
+        timeout: float,
+        use_processes: bool = True,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.timeout = timeout
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                # spawn avoids forking a process that has running threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _release(self, _: Optional[Future[SolutionDto]] = None) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    async def solve(
+        self, issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]
+    ) -> SolutionDto:
+        """
+        Solves the influence diagram exactly once in the pool.
+        If the awaiting task is cancelled, e.g. because the client disconnected,
+        a solve which has not started yet is removed from the queue. A solve that has started can
+        not be stopped, so it is counted as pending until the worker is done with it, also after
+        a timeout.
+        """
+        with self._pending_lock:
+            if self._pending >= self.max_queue_depth:
+                raise SolverQueueFullError(
+                    f"Solver queue is full ({self._pending} solves pending), try again later."
+                )
+            self._pending += 1
+
+        try:
+            job = self._get_executor().submit(
+                partial(solve_influence_diagram, issues=issues, edges=edges)
+            )
+        except Exception:
+            self._release()
+            raise
+        # called when the job is done or removed from the queue, in the thread that finished it
+        job.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise SolverTimeoutError(f"Solver did not finish within {self.timeout} seconds.")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Solver pool shut down")
+
+
+solver_pool = SolverPool(
+    max_workers=config.SOLVER_MAX_WORKERS,
+    max_queue_depth=config.SOLVER_MAX_QUEUE_DEPTH,
+    timeout=config.SOLVER_TIMEOUT,
+    use_processes=config.SOLVER_USE_PROCESSES,
+)
@@ -1,36 +1,102 @@
 import uuid
 import asyncio
-from src.services.pyagrum_solver import PyagrumSolver
+import contextlib
+from typing import Any, AsyncIterator, Optional, Union
 from src.services.scenario_service import ScenarioService
-from src.session_manager import sessionmanager
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from src.services.solver_pool import SolverPool, solver_pool
+from src.services.diagram_snapshot_service import DiagramSnapshotService
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+from src.dtos.model_solution_dtos import SolutionDto, ScenarioSolutionDto
+from src.utils.scenario_cache import ScenarioCache, create_diagram_fingerprint
+from src.config import config
 
-executor = ThreadPoolExecutor()
+# solutions are keyed by the fingerprint of the diagram they were solved for
+solution_cache: ScenarioCache[SolutionDto] = ScenarioCache(
+    name="solutions", max_size=config.SOLUTION_CACHE_MAX_SIZE
+)
+
+
+class SolverBatchTooLargeError(ValueError):
+    """Raised when more scenarios are solved in one batch than the configured maximum."""
 
 
 class SolverService:
     def __init__(
         self,
         scenario_service: ScenarioService,
+        pool: SolverPool = solver_pool,
     ):
         self.scenario_service = scenario_service
+        self.diagram_snapshot_service = DiagramSnapshotService(scenario_service)
+        self.pool = pool
 
     async def find_optimal_decision_pyagrum(self, scenario_id: uuid.UUID):
-        async for session in sessionmanager.get_session():
-            (
-                issues,
-                edges,
-            ) = await self.scenario_service.get_influence_diagram_data(session, scenario_id)
-
-        solution = PyagrumSolver().find_optimal_decisions(issues=issues, edges=edges)
-        solution = await asyncio.get_event_loop().run_in_executor(
-            executor,
-            partial(
-                PyagrumSolver().find_optimal_decisions,
-                issues=issues,
-                edges=edges,
-            ),
-        )
+        issues, edges = await self.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+        return await self._solve(scenario_id, issues, edges)
+
+    async def find_optimal_decisions_pyagrum(
+        self, scenario_ids: list[uuid.UUID]
+    ) -> AsyncIterator[ScenarioSolutionDto]:
+        """
+        Loads the diagrams of all the scenarios together, and returns the solutions in the order
+        the solves finish. The batch runs at most one solve per worker of the pool at a time, so
+        that it does not fill the queue of the other requests. A scenario that can not be solved
+        is returned with its error.
+        """
+        scenario_ids = list(dict.fromkeys(scenario_ids))
+        if len(scenario_ids) > config.SOLVER_BATCH_MAX_SCENARIOS:
+            raise SolverBatchTooLargeError(
+                f"At most {config.SOLVER_BATCH_MAX_SCENARIOS} scenarios can be solved in one batch, "
+                f"got {len(scenario_ids)}"
+            )
+        diagrams = await self.diagram_snapshot_service.get_influence_diagrams_data(scenario_ids)
+        return self._solve_as_completed(diagrams)
+
+    async def _solve_as_completed(
+        self,
+        diagrams: dict[
+            uuid.UUID, Union[tuple[list[IssueOutgoingDto], list[EdgeOutgoingDto]], Exception]
+        ],
+    ) -> AsyncIterator[ScenarioSolutionDto]:
+        slots = asyncio.Semaphore(self.pool.max_workers)
+
+        async def solve(scenario_id: uuid.UUID) -> ScenarioSolutionDto:
+            diagram = diagrams[scenario_id]
+            try:
+                if isinstance(diagram, Exception):
+                    raise diagram
+                solution = await self._solve(scenario_id, *diagram, slots=slots)
+                return ScenarioSolutionDto(scenario_id=scenario_id, solution=solution)
+            except Exception as e:
+                return ScenarioSolutionDto(scenario_id=scenario_id, error=str(e))
 
+        tasks = [asyncio.ensure_future(solve(x)) for x in diagrams]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # the client disconnected, solves that have not started are removed from the queue
+            for task in tasks:
+                task.cancel()
+
+    async def _solve(
+        self,
+        scenario_id: uuid.UUID,
+        issues: list[IssueOutgoingDto],
+        edges: list[EdgeOutgoingDto],
+        slots: Optional[asyncio.Semaphore] = None,
+    ) -> SolutionDto:
+        fingerprint = create_diagram_fingerprint(issues, edges)
+        cached_solution = solution_cache.get(fingerprint)
+        if cached_solution is not None:
+            return cached_solution
+
+        async with slots or contextlib.nullcontext():
+            solution = await self.pool.solve(issues=issues, edges=edges)
+
+        solution_cache.put(scenario_id, fingerprint, solution)
         return solution
+
+    def get_cache_statistics(self) -> dict[str, Any]:
+        return {**solution_cache.statistics(), "pending_solves": self.pool.pending}
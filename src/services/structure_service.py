@@ -1,53 +1,196 @@
 import uuid
-from typing import Optional
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+from src.config import config
 from src.services.scenario_service import ScenarioService
-from src.dtos.decision_tree_dtos import DecisionTreeDTO, PartialOrderDTO
-from src.services.decision_tree.decision_tree_creator import DecisionTreeCreator, DecisionTreeGraph
-from src.session_manager import sessionmanager
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.decision_tree_dtos import DecisionTreeDTO, PartialOrderDTO, CompressedDecisionTreeDTO
+from src.services.decision_tree.partial_order import calculate_partial_order
+from src.services.decision_tree.decision_tree_expansion import DecisionTreeExpansion
+from src.services.decision_tree.compressed_decision_tree import CompressedDecisionTree
+from src.services.decision_tree.decision_tree_size import DecisionTreeSize
+from src.services.diagram_snapshot_service import DiagramSnapshotService
+from src.utils.scenario_cache import ScenarioCache
+
+
+@dataclass
+class StructureCacheEntry:
+    """
+    The structure of one version of a scenario. The partial order is always set, the full
+    decision tree expansion and its json are added when they are first requested and are not
+    larger than STRUCTURE_CACHE_MAX_TREE_BYTES. key is set when the entry is cached.
+    """
+    partial_order: list[IssueOutgoingDto]
+    expansion: Optional[DecisionTreeExpansion] = None
+    decision_tree_json: Optional[bytes] = None
+    key: Optional[str] = None
+
+    def get_bytes(self) -> int:
+        """The size of the expansion and json, the partial order is small in comparison."""
+        expansion_bytes = self.expansion.nbytes if self.expansion is not None else 0
+        return expansion_bytes + len(self.decision_tree_json or b"")
+
+
+structure_cache: ScenarioCache[StructureCacheEntry] = ScenarioCache(
+    name="structures",
+    max_size=config.STRUCTURE_CACHE_MAX_SIZE,
+    max_bytes=config.STRUCTURE_CACHE_MAX_BYTES,
+    get_bytes=StructureCacheEntry.get_bytes,
+)
+
+
+def update_structure(scenario_id: uuid.UUID, entry: StructureCacheEntry) -> None:
+    """Puts the entry again after it has grown, so it is counted in the size of the cache."""
+    if entry.key is not None:
+        structure_cache.put(scenario_id, entry.key, entry)
+
+
+def cache_json(
+    scenario_id: uuid.UUID, entry: StructureCacheEntry, chunks: Iterator[bytes]
+) -> Iterator[bytes]:
+    """Passes the chunks on and keeps the json in the entry when the whole tree is small enough."""
+    cached: Optional[list[bytes]] = []
+    size = 0
+    for chunk in chunks:
+        if cached is not None:
+            size += len(chunk)
+            if size <= config.STRUCTURE_CACHE_MAX_TREE_BYTES:
+                cached.append(chunk)
+            else:
+                cached = None
+        yield chunk
+    if cached is not None:
+        entry.decision_tree_json = b"".join(cached)
+        update_structure(scenario_id, entry)
+
 
 class StructureService:
     def __init__(self, scenario_service: ScenarioService):
         self.scenario_service=scenario_service
+        self.diagram_snapshot_service = DiagramSnapshotService(scenario_service)
+
+    async def create_decision_tree_expansion(
+        self,
+        scenario_id: uuid.UUID,
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+        roll_back: bool = False,
+    ) -> DecisionTreeExpansion:
+        """
+        The subtree at path, a list of option and outcome ids from the root, expanded depth levels down.
+        Only the requested levels are expanded, the whole tree when neither is given.
+        With roll_back the expected values are computed on the compressed subtree to the endpoints.
+        """
+        structure = await self.get_structure(scenario_id)
+        partial_order_issues = structure.partial_order
+        if not path and depth is None and not roll_back and structure.expansion is not None:
+            return structure.expansion
+
+        def expand() -> DecisionTreeExpansion:
+            rolled_back = None
+            if roll_back:
+                rolled_back = CompressedDecisionTree(scenario_id, partial_order_issues, path)
+                rolled_back.roll_back()
+            return DecisionTreeExpansion(
+                scenario_id, partial_order_issues, path, depth, rolled_back
+            )
+
+        # the expansion is cpu bound, so it runs in a worker thread to keep the event loop responsive
+        expansion = await asyncio.to_thread(expand)
+        if (not path and depth is None and not roll_back
+                and expansion.nbytes <= config.STRUCTURE_CACHE_MAX_TREE_BYTES):
+            structure.expansion = expansion
+            update_structure(scenario_id, structure)
+        return expansion
+
+    async def stream_decision_tree(
+        self,
+        scenario_id: uuid.UUID,
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+        roll_back: bool = False,
+    ) -> Iterator[bytes]:
+        """
+        The json of the subtree in chunks. The json of the full tree is served from the structure
+        cache once it has been written, unless it is larger than STRUCTURE_CACHE_MAX_TREE_BYTES.
+        """
+        if path or depth is not None or roll_back:
+            expansion = await self.create_decision_tree_expansion(
+                scenario_id, path, depth, roll_back
+            )
+            return expansion.iter_json()
+        structure = await self.get_structure(scenario_id)
+        if structure.decision_tree_json is not None:
+            return iter([structure.decision_tree_json])
+        expansion = await self.create_decision_tree_expansion(scenario_id)
+        return cache_json(scenario_id, structure, expansion.iter_json())
+
+    async def create_compressed_decision_tree(
+        self,
+        scenario_id: uuid.UUID,
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+        roll_back: bool = False,
+    ) -> Optional[CompressedDecisionTreeDTO]:
+        """The subtree as create_decision_tree_expansion, with identical subtrees stored once."""
+        partial_order_issues = (await self.get_structure(scenario_id)).partial_order
+
+        def compress() -> Optional[CompressedDecisionTreeDTO]:
+            if not roll_back:
+                return CompressedDecisionTree(
+                    scenario_id, partial_order_issues, path, depth
+                ).to_compressed_decision_tree_dto()
+            # rolling back needs the tree to the endpoints, it is cut to depth afterwards
+            compressed = CompressedDecisionTree(scenario_id, partial_order_issues, path)
+            compressed.roll_back()
+            return compressed.to_compressed_decision_tree_dto(depth)
+
+        return await asyncio.to_thread(compress)
+
+    async def get_decision_tree_size(
+        self,
+        scenario_id: uuid.UUID,
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+    ) -> DecisionTreeSize:
+        """The size of the subtree, counted from the partial order without expanding it."""
+        partial_order_issues = (await self.get_structure(scenario_id)).partial_order
+        return DecisionTreeSize(partial_order_issues, path, depth)
+
+    async def get_structure(self, scenario_id: uuid.UUID) -> StructureCacheEntry:
+        """
+        The cached structure of the current version of the scenario, so the structure endpoints
+        share one computation of the partial order until the diagram changes. Entries of older
+        versions are dropped by the session commit hooks and never match the new version.
+        """
+        version = await self.diagram_snapshot_service.get_version(scenario_id)
+        key = f"{scenario_id}:{version}"
+        structure = structure_cache.get(key) if version is not None else None
+        if structure is None:
+            structure = StructureCacheEntry(await self.get_partial_order_issues(scenario_id))
+            if version is not None:
+                structure.key = key
+                structure_cache.put(scenario_id, key, structure)
+        return structure
+
+    def get_cache_statistics(self) -> dict[str, Any]:
+        return structure_cache.statistics()
+
+    async def get_partial_order_issues(self, scenario_id: uuid.UUID) -> list[IssueOutgoingDto]:
+        issues, edges = await self.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+        return calculate_partial_order(issues, edges)
 
-    async def create_decision_tree(self, scenario_id: uuid.UUID) -> DecisionTreeGraph :
-        issues = []
-        edges = []
-        async for session in sessionmanager.get_session():
-            (
-                issues,
-                edges,
-            ) = await self.scenario_service.get_influence_diagram_data(session, scenario_id)
-        decision_tree_creator = await DecisionTreeCreator.initialize(scenario_id = scenario_id,
-                                            nodes = issues,
-                                            edges = edges)
-        return await decision_tree_creator.create_decision_tree()
-
-
-    async def create_decision_tree_dtos(self, scenario_id: uuid.UUID) -> Optional[DecisionTreeDTO]:
-        issues = []
-        edges = []
-        async for session in sessionmanager.get_session():
-            (
-                issues,
-                edges,
-            ) = await self.scenario_service.get_influence_diagram_data(session, scenario_id)
-        decision_tree_creator = await DecisionTreeCreator.initialize(scenario_id = scenario_id,
-                                            nodes = issues,
-                                            edges = edges)
-        dt = await decision_tree_creator.create_decision_tree()
-        return await dt.to_issue_dtos()
-    
+    async def create_decision_tree_dtos(
+        self,
+        scenario_id: uuid.UUID,
+        path: Optional[list[uuid.UUID]] = None,
+        depth: Optional[int] = None,
+        roll_back: bool = False,
+    ) -> Optional[DecisionTreeDTO]:
+        expansion = await self.create_decision_tree_expansion(scenario_id, path, depth, roll_back)
+        return await asyncio.to_thread(expansion.to_decision_tree_dto)
 
     async def create_partial_order(self, scenario_id: uuid.UUID) -> Optional[PartialOrderDTO]:
-        issues = []
-        edges = []
-        async for session in sessionmanager.get_session():
-            (
-                issues,
-                edges,
-            ) = await self.scenario_service.get_influence_diagram_data(session, scenario_id)
-        decision_tree_creator = await DecisionTreeCreator.initialize(scenario_id = scenario_id,
-                                            nodes = issues,
-                                            edges = edges)
-        uuid_list = await decision_tree_creator.calculate_partial_order()
-        return PartialOrderDTO(issue_ids=uuid_list)
\ No newline at end of file
+        structure = await self.get_structure(scenario_id)
+        return PartialOrderDTO(issue_ids=[x.id for x in structure.partial_order])
\ No newline at end of file
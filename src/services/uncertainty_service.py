@@ -3,6 +3,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.uncertainty import Uncertainty
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.uncertainty_dtos import (
     UncertaintyIncomingDto,
     UncertaintyOutgoingDto,
@@ -43,10 +45,14 @@ class UncertaintyService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[UncertaintyOutgoingDto]:
-        decisions: list[Uncertainty] = await UncertaintyRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[UncertaintyOutgoingDto]:
+        decisions, next_cursor = await UncertaintyRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = UncertaintyMapper.to_outgoing_dtos(decisions)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -4,6 +4,8 @@ from src.auth.auth import verify_token
 from fastapi import Depends
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.dtos.page_dtos import PageDto
+from src.constants import PageSize
 from src.dtos.user_dtos import (
     UserMapper,
     UserIncomingDto,
@@ -31,13 +33,15 @@ class UserService:
         session: AsyncSession,
         filter: Optional[UserFilter] = None,
         odata_query: Optional[str] = None,
-    ) -> list[UserOutgoingDto]:
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[UserOutgoingDto]:
         model_filter = filter.construct_filters() if filter else []
-        users: list[User] = await UserRepository(session).get_all(
-            model_filter=model_filter, odata_query=odata_query
+        users, next_cursor = await UserRepository(session).get_page(
+            model_filter=model_filter, odata_query=odata_query, cursor=cursor, take=take
         )
         result = UserMapper.to_outgoing_dtos(users)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
 
     async def get_by_azure_id(
         self, session: AsyncSession, azure_id: str
@@ -3,6 +3,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.utility import Utility
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.utility_dtos import (
     UtilityIncomingDto,
     UtilityOutgoingDto,
@@ -41,8 +43,12 @@ class UtilityService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[UtilityOutgoingDto]:
-        entities: list[Utility] = await UtilityRepository(session).get_all(odata_query=odata_query)
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[UtilityOutgoingDto]:
+        entities, next_cursor = await UtilityRepository(session).get_page(odata_query=odata_query, cursor=cursor, take=take)
         result = UtilityMapper.to_outgoing_dtos(entities)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -3,6 +3,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.value_metric import ValueMetric
+from src.constants import PageSize
+from src.dtos.page_dtos import PageDto
 from src.dtos.value_metric_dtos import (
     ValueMetricIncomingDto,
     ValueMetricOutgoingDto,
@@ -43,10 +45,14 @@ class ValueMetricService:
         return result
 
     async def get_all(
-        self, session: AsyncSession, odata_query: Optional[str] = None
-    ) -> list[ValueMetricOutgoingDto]:
-        entities: list[ValueMetric] = await ValueMetricRepository(session).get_all(
-            odata_query=odata_query
+        self,
+        session: AsyncSession,
+        odata_query: Optional[str] = None,
+        cursor: Optional[str] = None,
+        take: int = PageSize.PAGE_DEFAULT,
+    ) -> PageDto[ValueMetricOutgoingDto]:
+        entities, next_cursor = await ValueMetricRepository(session).get_page(
+            odata_query=odata_query, cursor=cursor, take=take
         )
         result = ValueMetricMapper.to_outgoing_dtos(entities)
-        return result
+        return PageDto(items=result, next_cursor=next_cursor)
@@ -78,6 +78,7 @@ class SessionManager:
                 max_overflow=config.MAX_OVERFLOW,
                 pool_pre_ping=True,
                 pool_recycle=config.POOL_RECYCLE,
+                fast_executemany=config.DB_FAST_EXECUTEMANY,
                 echo=config.DEBUG,
             )
         else:
@@ -90,6 +91,7 @@ class SessionManager:
                 connect_args={"attrs_before": token_dict},
                 pool_pre_ping=True,
                 pool_recycle=config.POOL_RECYCLE,
+                fast_executemany=config.DB_FAST_EXECUTEMANY,
                 echo=config.DEBUG,
             )
 
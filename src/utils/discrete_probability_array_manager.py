@@ -1,86 +1,181 @@
-import xarray as xr
-from typing import List
+import uuid
+import numpy as np
+from numpy.typing import NDArray
+from typing import Iterable, List, Optional, Sequence, Union
 
 from src.dtos.discrete_probability_dtos import DiscreteProbabilityOutgoingDto
 
+StateId = Union[uuid.UUID, str]
+
+
 class DiscreteProbabilityArrayManager:
     """
-    Manages a multidimensional array of discrete probabilities using xarray.
+    Manages the probability table of an uncertainty as a dense NumPy array.
+
+    Every parent issue is an axis of the array, and the position along the axis is the index
+    of the parent state (option/outcome id) in parent_ids. The last axis holds the outcomes
+    of the uncertainty in the order of outcome_ids.
     """
-    PARENT_IDS_DIM = 'parent_ids'
-    OUTCOMES_DIM = 'outcomes'
-    PROBABILITY_GRID_NAME = 'probability_grid'
-    PARENT_SEPARATOR = ','
-    all_parent_ids: set[str] = set()
-    
-    def __init__(self, probabilities: List[DiscreteProbabilityOutgoingDto]) -> None:
-        self.array: xr.DataArray = self.create_xarray_grid(probabilities)
-    
-    def _create_parents_label(self, parents: List[str]|tuple[str]|set[str]):
+
+    def __init__(
+        self,
+        probabilities: List[DiscreteProbabilityOutgoingDto],
+        parent_states: Sequence[Sequence[StateId]],
+        outcome_ids: Sequence[StateId],
+    ) -> None:
+        """
+        parent_states holds the options or outcomes of every parent issue, and outcome_ids the
+        outcomes of the uncertainty, these are the axes of the table.
+        Raises ValueError when a probability refers to a parent state that is not on an axis.
+        """
+        self.uncertainty_id: Optional[uuid.UUID] = probabilities[0].uncertainty_id if probabilities else None
+        self.option_ids: set[uuid.UUID] = {x for p in probabilities for x in p.parent_option_ids}
+
+        self.parent_ids: list[list[uuid.UUID]] = [[self._as_uuid(x) for x in axis] for axis in parent_states]
+        self.outcome_ids: list[uuid.UUID] = [self._as_uuid(x) for x in outcome_ids]
+        self.parent_axes: dict[uuid.UUID, tuple[int, int]] = {
+            state_id: (axis, position)
+            for axis, states in enumerate(self.parent_ids)
+            for position, state_id in enumerate(states)
+        }
+        self.outcome_index: dict[uuid.UUID, int] = {x: n for n, x in enumerate(self.outcome_ids)}
+
+        self.shape = tuple(len(x) for x in self.parent_ids) + (len(self.outcome_ids),)
+        self.array: NDArray[np.float64] = np.zeros(self.shape, dtype=np.float64)
+        # ids of the discrete probabilities, needed to convert the table back to dtos
+        self.probability_ids: NDArray[np.object_] = np.full(self.shape, None, dtype=np.object_)
+        self._fill(probabilities)
+
+    @staticmethod
+    def _as_uuid(state_id: StateId) -> uuid.UUID:
+        return state_id if isinstance(state_id, uuid.UUID) else uuid.UUID(state_id)
+
+    def _get_parent_position(self, state_id: StateId) -> tuple[int, int]:
+        """The axis and the position on the axis of the parent state."""
+        position = self.parent_axes.get(self._as_uuid(state_id))
+        if position is None:
+            raise ValueError(
+                f"State {state_id} is not a state of a parent of uncertainty {self.uncertainty_id}"
+            )
+        return position
+
+    def _fill(self, probabilities: List[DiscreteProbabilityOutgoingDto]) -> None:
         """
-        Create a unique label for a combination of parent IDs.
+        Resolves the position of every row and assigns all rows with a single indexing operation.
+        Rows which do not give a state for every parent are assigned to all states of that parent.
         """
-        return f"{self.PARENT_SEPARATOR.join(sorted(parents))}"
-    
-    def create_xarray_grid(self, probabilities: List[DiscreteProbabilityOutgoingDto]) -> xr.DataArray:
+        complete_rows: list[list[int]] = []
+        complete_values: list[float] = []
+        complete_ids: list[uuid.UUID] = []
+        for probability in probabilities:
+            outcome = self.outcome_index.get(probability.outcome_id)
+            if outcome is None:
+                continue
+            index: list[int] = [-1] * len(self.parent_ids)
+            for parent in (*probability.parent_outcome_ids, *probability.parent_option_ids):
+                axis, position = self._get_parent_position(parent)
+                index[axis] = position
+            if -1 in index:
+                partial_index = tuple(slice(None) if x == -1 else x for x in index) + (outcome,)
+                self.array[partial_index] = probability.probability or 0.0
+                self.probability_ids[partial_index] = probability.id
+                continue
+            index.append(outcome)
+            complete_rows.append(index)
+            complete_values.append(probability.probability or 0.0)
+            complete_ids.append(probability.id)
+
+        if complete_rows:
+            positions = tuple(np.array(complete_rows, dtype=np.intp).T)
+            self.array[positions] = complete_values
+            self.probability_ids[positions] = complete_ids
+
+    def get_index(self, parents: Iterable[StateId]) -> tuple[Union[int, slice], ...]:
         """
-        Create an xarray DataArray to hold probabilities based on parent outcome combinations and child outcomes.
+        Index of the rows matching the given parent states, axes without a given state are selected
+        entirely. Raises ValueError for a state that is not a state of a parent.
         """
-        self.all_parent_ids = set()
-        if not probabilities:
-            return xr.DataArray([])
-        
-        # Get all unique child outcomes
-        outcomes = sorted(set(p.outcome_id.__str__() for p in probabilities))
-        
-        # Create parent combinations
-        parent_labels: list[str] = []
-        probability_dict: dict[tuple[str, str], float] = {}
-        
-        for prob in probabilities:
-            parent_ids = [id.__str__() for id in prob.parent_outcome_ids]+[id.__str__() for id in prob.parent_option_ids]
-            self.all_parent_ids.update(parent_ids)
-            parent_label = self._create_parents_label(parent_ids)
-            if parent_label not in parent_labels:
-                parent_labels.append(parent_label)
-            
-            probability_dict[(parent_label, prob.outcome_id.__str__())] = prob.probability
-        
-        # Sort parent combinations for consistency
-        parent_labels = sorted(parent_labels)
-        
-        # Create the data array
-        data: List[List[float]] = []
-        for parent_label in parent_labels:
-            row: list[float] = []
-            for outcome in outcomes:
-                probability = probability_dict.get((parent_label, outcome), 0.0)
-                row.append(probability)
-            data.append(row)
-        
-        # Create xarray DataArray
-        self.array = xr.DataArray(
-            data,
-            dims=[self.PARENT_IDS_DIM, self.OUTCOMES_DIM],
-            coords={
-                self.PARENT_IDS_DIM: parent_labels,
-                self.OUTCOMES_DIM: outcomes
-            },
-            name=self.PROBABILITY_GRID_NAME
-        )
-        
-        return self.array
-    
-    def get_probabilities_for_combination(self, parents: List[str]|tuple[str]|set[str]) -> list[float]:
+        index: list[Union[int, slice]] = [slice(None)] * len(self.parent_ids)
+        for parent in parents:
+            axis, position = self._get_parent_position(parent)
+            index[axis] = position
+        return tuple(index)
+
+    def get_probabilities_for_combination(self, parents: Iterable[StateId]) -> list[float]:
         """
         Retrieve probabilities for a given combination of parent IDs.
         """
-        parents = self._filter_to_parent_ids(parents)
-        return self.array.sel(**{self.PARENT_IDS_DIM: self._create_parents_label(parents)}).values.tolist()
-    
-    def _filter_to_parent_ids(self, parents: List[str]|tuple[str]|set[str]) -> List[str]:
+        return self.array[self.get_index(parents)].tolist()
+
+    def get_rows(self) -> tuple[list[tuple[uuid.UUID, ...]], NDArray[np.float64]]:
+        """
+        Retrieve all rows at once, as the parent state combinations and a (combinations, outcomes) array.
+        The combinations are ordered as the rows of the array.
+        """
+        combinations = [
+            tuple(self.parent_ids[axis][position] for axis, position in enumerate(index))
+            for index in np.ndindex(*self.shape[:-1])
+        ]
+        return combinations, self.array.reshape(-1, self.shape[-1])
+
+    def get_probability_table(
+        self, parent_labels: Sequence[Sequence[StateId]], outcome_labels: Sequence[StateId]
+    ) -> NDArray[np.float64]:
+        """
+        Retrieve the full probability table as one array with shape (*parent state counts, outcome count).
+        Axes and states follow the order of parent_labels and outcome_labels. Every parent has to
+        be given once with all of its states, and all the outcomes, otherwise ValueError is raised.
+        """
+        if len(parent_labels) != len(self.parent_ids):
+            raise ValueError(
+                f"Uncertainty {self.uncertainty_id} has {len(self.parent_ids)} parents, "
+                f"{len(parent_labels)} were requested"
+            )
+        axes: list[int] = []
+        selectors: list[list[int]] = []
+        for labels in parent_labels:
+            positions = [self._get_parent_position(x) for x in labels]
+            axis = positions[0][0] if positions else -1
+            if (
+                any(x[0] != axis for x in positions)
+                or axis in axes
+                or len(set(positions)) != len(self.parent_ids[axis])
+            ):
+                raise ValueError(
+                    f"The states {[str(x) for x in labels]} are not all the states of one parent "
+                    f"of uncertainty {self.uncertainty_id}"
+                )
+            axes.append(axis)
+            selectors.append([x[1] for x in positions])
+        outcome_indices = [self.outcome_index.get(self._as_uuid(x)) for x in outcome_labels]
+        if None in outcome_indices or len(set(outcome_indices)) != len(self.outcome_ids):
+            raise ValueError(
+                f"The outcomes {[str(x) for x in outcome_labels]} are not the outcomes of "
+                f"uncertainty {self.uncertainty_id}"
+            )
+
+        table = np.transpose(self.array, axes + [len(axes)])
+        return table[np.ix_(*selectors, outcome_indices)]  # type: ignore
+
+    def to_dtos(self) -> List[DiscreteProbabilityOutgoingDto]:
         """
-        Filter the input parents to only include those that are in the set of all parent IDs.
+        Convert the table to discrete probability dtos, one for each combination and outcome.
         """
-        parents = set(parents)
-        return [p for p in parents if p in self.all_parent_ids]
\ No newline at end of file
+        if self.uncertainty_id is None:
+            return []
+        combinations, rows = self.get_rows()
+        ids = self.probability_ids.reshape(-1, self.shape[-1])
+        dtos: List[DiscreteProbabilityOutgoingDto] = []
+        for combination, row, row_ids in zip(combinations, rows.tolist(), ids.tolist()):
+            for outcome_id, probability, probability_id in zip(self.outcome_ids, row, row_ids):
+                dtos.append(
+                    DiscreteProbabilityOutgoingDto(
+                        id=probability_id if probability_id is not None else uuid.uuid4(),
+                        uncertainty_id=self.uncertainty_id,
+                        outcome_id=outcome_id,
+                        probability=probability,
+                        parent_outcome_ids=[x for x in combination if x not in self.option_ids],
+                        parent_option_ids=[x for x in combination if x in self.option_ids],
+                    )
+                )
+        return dtos
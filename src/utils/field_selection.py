@@ -0,0 +1,138 @@
+from functools import lru_cache
+from typing import Any, Callable, Generic, Optional, Sequence, Type, TypeVar, get_args
+from pydantic import BaseModel, create_model
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.strategy_options import _AbstractLoad  # type: ignore
+
+E = TypeVar("E")
+PageT = TypeVar("PageT", bound=BaseModel)
+
+
+class InvalidFieldSelectionError(ValueError):
+    """Raised when fields or expand name something that is not part of the dto."""
+
+
+class FieldSelection(BaseModel):
+    """
+    The parts of a dto requested by the caller. fields selects the plain fields and expand the relationships,
+    if neither is given the complete dto is returned.
+    """
+
+    fields: Optional[list[str]] = None
+    expand: Optional[list[str]] = None
+
+    @staticmethod
+    def parse(fields: Optional[str], expand: Optional[str]) -> "FieldSelection":
+        return FieldSelection(
+            fields=[x.strip() for x in fields.split(",") if x.strip()] if fields is not None else None,
+            expand=[x.strip() for x in expand.split(",") if x.strip()] if expand is not None else None,
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        return self.fields is None and self.expand is None
+
+    def to_response(self, page: PageT) -> PageT:
+        """
+        Slim dtos are serialized as they are, the routes declare them as SelectedFieldsPageDto.
+        """
+        if self.is_complete:
+            return page
+        return JSONResponse(page.model_dump(mode="json", serialize_as_any=True))  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def slim_dto_class(dto_class: Type[BaseModel], names: tuple[str, ...]) -> Type[BaseModel]:
+    """A copy of dto_class with only the given fields."""
+    return create_model(  # type: ignore
+        f"{dto_class.__name__}Slim",
+        **{name: (dto_class.model_fields[name].annotation, ...) for name in names},
+    )
+
+
+def is_relationship(annotation: Any) -> bool:
+    """Fields holding other dtos are relationships, including optional fields and lists of dtos."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(is_relationship(x) for x in get_args(annotation))
+
+
+class SelectableFields(Generic[E]):
+    """
+    Describes how a partial dto is loaded and mapped, the complete dto is mapped with to_outgoing_dtos.
+    field_loads gives the loader options needed by a field, which is every relationship field and
+    the plain fields read through a relationship, and field_mappers maps the fields that are not
+    plain attributes of the entity.
+    """
+
+    def __init__(
+        self,
+        dto_class: Type[BaseModel],
+        field_loads: Callable[[], dict[str, list[_AbstractLoad]]],
+        field_mappers: Callable[[], dict[str, Callable[[E], Any]]],
+        to_outgoing_dtos: Callable[[list[E]], Sequence[BaseModel]],
+    ):
+        self.dto_class = dto_class
+        self.field_loads = field_loads
+        self.field_mappers = field_mappers
+        self.to_outgoing_dtos = to_outgoing_dtos
+
+    # properties as the dtos with forward references are completed after this is created
+    @property
+    def relationships(self) -> list[str]:
+        return [x for x, field in self.dto_class.model_fields.items() if is_relationship(field.annotation)]
+
+    @property
+    def plain_fields(self) -> list[str]:
+        return [x for x in self.dto_class.model_fields if x not in self.relationships]
+
+    def names(self, selection: FieldSelection) -> tuple[str, ...]:
+        """
+        The selected fields in the order of the dto, raises InvalidFieldSelectionError on unknown names
+        and when nothing is selected.
+        """
+        plain_fields, relationships = self.plain_fields, self.relationships
+        for name in selection.fields or []:
+            if name not in plain_fields:
+                raise InvalidFieldSelectionError(
+                    f"Unknown field '{name}', expected one of: {', '.join(plain_fields)}"
+                )
+        for name in selection.expand or []:
+            if name not in relationships:
+                raise InvalidFieldSelectionError(
+                    f"Unknown relationship '{name}', expected one of: {', '.join(relationships)}"
+                )
+
+        selected = set(selection.fields if selection.fields is not None else plain_fields)
+        selected.update(selection.expand or [])
+        if not selected:
+            raise InvalidFieldSelectionError("No fields selected, give at least one field or relationship")
+        return tuple(x for x in self.dto_class.model_fields if x in selected)
+
+    def load_options(self, selection: Optional[FieldSelection]) -> Optional[list[_AbstractLoad]]:
+        """
+        Loads what the selected fields need, any other relationship raises instead of being lazy loaded.
+        None when the complete dto is selected, so the repository loads all relationships.
+        """
+        if selection is None or selection.is_complete:
+            return None
+        field_loads = self.field_loads()
+        options = [option for name in self.names(selection) for option in field_loads.get(name, [])]
+        return options + [raiseload("*")]
+
+    def to_dtos(self, entities: list[E], selection: Optional[FieldSelection]) -> Sequence[BaseModel]:
+        if selection is None or selection.is_complete:
+            return self.to_outgoing_dtos(entities)
+        names = self.names(selection)
+        dto_class = slim_dto_class(self.dto_class, names)
+        field_mappers = self.field_mappers()
+        return [
+            dto_class(
+                **{
+                    name: field_mappers[name](entity) if name in field_mappers else getattr(entity, name)
+                    for name in names
+                }
+            )
+            for entity in entities
+        ]
@@ -0,0 +1,30 @@
+import json
+import uuid
+import base64
+import binascii
+from datetime import datetime
+from typing import Union
+
+CursorId = Union[int, uuid.UUID]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor was not created by encode_cursor."""
+
+
+def encode_cursor(created_at: datetime, id: CursorId) -> str:
+    """
+    Opaque cursor pointing at the position of an entity in the (created_at, id) ordering.
+    """
+    payload = {"c": created_at.isoformat(), "i": id if isinstance(id, int) else str(id)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, CursorId]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = datetime.fromisoformat(payload["c"])
+        id: CursorId = payload["i"] if isinstance(payload["i"], int) else uuid.UUID(payload["i"])
+        return created_at, id
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
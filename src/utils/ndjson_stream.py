@@ -0,0 +1,35 @@
+from typing import AsyncIterator, Callable, Optional, Sequence
+from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.session_manager import sessionmanager
+from src.logger import get_dot_api_logger
+
+logger = get_dot_api_logger()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def accepts_ndjson(accept: Optional[str]) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def ndjson_response(
+    batches: Callable[[AsyncSession], AsyncIterator[Sequence[BaseModel]]],
+) -> StreamingResponse:
+    """
+    Streams the dtos as newline delimited json, one line per dto, while the batches are read from the database.
+    The stream runs after the route has returned, so it uses its own session.
+    """
+
+    async def body() -> AsyncIterator[str]:
+        async for session in sessionmanager.get_session():
+            try:
+                async for dtos in batches(session):
+                    yield "".join(dto.model_dump_json() + "\n" for dto in dtos)
+            except Exception as e:
+                # the status code has already been sent, so the stream can only be cut short
+                logger.error(f"Streamed response failed: {e}")
+                raise
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,136 @@
+import uuid
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.edge_dtos import EdgeOutgoingDto
+
+V = TypeVar("V")
+
+
+class ScenarioCache(Generic[V]):
+    """
+    Bounded LRU cache where every entry belongs to a scenario.
+    Entries are invalidated per scenario by the session commit hooks,
+    see invalidate_scenario_caches. With max_bytes the entries are also bounded by their total
+    size as measured by get_bytes when they are put, put an entry again after it has grown.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        max_bytes: Optional[int] = None,
+        get_bytes: Optional[Callable[[V], int]] = None,
+    ) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.get_bytes = get_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries: OrderedDict[str, tuple[uuid.UUID, V]] = OrderedDict()
+        self._entry_bytes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        _scenario_caches.append(self)
+
+    def get(self, key: str) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, scenario_id: uuid.UUID, key: str, value: V) -> None:
+        entry_bytes = self.get_bytes(value) if self.get_bytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (scenario_id, value)
+            self._entry_bytes[key] = entry_bytes
+            self.bytes += entry_bytes
+            while len(self._entries) > self.max_size or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        """Removes the entry if it exists, the lock must be held."""
+        if self._entries.pop(key, None) is not None:
+            self.bytes -= self._entry_bytes.pop(key)
+
+    def invalidate(self, scenario_ids: Iterable[uuid.UUID]) -> None:
+        scenario_ids = set(scenario_ids)
+        if not scenario_ids:
+            return
+        with self._lock:
+            keys = [key for key, (scenario_id, _) in self._entries.items() if scenario_id in scenario_ids]
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._entry_bytes.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_scenario_caches: list[ScenarioCache[Any]] = []
+
+
+def invalidate_scenario_caches(scenario_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Drop the entries of the given scenarios from every ScenarioCache instance.
+    """
+    scenario_ids = set(scenario_ids)
+    for cache in _scenario_caches:
+        cache.invalidate(scenario_ids)
+
+
+def create_diagram_fingerprint(issues: list[IssueOutgoingDto], edges: list[EdgeOutgoingDto]) -> str:
+    """
+    Canonical hash of the parts of an influence diagram that affect a solution:
+    issues with their states and utilities, the probability tables and the edges.
+    Option names are included as they are part of the returned solution, while issue
+    names, descriptions, positions and the ordering of the input lists are not.
+    """
+    hasher = hashlib.sha256()
+    for issue in sorted(issues, key=lambda x: x.id.__str__()):
+        hasher.update(f"I|{issue.id}|{issue.type}".encode())
+        if issue.decision is not None:
+            for option in sorted(issue.decision.options, key=lambda x: x.id.__str__()):
+                hasher.update(f"O|{option.id}|{option.name}|{option.utility!r}".encode())
+        if issue.uncertainty is not None:
+            for outcome in sorted(issue.uncertainty.outcomes, key=lambda x: x.id.__str__()):
+                hasher.update(f"U|{outcome.id}|{outcome.utility!r}".encode())
+            rows = sorted(
+                (
+                    dp.outcome_id.__str__(),
+                    ",".join(sorted(x.__str__() for x in [*dp.parent_outcome_ids, *dp.parent_option_ids])),
+                    repr(dp.probability),
+                )
+                for dp in issue.uncertainty.discrete_probabilities
+            )
+            for row in rows:
+                hasher.update(f"P|{'|'.join(row)}".encode())
+    for tail_id, head_id in sorted((x.tail_issue_id.__str__(), x.head_issue_id.__str__()) for x in edges):
+        hasher.update(f"E|{tail_id}|{head_id}".encode())
+    return hasher.hexdigest()
@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 
 class SessionInfo(BaseModel):
     affected_uncertainties: set[uuid.UUID] = Field(default_factory=set) # type: ignore
+    affected_scenarios: set[uuid.UUID] = Field(default_factory=set) # type: ignore
+    stale_snapshots: set[uuid.UUID] = Field(default_factory=set) # type: ignore
 
 class SessionInfoHandler:
     @staticmethod
@@ -1,30 +1,27 @@
 import uuid
+from src.domain.disjoint_set import DisjointSet
 
 def join_sets_with_common_elements(sets: list[set[uuid.UUID]]) -> list[set[uuid.UUID]]:
-    if not sets:
-        return []
-    
-    # Create a copy to avoid modifying the original
-    sets = [set(s) for s in sets]
-    
-    # Keep merging until no more merges are possible
-    changed = True
-    while changed:
-        changed = False
-        i = 0
-        while i < len(sets):
-            j = i + 1
-            while j < len(sets):
-                # Check if sets i and j have common elements
-                if sets[i] & sets[j]:
-                    # Merge set j into set i
-                    sets[i] |= sets[j]
-                    # Remove set j
-                    sets.pop(j)
-                    changed = True
-                    # Don't increment j since we removed an element
-                else:
-                    j += 1
-            i += 1
-    
-    return sets
+    """
+    Merges the sets that share elements, directly or through other sets. The merged sets are
+    ordered by the first of their sets. The elements are grouped with a DisjointSet, so this is
+    near-linear in the total size of the sets instead of comparing every pair of sets.
+    """
+    disjoint_set: DisjointSet[uuid.UUID] = DisjointSet()
+    for elements in sets:
+        first = next(iter(elements), None)
+        for element in elements:
+            disjoint_set.union(first, element)  # type: ignore
+
+    joined: dict[uuid.UUID, set[uuid.UUID]] = {}
+    result: list[set[uuid.UUID]] = []
+    for elements in sets:
+        if not elements:
+            result.append(set())
+            continue
+        root = disjoint_set.find(next(iter(elements)))
+        if root not in joined:
+            joined[root] = set()
+            result.append(joined[root])
+        joined[root] |= elements
+    return result
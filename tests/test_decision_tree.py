@@ -1,10 +1,25 @@
+import json
+import uuid
+import asyncio
 import pytest
+from typing import Any, Optional
 from httpx import AsyncClient
 from src.seed_database import GenerateUuid
-from src.services.decision_tree.decision_tree_creator import DecisionTreeGraph
-from src.dtos.decision_tree_dtos import EdgeUUIDDto
-from src.session_manager import sessionmanager
-from src.dependencies import get_scenario_service, get_structure_service
+from src.services.decision_tree.partial_order import calculate_partial_order
+from src.services.decision_tree.decision_tree_expansion import DecisionTreeExpansion, get_branch_ids
+from src.services.decision_tree.probability_index import ProbabilityIndex
+from src.services.decision_tree.compressed_decision_tree import CompressedDecisionTree
+from src.services.decision_tree.decision_tree_size import DecisionTreeSize
+from src.dtos.decision_tree_dtos import DecisionTreeDTO, TreeNodeDto, CompressedDecisionTreeDTO, DecisionTreeSizeDTO, EndPointNodeDto, ProbabilityDto
+from src.dtos.issue_dtos import IssueOutgoingDto
+from src.dtos.discrete_probability_dtos import DiscreteProbabilityOutgoingDto
+from src.dtos.option_dtos import OptionIncomingDto
+from src.constants import Type
+from src.domain.diagram_model import DiagramModel
+from src.domain.influence_diagram import InfluenceDiagramDOT
+from src.config import config
+from src.constants import DecisionTreeMode
+from src.dependencies import get_structure_service
 
 @pytest.mark.asyncio
 async def test_decision_tree_endpoint(client: AsyncClient):
@@ -12,43 +27,485 @@ async def test_decision_tree_endpoint(client: AsyncClient):
     response = await client.get(f"/structure/{scenario_id}/decision_tree")
     assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
 
+def decision_tree_to_comparable(dto: Optional[DecisionTreeDTO]) -> Optional[dict[str, Any]]:
+    if dto is None:
+        return None
+    result: dict[str, Any] = dto.model_dump(mode="json")
+    stack = [result]
+    while stack:
+        node = stack.pop()
+        if node["tree_node"]["issue"].get("type") == "EndPoint":
+            # endpoint issues are given random ids
+            node["tree_node"]["issue"].pop("id")
+        stack += node["children"] or []
+    return result
+
+
+def add_discrete_probabilities(issues: list[IssueOutgoingDto]):
+    """Gives every outcome a probability without parents and one conditioned on the first option of a decision."""
+    first_options = [x.decision.options[0].id for x in issues if x.decision and x.decision.options]
+    for issue in issues:
+        if issue.type != Type.UNCERTAINTY or issue.uncertainty is None:
+            continue
+        issue.uncertainty.discrete_probabilities = [
+            DiscreteProbabilityOutgoingDto(
+                uncertainty_id=issue.uncertainty.id,
+                outcome_id=outcome.id,
+                probability=probability,
+                parent_option_ids=parent_option_ids,
+            )
+            for outcome in issue.uncertainty.outcomes
+            for probability, parent_option_ids in [(0.5, []), (0.25, first_options[:1])]
+        ]
+
+
+def find_matching_dtos(
+    path: list[uuid.UUID], issue: IssueOutgoingDto
+) -> list[DiscreteProbabilityOutgoingDto]:
+    """The probabilities of the uncertainty whose parent options and outcomes are all on the path."""
+    assert issue.uncertainty is not None
+    outcome_ids = {x.id for x in issue.uncertainty.outcomes}
+    return [
+        dto for dto in issue.uncertainty.discrete_probabilities
+        if dto.probability is not None and dto.outcome_id in outcome_ids
+        and set(dto.parent_option_ids).union(dto.parent_outcome_ids).issubset(path)
+    ]
+
+
+def build_decision_tree(
+    scenario_id: uuid.UUID, partial_order: list[IssueOutgoingDto], path: Optional[list[uuid.UUID]] = None
+) -> DecisionTreeDTO:
+    """Reference decision tree, built node by node from the partial order."""
+    path = path or []
+    tree_node_id = GenerateUuid.as_uuid(" - ".join(["root"] + [str(x) for x in path]))
+    if len(path) == len(partial_order):
+        return DecisionTreeDTO(tree_node=TreeNodeDto(id=tree_node_id, issue=EndPointNodeDto(scenario_id=scenario_id)))
+    issue = partial_order[len(path)]
+    probabilities = None
+    if issue.type == Type.UNCERTAINTY and issue.uncertainty and issue.uncertainty.discrete_probabilities:
+        outcome_names = {x.id: x.name for x in issue.uncertainty.outcomes}
+        probabilities = [
+            ProbabilityDto(
+                outcome_name=outcome_names[x.outcome_id],
+                outcome_id=x.outcome_id,
+                probability_value=x.probability,  # type: ignore
+                discrete_probability_id=x.id,
+            )
+            for x in find_matching_dtos(path, issue)
+        ]
+    children = [build_decision_tree(scenario_id, partial_order, path + [x]) for x in get_branch_ids(issue)]
+    return DecisionTreeDTO(
+        tree_node=TreeNodeDto(id=tree_node_id, issue=issue, probabilities=probabilities),
+        children=children or None,
+    )
+
+
 @pytest.mark.asyncio
-@pytest.mark.skip(reason="Skipping, need to redesign test due to different approach to utility.")
-async def test_decision_tree():
-    await sessionmanager.init_db()
-    scenario_service = await get_scenario_service()
+@pytest.mark.parametrize("with_probabilities", [False, True])
+async def test_decision_tree_expansion_matches_graph(client: AsyncClient, with_probabilities: bool):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
     structure_service = await get_structure_service()
+    issues, edges = await structure_service.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+    if with_probabilities:
+        add_discrete_probabilities(issues)
+    partial_order_issues = calculate_partial_order(issues, edges)
+    expected = build_decision_tree(scenario_id, partial_order_issues)
+
+    expansion = DecisionTreeExpansion(scenario_id, partial_order_issues)
+    result = await asyncio.to_thread(expansion.to_decision_tree_dto)
+
+    assert decision_tree_to_comparable(result) == decision_tree_to_comparable(expected)
+    assert expansion.node_count == len(expansion.parent) == len(expansion.depth)
 
-    scenario_uuid = GenerateUuid.as_uuid("dt_from_id_scenario")
-    dt_from_id = await structure_service.create_decision_tree(scenario_uuid)
+    streamed = json.loads(b"".join(expansion.iter_json(chunk_size=256)))
+    assert decision_tree_to_comparable(DecisionTreeDTO.model_validate(streamed)) == decision_tree_to_comparable(expected)
 
-    scenario_uuid2 = GenerateUuid.as_uuid("dt_scenario")
-    issues = []
-    edges = []
-    async for session in sessionmanager.get_session():
-        (
-            issues,
-            edges,
-        ) = await scenario_service.get_influence_diagram_data(session, scenario_uuid2)
-    root_id = GenerateUuid.as_uuid("dt_uncertainty_S")
-    root_issue = next((issue for issue in issues if issue.id == root_id), None)
-    assert root_issue != None
+    if with_probabilities:
+        assert result is not None
+        probability_counts: set[int] = set()
+        stack = [result]
+        while stack:
+            node = stack.pop()
+            if node.tree_node.probabilities is not None:
+                probability_counts.add(len(node.tree_node.probabilities))
+            stack += node.children or []
+        # probabilities conditioned on an option are only found below that option
+        assert len(probability_counts) > 1
+    else:
+        response = await client.get(f"/structure/{scenario_id}/decision_tree")
+        assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+        response_tree = DecisionTreeDTO.model_validate(response.json())
+        assert decision_tree_to_comparable(response_tree) == decision_tree_to_comparable(expected)
+
+
+@pytest.mark.asyncio
+async def test_decision_tree_subtree(client: AsyncClient):
+    url = f"/structure/{GenerateUuid.as_uuid('dt_from_id_scenario')}/decision_tree"
+    response = await client.get(url)
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    full_tree = DecisionTreeDTO.model_validate(response.json())
+    assert full_tree.children is not None
+
+    response = await client.get(url, params={"depth": 1})
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    top = DecisionTreeDTO.model_validate(response.json())
+    assert top.tree_node.id == full_tree.tree_node.id
+    assert top.children is not None and all(x.children is None for x in top.children)
+    assert [x.tree_node.id for x in top.children] == [x.tree_node.id for x in full_tree.children]
+
+    # follow the first branch of the root down to the node below it
+    root_issue = full_tree.tree_node.issue
+    assert isinstance(root_issue, IssueOutgoingDto)
+    if root_issue.type == Type.DECISION:
+        first_branch = root_issue.decision.options[0].id  # type: ignore
+    else:
+        first_branch = root_issue.uncertainty.outcomes[0].id  # type: ignore
+    response = await client.get(url, params={"path": [str(first_branch)]})
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    subtree = DecisionTreeDTO.model_validate(response.json())
+    assert decision_tree_to_comparable(subtree) == decision_tree_to_comparable(full_tree.children[0])
+
+    response = await client.get(url, params={"path": [str(GenerateUuid.as_uuid("not a branch"))]})
+    assert response.status_code == 400, f"Response content: {response.content}"
+
+
+@pytest.mark.asyncio
+async def test_probability_index_matches_find_matching_dtos(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    issues, _ = await structure_service.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+    add_discrete_probabilities(issues)
+    branch_ids = [get_branch_ids(x) for x in issues]
+    # valid paths hold at most one option or outcome of every issue
+    paths = [[], [branch_ids[0][0]], [x[-1] for x in branch_ids], [x[0] for x in branch_ids[1:]]]
 
-    decision_tree_graph = DecisionTreeGraph(root=root_issue.id)
     for issue in issues:
-        await decision_tree_graph.add_node(issue.id)
+        if issue.type != Type.UNCERTAINTY or issue.uncertainty is None:
+            continue
+        probability_index = ProbabilityIndex(issue, branch_ids)
+        for path in paths:
+            expected = find_matching_dtos(path, issue)
+            assert [x.discrete_probability_id for x in probability_index.get(path)] == [x.id for x in expected]
+            # the lookups of a parent state are served from the same precomputed list
+            assert probability_index.get(path) is probability_index.get(list(path))
+        # two states of the same parent are not a parent state
+        for parent_branch_ids in branch_ids:
+            if len([x for x in parent_branch_ids if x in probability_index.digits]) > 1:
+                with pytest.raises(ValueError):
+                    probability_index.get(parent_branch_ids)
+
+    # probabilities of outcomes that are not outcomes of the uncertainty are left out
+    issue = next(x for x in issues if x.uncertainty is not None and x.uncertainty.discrete_probabilities)
+    assert issue.uncertainty is not None
+    issue = issue.model_copy(deep=True)
+    issue.uncertainty.discrete_probabilities[0].outcome_id = uuid.uuid4()  # type: ignore
+    rows = ProbabilityIndex(issue, branch_ids).rows
+    assert len(rows) == len(issue.uncertainty.discrete_probabilities) - 1  # type: ignore
+
+
+def expand_compressed_decision_tree(tree: CompressedDecisionTreeDTO) -> dict[str, Any]:
+    def expand(tree_node_index: int, branch_ids: list[uuid.UUID]) -> dict[str, Any]:
+        tree_node = tree.tree_nodes[tree_node_index]
+        is_endpoint = tree_node.issue_index == len(tree.issues)
+        issue = tree.endpoint if is_endpoint else tree.issues[tree_node.issue_index]
+        children = None
+        if tree_node.children is not None:
+            branches = issue.decision.options if issue.decision else issue.uncertainty.outcomes  # type: ignore
+            children = [expand(x, branch_ids + [branch.id]) for x, branch in zip(tree_node.children, branches)]
+        return DecisionTreeDTO(
+            tree_node=TreeNodeDto(
+                id=GenerateUuid.as_uuid(" - ".join(["root"] + [str(x) for x in branch_ids])),
+                issue=issue,
+                probabilities=tree_node.probabilities,
+            ),
+            children=children,
+        )  # type: ignore
+
+    return decision_tree_to_comparable(expand(0, tree.path))  # type: ignore
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_probabilities", [False, True])
+async def test_compressed_decision_tree(client: AsyncClient, with_probabilities: bool):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    partial_order_issues = await structure_service.get_partial_order_issues(scenario_id)
+    if with_probabilities:
+        add_discrete_probabilities(partial_order_issues)
+
+    expected = DecisionTreeExpansion(scenario_id, partial_order_issues)
+    compressed = CompressedDecisionTree(scenario_id, partial_order_issues).to_compressed_decision_tree_dto()
+    assert compressed is not None
+    assert len(compressed.tree_nodes) < expected.node_count
+    assert expand_compressed_decision_tree(compressed) == decision_tree_to_comparable(expected.to_decision_tree_dto())
 
+    # a model without probabilities has one tree node per issue
+    response = await client.get(f"/structure/{GenerateUuid.as_uuid('dt_scenario')}/decision_tree", params={"compressed": True})
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    compressed = CompressedDecisionTreeDTO.model_validate(response.json())
+    assert len(compressed.tree_nodes) == len(compressed.issues) + 1
+
+
+def roll_back_expected_value(dto: DecisionTreeDTO, path: list[uuid.UUID]) -> float:
+    """Rolls back the expanded tree recursively and checks the values of every tree node."""
+    issue = dto.tree_node.issue
+    if not isinstance(issue, IssueOutgoingDto) or dto.children is None:
+        expected_value = 0.0
+    elif issue.decision is not None and issue.type == Type.DECISION:
+        values = [
+            option.utility + roll_back_expected_value(child, path + [option.id])
+            for option, child in zip(issue.decision.options, dto.children)
+        ]
+        expected_value = max(values)
+        assert dto.tree_node.optimal_branch_id == issue.decision.options[values.index(expected_value)].id
+    else:
+        assert issue.uncertainty is not None
+        distribution = {x.id: 1 / len(issue.uncertainty.outcomes) for x in issue.uncertainty.outcomes}
+        matching = [
+            x for x in issue.uncertainty.discrete_probabilities
+            if set(x.parent_option_ids + x.parent_outcome_ids).issubset(path)
+        ]
+        if issue.uncertainty.discrete_probabilities:
+            distribution = {x.id: 0.0 for x in issue.uncertainty.outcomes}
+            # the probability with the most parents applies
+            for x in sorted(matching, key=lambda x: len(x.parent_option_ids + x.parent_outcome_ids)):
+                distribution[x.outcome_id] = x.probability or 0.0
+            total = sum(distribution.values())
+            distribution = {
+                x: y / total if total > 0 else 1 / len(distribution) for x, y in distribution.items()
+            }
+        expected_value = sum(
+            distribution[outcome.id] * (outcome.utility + roll_back_expected_value(child, path + [outcome.id]))
+            for outcome, child in zip(issue.uncertainty.outcomes, dto.children)
+        )
+    assert dto.tree_node.expected_value == pytest.approx(expected_value)
+    return expected_value
+
+
+@pytest.mark.asyncio
+async def test_decision_tree_roll_back(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    partial_order_issues = await structure_service.get_partial_order_issues(scenario_id)
+    add_discrete_probabilities(partial_order_issues)
+    for issue in partial_order_issues:
+        for i, branch in enumerate(issue.decision.options if issue.decision else []):
+            branch.utility = float((i * 7) % 5)
+        for i, branch in enumerate(issue.uncertainty.outcomes if issue.uncertainty else []):
+            branch.utility = float(i * 3)
+
+    rolled_back = CompressedDecisionTree(scenario_id, partial_order_issues)
+    rolled_back.roll_back()
+    expansion = DecisionTreeExpansion(scenario_id, partial_order_issues, rolled_back=rolled_back)
+    tree = expansion.to_decision_tree_dto()
+    assert tree is not None
+    roll_back_expected_value(tree, [])
+
+    streamed = DecisionTreeDTO.model_validate(json.loads(b"".join(expansion.iter_json())))
+    assert decision_tree_to_comparable(streamed) == decision_tree_to_comparable(tree)
+
+    url = f"/structure/{scenario_id}/decision_tree"
+    response = await client.get(url, params={"roll_back": True, "depth": 1})
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    assert DecisionTreeDTO.model_validate(response.json()).tree_node.expected_value is not None
+    response = await client.get(url, params={"roll_back": True, "compressed": True, "depth": 1})
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    compressed = CompressedDecisionTreeDTO.model_validate(response.json())
+    assert all(x.children is None for x in compressed.tree_nodes[1:])
+    assert all(x.expected_value is not None for x in compressed.tree_nodes)
+
+
+@pytest.mark.asyncio
+async def test_decision_tree_roll_back_matches_solver(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("test_scenario_1")
+    response = await client.get(f"/structure/{scenario_id}/decision_tree", params={"roll_back": True, "depth": 1})
+    assert response.status_code == 200, f"Failed to create decision tree: {response.text}"
+    expected_value = DecisionTreeDTO.model_validate(response.json()).tree_node.expected_value
+
+    response = await client.get(f"/solvers/scenario/{scenario_id}")
+    assert response.status_code == 200, f"Response content: {response.content}"
+    assert expected_value == pytest.approx(response.json()["utility_mean"])
+
+
+@pytest.mark.asyncio
+async def test_partial_order(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    issues, edges = await structure_service.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+    partial_order = calculate_partial_order(issues, edges)
+    parents: dict[uuid.UUID, list[uuid.UUID]] = {x.id: [] for x in issues}
+    for edge in edges:
+        parents[edge.head_node.issue_id].append(edge.tail_node.issue_id)
+
+    types = [x.type for x in partial_order]
+    assert set(types) == {Type.DECISION.value, Type.UNCERTAINTY.value}
+    assert sorted(types) == sorted(
+        x.type for x in issues if x.type in (Type.DECISION.value, Type.UNCERTAINTY.value)
+    )
+    # the uncertainties observed before a decision come before it in the partial order
+    partial_order_ids = [x.id for x in partial_order]
+    for position, issue in enumerate(partial_order):
+        if issue.type == Type.DECISION.value:
+            for parent in parents[issue.id]:
+                assert partial_order_ids.index(parent) < position
+
+    # a cycle through a decision has no elimination order
+    decision = [x for x in partial_order if x.type == Type.DECISION.value and parents[x.id]][0]
+    edge = next(x for x in edges if x.head_node.issue_id == decision.id)
+    cycle_edge = edge.model_copy(update={"tail_node": edge.head_node, "head_node": edge.tail_node})
+    with pytest.raises(ValueError):
+        calculate_partial_order(issues, edges + [cycle_edge])
+
+
+@pytest.mark.asyncio
+async def test_diagram_model(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    issues, edges = await structure_service.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+    model = DiagramModel(issues, edges)
+
+    for issue in issues:
+        assert model.get_issue(issue.id) is issue
+        assert model.issues_by_node_id[issue.node.id] is issue
+        for option in issue.decision.options if issue.decision else []:
+            assert model.options_by_id[option.id] is option
+        for outcome in issue.uncertainty.outcomes if issue.uncertainty else []:
+            assert model.outcomes_by_id[outcome.id] is outcome
     for edge in edges:
-        tail_node = [x for x in issues if x.id==edge.tail_node.issue_id][0]
-        head_node = [x for x in issues if x.id==edge.head_node.issue_id][0]
-        ee = EdgeUUIDDto(tail=tail_node.id, head=head_node.id)
-        await decision_tree_graph.add_edge(ee)    
+        tail, head = model.get_edge_issues(edge)
+        assert (tail.id, head.id) == (edge.tail_issue_id, edge.head_issue_id)
+    with pytest.raises(KeyError):
+        model.get_issue(uuid.uuid4())
+
+    subset = model.subset(x.id for x in issues[:2])
+    assert subset.issues == issues[:2]
+    assert all(subset.get_edge_issues(x) for x in subset.edges)
+
+
+@pytest.mark.asyncio
+async def test_influence_diagram_diagnostics(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    issues, edges = await structure_service.diagram_snapshot_service.get_influence_diagram_data(scenario_id)
+    diagnostics = InfluenceDiagramDOT(edges, issues).validate_diagram()
+    assert diagnostics.is_valid and diagnostics.cycle is None and len(diagnostics.components) == 1
+
+    # a separate fragment of two issues is left out
+    fragment = [x.model_copy(update={"id": uuid.uuid4()}) for x in issues[:2]]
+    fragment_edge = edges[0].model_copy(
+        update={"id": uuid.uuid4(), "tail_issue_id": fragment[0].id, "head_issue_id": fragment[1].id}
+    )
+    influence_diagram = InfluenceDiagramDOT(edges + [fragment_edge], issues + fragment)
+    diagnostics = influence_diagram.validate_diagram()
+    assert diagnostics.removed_issue_ids == [x.id for x in fragment]
+    assert influence_diagram.issues == issues and influence_diagram.edges == edges
+
+    # a decision without options is reported, and a cycle is found with its issues
+    decision = next(x for x in issues if x.type == Type.DECISION.value)
+    without_options = decision.model_copy(
+        update={"decision": decision.decision.model_copy(update={"options": []})}  # type: ignore
+    )
+    diagnostics = InfluenceDiagramDOT(edges, [without_options if x is decision else x for x in issues]).diagnose()
+    assert diagnostics.decisions_without_options == [decision.id]
+    assert diagnostics.errors == [f"No Options found for Decision {decision.name}. \n"]
+
+    cycle_edge = edges[0].model_copy(
+        update={"id": uuid.uuid4(), "tail_issue_id": edges[0].head_issue_id, "head_issue_id": edges[0].tail_issue_id}
+    )
+    influence_diagram = InfluenceDiagramDOT(edges + [cycle_edge], issues)
+    diagnostics = influence_diagram.diagnose()
+    assert diagnostics.cycle is not None
+    assert set(diagnostics.cycle) == {edges[0].tail_issue_id, edges[0].head_issue_id}
+    with pytest.raises(ValueError, match="Cycle"):
+        influence_diagram.validate_diagram()
+
+
+@pytest.mark.asyncio
+async def test_structure_cache(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    url = f"/structure/{scenario_id}"
+    partial_order = (await client.get(f"{url}/partial_order")).json()["issue_ids"]
+    decision_tree = (await client.get(f"{url}/decision_tree")).json()
+    statistics = (await client.get("/structure/cache")).json()
+
+    # the endpoints share the cached structure and the json of the tree is served as it was written
+    assert (await client.get(f"{url}/partial_order")).json()["issue_ids"] == partial_order
+    assert (await client.get(f"{url}/decision_tree")).json() == decision_tree
+    cached_statistics = (await client.get("/structure/cache")).json()
+    assert cached_statistics["misses"] == statistics["misses"]
+    assert cached_statistics["hits"] > statistics["hits"]
+    # the expansion and json of the tree are counted in the size of the cache
+    assert 0 < cached_statistics["bytes"] <= cached_statistics["max_bytes"]
+    assert decision_tree["tree_node"]["issue"]["id"] == partial_order[0]
+
+    # a change to the diagram is committed, so the next request sees it
+    structure_service = await get_structure_service()
+    partial_order_issues = await structure_service.get_partial_order_issues(scenario_id)
+    level = [x.type for x in partial_order_issues].index(Type.DECISION.value)
+    option = partial_order_issues[level].decision.options[0]  # type: ignore
+    payload = [
+        OptionIncomingDto(
+            id=option.id, name="renamed option", decision_id=option.decision_id, utility=option.utility
+        ).model_dump(mode="json")
+    ]
+    response = await client.put("/options", json=payload)
+    assert response.status_code == 200, f"Response content: {response.content}"
+    tree_node = (await client.get(f"{url}/decision_tree")).json()
+    for _ in range(level):
+        tree_node = tree_node["children"][0]
+    assert tree_node["tree_node"]["issue"]["decision"]["options"][0]["name"] == "renamed option"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_probabilities", [False, True])
+async def test_decision_tree_size(client: AsyncClient, with_probabilities: bool):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    structure_service = await get_structure_service()
+    partial_order_issues = await structure_service.get_partial_order_issues(scenario_id)
+    if with_probabilities:
+        add_discrete_probabilities(partial_order_issues)
+    first_branch = DecisionTreeSize(partial_order_issues).branch_ids[0][0]
+
+    for path, depth in [([], None), ([], 2), ([first_branch], None), ([first_branch], 1)]:
+        size = DecisionTreeSize(partial_order_issues, path, depth)
+        expansion = DecisionTreeExpansion(scenario_id, partial_order_issues, path, depth)
+        compressed = CompressedDecisionTree(scenario_id, partial_order_issues, path, depth)
+        assert size.node_count == expansion.node_count
+        assert size.leaf_count == expansion.level_sizes[-1]
+        assert size.compressed_node_count == len(compressed.tree_nodes)
+        # the estimate is in the order of the written json
+        json_bytes = sum(len(x) for x in expansion.iter_json())
+        assert json_bytes / 2 < size.get_json_bytes() < json_bytes * 2
+
+
+@pytest.mark.asyncio
+async def test_decision_tree_size_guard(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("dt_from_id_scenario")
+    url = f"/structure/{scenario_id}/decision_tree"
+    response = await client.get(f"{url}/size")
+    assert response.status_code == 200, f"Response content: {response.content}"
+    size = DecisionTreeSizeDTO.model_validate(response.json())
+    assert size.node_count == sum(size.level_sizes) and size.mode == DecisionTreeMode.FULL
 
-    no_nodes_id = dt_from_id.nx.number_of_nodes() # type: ignore
-    no_edges_id = dt_from_id.nx.number_of_edges() # type: ignore
+    max_nodes, oversize_mode = config.DECISION_TREE_MAX_NODES, config.DECISION_TREE_OVERSIZE_MODE
+    try:
+        config.DECISION_TREE_MAX_NODES = size.node_count - 1
+        config.DECISION_TREE_OVERSIZE_MODE = DecisionTreeMode.LAZY.value
+        response = await client.get(url)
+        assert response.status_code == 200, f"Response content: {response.content}"
+        assert response.headers["X-Decision-Tree-Mode"] == DecisionTreeMode.LAZY.value
+        tree = DecisionTreeDTO.model_validate(response.json())
+        assert tree.children is not None and len(tree.children) == size.level_sizes[1]
 
-    no_nodes_dt = decision_tree_graph.nx.number_of_nodes() # type: ignore
-    no_edges_dt = decision_tree_graph.nx.number_of_edges()  # type: ignore
+        config.DECISION_TREE_OVERSIZE_MODE = DecisionTreeMode.COMPRESSED.value
+        response = await client.get(url)
+        assert response.status_code == 200, f"Response content: {response.content}"
+        assert response.headers["X-Decision-Tree-Mode"] == DecisionTreeMode.COMPRESSED.value
+        CompressedDecisionTreeDTO.model_validate(response.json())
 
-    assert no_edges_id == no_edges_dt
-    assert no_nodes_id == no_nodes_dt
+        config.DECISION_TREE_OVERSIZE_MODE = DecisionTreeMode.REFUSE.value
+        response = await client.get(url)
+        assert response.status_code == 413, f"Response content: {response.content}"
+        assert (await client.get(f"{url}/size")).json()["mode"] == DecisionTreeMode.REFUSE.value
+    finally:
+        config.DECISION_TREE_MAX_NODES, config.DECISION_TREE_OVERSIZE_MODE = max_nodes, oversize_mode
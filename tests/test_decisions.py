@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -14,7 +15,7 @@ async def test_get_decisions(client: AsyncClient):
     response = await client.get("/decisions")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, DecisionOutgoingDto)
+    parse_response_to_page_test(response, DecisionOutgoingDto)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,55 @@
+import uuid
+import pytest
+from httpx import AsyncClient
+from src.dtos.option_dtos import OptionIncomingDto
+from src.seed_database import GenerateUuid
+from src.session_manager import sessionmanager
+from src.repositories.diagram_snapshot_repository import DiagramSnapshotRepository
+from src.services.diagram_snapshot_service import DiagramSnapshotService
+
+
+async def get_snapshot(scenario_id: uuid.UUID):
+    snapshot = None
+    async for session in sessionmanager.get_session():
+        snapshot = await DiagramSnapshotRepository(session).get(scenario_id)
+    assert snapshot is not None
+    return snapshot
+
+
+async def update_option_utility(client: AsyncClient, utility: float):
+    payload = [
+        OptionIncomingDto(
+            id=GenerateUuid.as_uuid("d"),
+            decision_id=GenerateUuid.as_uuid("test_decision_issue_2"),
+            name="Do not",
+            utility=utility,
+        ).model_dump(mode="json")
+    ]
+    response = await client.put("/options", json=payload)
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+
+@pytest.mark.asyncio
+async def test_diagram_snapshot_rebuilt_after_change(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("test_scenario_1")
+    response = await client.get(f"/structure/{scenario_id}/partial_order")
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+    version, _, data = await get_snapshot(scenario_id)
+    assert data is not None
+
+    await update_option_utility(client, 5)
+    new_version, _, data = await get_snapshot(scenario_id)
+    assert new_version > version
+    assert data is None
+
+    response = await client.get(f"/solvers/scenario/{scenario_id}")
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+    _, _, data = await get_snapshot(scenario_id)
+    assert data is not None
+    issues, _ = DiagramSnapshotService.deserialize(data)
+    options = [option for issue in issues if issue.decision for option in issue.decision.options]
+    assert next(x for x in options if x.id == GenerateUuid.as_uuid("d")).utility == 5
+
+    await update_option_utility(client, 0)
@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -13,7 +14,28 @@ async def test_get_edges(client: AsyncClient):
     response = await client.get("/edges")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, EdgeOutgoingDto)
+    parse_response_to_page_test(response, EdgeOutgoingDto)
+
+
+@pytest.mark.asyncio
+async def test_get_edges_with_fields(client: AsyncClient):
+    response = await client.get("/edges", params={"fields": "id,head_issue_id,tail_issue_id"})
+    assert response.status_code == 200, f"Response content: {response.content}"
+    items = response.json()["items"]
+
+    full_edges = parse_response_to_page_test(await client.get("/edges"), EdgeOutgoingDto)
+    assert items == [
+        {"id": str(x.id), "head_issue_id": str(x.head_issue_id), "tail_issue_id": str(x.tail_issue_id)}
+        for x in full_edges
+    ]
+
+    response = await client.get("/edges", params={"fields": ""})
+    assert response.status_code == 400
+
+    # the slim page is part of the documented responses
+    schema = (await client.get("/openapi.json")).json()
+    response_schema = schema["paths"]["/edges"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert len(response_schema["anyOf"]) == 2
 
 
 @pytest.mark.asyncio
@@ -40,6 +62,28 @@ async def test_create_edge(client: AsyncClient):
     parse_response_to_dtos_test(response, EdgeOutgoingDto)
 
 
+@pytest.mark.asyncio
+async def test_create_edge_cycle(client: AsyncClient):
+    payload = [
+        EdgeIncomingDto(
+            tail_id=GenerateUuid.as_uuid(x),
+            head_id=GenerateUuid.as_uuid(y),
+            scenario_id=GenerateUuid.as_uuid(3),
+        ).model_dump(mode="json")
+        for x, y in [(6, 7), (7, 6)]
+    ]
+
+    response = await client.post("/edges", json=payload)
+    assert response.status_code == 400, f"Response content: {response.content}"
+    assert "cycle" in response.json()["detail"]
+
+    # none of the edges are created
+    response = await client.post("/edges", json=payload[:1])
+    assert response.status_code == 200, f"Response content: {response.content}"
+    response = await client.get(f"/edges/{payload[1]['id']}")
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_update_edge(client: AsyncClient):
     new_tail_id = GenerateUuid.as_uuid(2)
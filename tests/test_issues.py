@@ -1,11 +1,14 @@
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page,
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
 from src.constants import (
+    PageSize,
     Type,
     Boundary,
 )
@@ -25,7 +28,33 @@ async def test_get_issues(client: AsyncClient):
     response = await client.get("/issues")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, IssueOutgoingDto)
+    parse_response_to_page_test(response, IssueOutgoingDto)
+
+
+@pytest.mark.asyncio
+async def test_get_issues_pages(client: AsyncClient):
+    scenario_url = f"/scenarios/{GenerateUuid.as_string(1)}/issues"
+    response = await client.get(scenario_url, params={"limit": PageSize.PAGE_MAX})
+    assert response.status_code == 200, f"Response content: {response.content}"
+    all_issues, next_cursor = parse_response_to_page(response, IssueOutgoingDto)
+    assert next_cursor is None
+
+    paged_issues: list[IssueOutgoingDto] = []
+    params: dict[str, str | int] = {"limit": 3}
+    while True:
+        response = await client.get(scenario_url, params=params)
+        assert response.status_code == 200, f"Response content: {response.content}"
+        issues, next_cursor = parse_response_to_page(response, IssueOutgoingDto)
+        assert len(issues) <= 3
+        paged_issues.extend(issues)
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    assert [x.id for x in paged_issues] == [x.id for x in all_issues]
+
+    response = await client.get("/issues", params={"cursor": "not a cursor"})
+    assert response.status_code == 400, f"Response content: {response.content}"
 
 
 @pytest.mark.asyncio
@@ -163,3 +192,47 @@ async def test_delete_issues(client: AsyncClient):
         assert (
             response.status_code == 404
         ), f"Issue with id: {id} found, but should have been deleted"
+
+
+@pytest.mark.asyncio
+async def test_get_issues_ndjson(client: AsyncClient):
+    response = await client.get("/issues", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200, f"Response content: {response.content}"
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    streamed_ids = [IssueOutgoingDto.model_validate_json(x).id for x in response.text.splitlines()]
+
+    paged_ids: list[UUID] = []
+    params: dict[str, str | int] = {"limit": PageSize.PAGE_MAX}
+    while True:
+        issues, next_cursor = parse_response_to_page(await client.get("/issues", params=params), IssueOutgoingDto)
+        paged_ids.extend(x.id for x in issues)
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    assert streamed_ids == paged_ids
+
+
+@pytest.mark.asyncio
+async def test_get_issues_with_fields(client: AsyncClient):
+    scenario_url = f"/scenarios/{GenerateUuid.as_string(1)}/issues"
+    response = await client.get(scenario_url, params={"fields": "id,name"})
+    assert response.status_code == 200, f"Response content: {response.content}"
+    items = response.json()["items"]
+    assert len(items) > 0
+    assert all(set(x.keys()) == {"id", "name"} for x in items)
+
+    response = await client.get(scenario_url, params={"fields": "id,type", "expand": "decision"})
+    assert response.status_code == 200, f"Response content: {response.content}"
+    items = response.json()["items"]
+    assert all(set(x.keys()) == {"id", "type", "decision"} for x in items)
+    decisions = [x["decision"] for x in items if x["decision"] is not None]
+    assert any(len(x["options"]) > 0 for x in decisions)
+
+    full_issues = parse_response_to_page_test(await client.get(scenario_url), IssueOutgoingDto)
+    assert [x["id"] for x in items] == [str(x.id) for x in full_issues]
+
+    response = await client.get(scenario_url, params={"fields": "id,decision"})
+    assert response.status_code == 400, f"Response content: {response.content}"
+    response = await client.get(scenario_url, params={"expand": "unknown"})
+    assert response.status_code == 400, f"Response content: {response.content}"
@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -15,7 +16,7 @@ async def test_get_nodes(client: AsyncClient):
     print(response)
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, NodeOutgoingDto)
+    parse_response_to_page_test(response, NodeOutgoingDto)
 
 
 @pytest.mark.asyncio
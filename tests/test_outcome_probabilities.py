@@ -1,8 +1,8 @@
 import pytest
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
-    parse_response_to_dtos_test,
 )
 from src.dtos.discrete_probability_dtos import DiscreteProbabilityOutgoingDto
 from src.seed_database import GenerateUuid
@@ -13,7 +13,7 @@ async def test_get_discrete_probabilities(client: AsyncClient):
     response = await client.get("/discrete_probabilities")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, DiscreteProbabilityOutgoingDto)
+    parse_response_to_page_test(response, DiscreteProbabilityOutgoingDto)
 
 
 @pytest.mark.asyncio
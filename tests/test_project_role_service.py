@@ -4,7 +4,7 @@ import pytest
 from src.constants import ProjectRoleType
 from src.dtos.project_roles_dtos import ProjectRoleIncomingDto, ProjectRoleOutgoingDto
 from src.seed_database import GenerateUuid
-from tests.utils import parse_response_to_dtos_test
+from tests.utils import parse_response_to_dtos_test, parse_response_to_page_test
 
 
 @pytest.mark.asyncio
@@ -18,7 +18,7 @@ async def test_get__project_role(client: AsyncClient):
 async def test_get_all_project_role(client: AsyncClient):
     response = await client.get("/project-roles/")
     assert response.status_code == 200, f"Response content: {response.content}"
-    parse_response_to_dtos_test(response, ProjectRoleOutgoingDto)
+    parse_response_to_page_test(response, ProjectRoleOutgoingDto)
 
 
 @pytest.mark.asyncio
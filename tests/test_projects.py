@@ -2,6 +2,7 @@ import pytest
 from uuid import uuid4
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -21,7 +22,18 @@ async def test_get_projects(client: AsyncClient):
     response = await client.get("/projects")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, ProjectOutgoingDto)
+    parse_response_to_page_test(response, ProjectOutgoingDto)
+
+
+@pytest.mark.asyncio
+async def test_get_populated_projects_ndjson(client: AsyncClient):
+    response = await client.get("/projects-populated", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200, f"Response content: {response.content}"
+    projects = [PopulatedProjectDto.model_validate_json(x) for x in response.text.splitlines()]
+
+    response = await client.get("/projects-populated")
+    assert [x.id for x in projects] == [x.id for x in parse_response_to_page_test(response, PopulatedProjectDto)]
+    assert all(len(x.scenarios) > 0 for x in projects)
 
 
 @pytest.mark.asyncio
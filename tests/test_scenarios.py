@@ -2,6 +2,7 @@ import pytest
 from uuid import uuid4
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -20,7 +21,7 @@ async def test_get_scenarios(client: AsyncClient):
     response = await client.get("/scenarios")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, ScenarioOutgoingDto)
+    parse_response_to_page_test(response, ScenarioOutgoingDto)
 
 
 @pytest.mark.asyncio
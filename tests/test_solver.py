@@ -0,0 +1,118 @@
+import time
+import asyncio
+import pytest
+from httpx import AsyncClient
+from tests.utils import parse_response_to_dto_test
+from src.dtos.model_solution_dtos import SolutionDto, ScenarioSolutionDto
+from src.dtos.option_dtos import OptionIncomingDto
+from src.seed_database import GenerateUuid
+from src.services import solver_pool as solver_pool_module
+from src.services.solver_pool import SolverPool, SolverQueueFullError, SolverTimeoutError
+from src.config import config
+
+
+@pytest.mark.asyncio
+async def test_solve_scenario(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("test_scenario_1")
+    response = await client.get(f"/solvers/scenario/{scenario_id}")
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+    solution = parse_response_to_dto_test(response, SolutionDto)
+    assert solution.utility_mean == 100
+    assert [x.name for x in solution.optimal_options] == ["yes", "Do"]
+
+
+@pytest.mark.asyncio
+async def test_solve_scenario_uses_cache(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("test_scenario_1")
+    await client.get(f"/solvers/scenario/{scenario_id}")
+    statistics = (await client.get("/solvers/cache")).json()
+
+    response = await client.get(f"/solvers/scenario/{scenario_id}")
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+    new_statistics = (await client.get("/solvers/cache")).json()
+    assert new_statistics["hits"] == statistics["hits"] + 1
+    assert new_statistics["misses"] == statistics["misses"]
+
+
+@pytest.mark.asyncio
+async def test_solve_scenario_cache_invalidated_on_commit(client: AsyncClient):
+    scenario_id = GenerateUuid.as_uuid("test_scenario_1")
+    await client.get(f"/solvers/scenario/{scenario_id}")
+    assert (await client.get("/solvers/cache")).json()["size"] > 0
+
+    payload = [
+        OptionIncomingDto(
+            id=GenerateUuid.as_uuid("c"),
+            decision_id=GenerateUuid.as_uuid("test_decision_issue_2"),
+            name="Do",
+            utility=10,
+        ).model_dump(mode="json")
+    ]
+    response = await client.put("/options", json=payload)
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+    statistics = (await client.get("/solvers/cache")).json()
+    response = await client.get(f"/solvers/scenario/{scenario_id}")
+    solution = parse_response_to_dto_test(response, SolutionDto)
+
+    new_statistics = (await client.get("/solvers/cache")).json()
+    assert new_statistics["misses"] == statistics["misses"] + 1
+    assert solution.utility_mean == 110
+
+
+@pytest.mark.asyncio
+async def test_solver_pool_queue_full():
+    pool = SolverPool(max_workers=1, max_queue_depth=0, timeout=1, use_processes=False)
+    with pytest.raises(SolverQueueFullError):
+        await pool.solve(issues=[], edges=[])
+
+
+@pytest.mark.asyncio
+async def test_solver_pool_counts_abandoned_solves(monkeypatch: pytest.MonkeyPatch):
+    def slow_solve(issues, edges):
+        time.sleep(0.3)
+
+    monkeypatch.setattr(solver_pool_module, "solve_influence_diagram", slow_solve)
+    pool = SolverPool(max_workers=1, max_queue_depth=1, timeout=0.05, use_processes=False)
+    with pytest.raises(SolverTimeoutError):
+        await pool.solve(issues=[], edges=[])
+
+    # the timed out solve still occupies the worker
+    assert pool.pending == 1
+    with pytest.raises(SolverQueueFullError):
+        await pool.solve(issues=[], edges=[])
+    await asyncio.sleep(0.5)
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_solve_scenarios(client: AsyncClient):
+    scenario_ids = [GenerateUuid.as_uuid("test_scenario_1"), GenerateUuid.as_uuid("dt_from_id_scenario")]
+    missing_scenario_id = GenerateUuid.as_uuid("missing_scenario")
+    payload = [str(x) for x in [*scenario_ids, missing_scenario_id, scenario_ids[0]]]
+
+    response = await client.post("/solvers/scenarios", json=payload)
+    assert response.status_code == 200, f"Response content: {response.content}"
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+    assert len(lines) == 3
+    solutions = {x.scenario_id: x for x in map(ScenarioSolutionDto.model_validate_json, lines)}
+    # the same solutions and errors as when the scenarios are solved one by one
+    response = await client.get(f"/solvers/scenario/{scenario_ids[0]}")
+    assert solutions[scenario_ids[0]].solution == parse_response_to_dto_test(response, SolutionDto)
+    response = await client.get(f"/solvers/scenario/{scenario_ids[1]}")
+    assert response.status_code == 500
+    assert solutions[scenario_ids[1]].error == response.json()["detail"]
+    assert solutions[missing_scenario_id].solution is None
+    assert solutions[missing_scenario_id].error
+
+    # repeated ids are counted once
+    response = await client.post("/solvers/scenarios", json=payload * 2)
+    assert response.status_code == 200, f"Response content: {response.content}"
+    payload = [str(GenerateUuid.as_uuid(x)) for x in range(config.SOLVER_BATCH_MAX_SCENARIOS + 1)]
+    response = await client.post("/solvers/scenarios", json=payload)
+    assert response.status_code == 400, f"Response content: {response.content}"
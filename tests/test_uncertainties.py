@@ -2,11 +2,13 @@ import pytest
 import uuid
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
 from src.dtos.uncertainty_dtos import UncertaintyIncomingDto, UncertaintyOutgoingDto
 from src.dtos.outcome_dtos import OutcomeIncomingDto
+from src.dtos.option_dtos import OptionIncomingDto, OptionOutgoingDto
 from src.dtos.discrete_probability_dtos import DiscreteProbabilityIncomingDto
 from src.seed_database import GenerateUuid
 
@@ -16,7 +18,7 @@ async def test_get_uncertainties(client: AsyncClient):
     response = await client.get("/uncertainties")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, UncertaintyOutgoingDto)
+    parse_response_to_page_test(response, UncertaintyOutgoingDto)
 
 
 @pytest.mark.asyncio
@@ -94,3 +96,37 @@ async def test_update_probability(client: AsyncClient):
 async def test_delete_uncertainty(client: AsyncClient):
     response = await client.delete(f"/uncertainties/{GenerateUuid.as_string(2)}")
     assert response.status_code == 200, f"Response content: {response.content}"
+
+
+@pytest.mark.asyncio
+async def test_probabilities_kept_when_parent_option_is_added(client: AsyncClient):
+    uncert_id = GenerateUuid.as_uuid("test_uncertainty_issue_1")
+    response = await client.get(f"/uncertainties/{uncert_id}")
+    uncertainty = parse_response_to_dto_test(response, UncertaintyOutgoingDto)
+    probabilities = {x.id: x.probability for x in uncertainty.discrete_probabilities}
+
+    option_dto = OptionIncomingDto(
+        name="Do later",
+        utility=0.0,
+        decision_id=GenerateUuid.as_uuid("test_decision_issue_2"),
+    )
+    response = await client.post("/options", json=[option_dto.model_dump(mode="json")])
+    assert response.status_code == 200, f"Response content: {response.content}"
+    option = parse_response_to_dtos_test(response, OptionOutgoingDto)[0]
+
+    response = await client.get(f"/uncertainties/{uncert_id}")
+    updated_uncertainty = parse_response_to_dto_test(response, UncertaintyOutgoingDto)
+    # 2 outcomes * 2 options * 3 options
+    assert len(updated_uncertainty.discrete_probabilities) == 12
+    for discrete_probability in updated_uncertainty.discrete_probabilities:
+        if option.id in discrete_probability.parent_option_ids:
+            assert discrete_probability.probability == 0
+        else:
+            assert probabilities[discrete_probability.id] == discrete_probability.probability
+
+    response = await client.delete(f"/options/{option.id}")
+    assert response.status_code == 200, f"Response content: {response.content}"
+
+    response = await client.get(f"/uncertainties/{uncert_id}")
+    updated_uncertainty = parse_response_to_dto_test(response, UncertaintyOutgoingDto)
+    assert {x.id: x.probability for x in updated_uncertainty.discrete_probabilities} == probabilities
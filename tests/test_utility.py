@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -13,7 +14,7 @@ async def test_get_utilities(client: AsyncClient):
     response = await client.get("/utilities")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, UtilityOutgoingDto)
+    parse_response_to_page_test(response, UtilityOutgoingDto)
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,11 @@
 import pytest
 import uuid
 from src.utils.set_joins import join_sets_with_common_elements
+from src.domain.graph import Graph
+from src.domain.indexed_graph import IndexedGraph
+from src.utils.scenario_cache import ScenarioCache, invalidate_scenario_caches
+from src.utils.discrete_probability_array_manager import DiscreteProbabilityArrayManager
+from src.dtos.discrete_probability_dtos import DiscreteProbabilityOutgoingDto
 
 @pytest.mark.asyncio
 def test_set_joins():
@@ -39,4 +44,159 @@ def test_set_joins():
     result3 = join_sets_with_common_elements(sets3)
     assert len(result3) == 2
     assert result3[0] == {id1, id2, id3}
-    assert result3[1] == {id4, id5}
\ No newline at end of file
+    assert result3[1] == {id4, id5}
+
+def test_weakly_connected_components():
+    ids = [uuid.uuid4() for _ in range(7)]
+    graph = Graph()
+    # two start nodes meeting in one issue, a separate chain and a single edge
+    graph.addEdge(ids[0], ids[2])
+    graph.addEdge(ids[1], ids[2])
+    graph.addEdge(ids[3], ids[4])
+    graph.addEdge(ids[4], ids[5])
+    graph.addEdge(ids[6], ids[5])
+
+    components = graph.weaklyConnectedComponents()
+    assert components == [{ids[0], ids[1], ids[2]}, {ids[3], ids[4], ids[5], ids[6]}]
+    assert set(graph.vertices()) == set(ids)
+
+    # the components match the issues reached from overlapping start nodes
+    start_nodes = [ids[0], ids[1], ids[3], ids[6]]
+    assert sorted(map(sorted, join_sets_with_common_elements([graph.DFS(x) for x in start_nodes]))) == sorted(
+        map(sorted, components)
+    )
+    assert join_sets_with_common_elements([set(), {ids[0]}, set()]) == [set(), {ids[0]}, set()]
+
+
+def test_indexed_graph():
+    graph = IndexedGraph(["a", "b", "c", "d"], [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("e", "a")])
+    assert graph.vertex_ids == ["a", "b", "c", "d", "e"]
+    assert graph.get_ids(graph.successors(graph.index["a"])) == ["b", "c"]
+    assert graph.get_ids(graph.predecessors(graph.index["d"])) == ["b", "c"]
+
+    order = graph.get_ids(graph.topological_order())
+    assert all(order.index(tail) < order.index(head) for tail, head in [("a", "b"), ("b", "d"), ("e", "a")])
+    reverse_order = graph.get_ids(graph.topological_order(reverse=True))
+    assert reverse_order.index("d") < reverse_order.index("a") < reverse_order.index("e")
+    assert graph.find_cycle() is None and not graph.has_cycle()
+    assert set(graph.get_ids(graph.descendants(graph.index["a"]))) == {"b", "c", "d"}
+    assert set(graph.get_ids(graph.ancestors(graph.index["d"]))) == {"a", "b", "c", "e"}
+
+    cyclic = IndexedGraph([], [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("x", "a")])
+    cycle = cyclic.get_ids(cyclic.find_cycle() or [])
+    assert sorted(cycle) == ["a", "b", "c"]
+    assert all((cycle[i], cycle[(i + 1) % 3]) in [("a", "b"), ("b", "c"), ("c", "a")] for i in range(3))
+    # the vertices after the cycle are left out of the order, and the vertices before it when reversed
+    assert cyclic.get_ids(cyclic.topological_order()) == ["x"]
+    assert cyclic.get_ids(cyclic.topological_order(reverse=True)) == ["d"]
+
+
+def test_graph_long_chain():
+    ids = [uuid.uuid4() for _ in range(20000)]
+    graph = Graph()
+    for tail, head in zip(ids, ids[1:]):
+        graph.addEdge(tail, head)
+    assert len(graph.DFS(ids[0])) == len(ids)
+    assert not graph.detectCycle()
+    assert graph.topologicalSort() == ids
+    assert graph.ancestors(ids[-1]) == set(ids[:-1])
+
+    graph.addEdge(ids[-1], ids[0])
+    assert graph.detectCycle()
+    assert graph.findCycle() is not None and len(graph.findCycle()) == len(ids)  # type: ignore
+
+
+def test_scenario_cache():
+    scenario_id_1 = uuid.uuid4()
+    scenario_id_2 = uuid.uuid4()
+    cache: ScenarioCache[int] = ScenarioCache(name="test", max_size=2)
+
+    assert cache.get("a") is None
+    cache.put(scenario_id_1, "a", 1)
+    cache.put(scenario_id_2, "b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is the least recently used entry and is evicted
+    cache.put(scenario_id_1, "c", 3)
+    assert cache.get("b") is None
+    assert cache.statistics()["hits"] == 1
+    assert cache.statistics()["misses"] == 2
+
+    invalidate_scenario_caches([scenario_id_1])
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_scenario_cache_max_bytes():
+    scenario_id = uuid.uuid4()
+    cache: ScenarioCache[bytes] = ScenarioCache(name="test bytes", max_size=10, max_bytes=10, get_bytes=len)
+    cache.put(scenario_id, "a", b"1234")
+    cache.put(scenario_id, "b", b"1234")
+    assert cache.statistics()["bytes"] == 8
+
+    # putting an entry again counts its new size, and the least recently used entries are dropped
+    cache.put(scenario_id, "a", b"1234567")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234567"
+    assert cache.statistics()["bytes"] == 7
+
+    invalidate_scenario_caches([scenario_id])
+    assert cache.statistics()["bytes"] == 0
+
+def test_discrete_probability_array_manager():
+    uncertainty_id = uuid.uuid4()
+    outcomes = [uuid.uuid4(), uuid.uuid4()]
+    parent_outcomes = [uuid.uuid4(), uuid.uuid4()]
+    parent_options = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+    probabilities = [
+        DiscreteProbabilityOutgoingDto(
+            uncertainty_id=uncertainty_id,
+            outcome_id=outcome_id,
+            probability=0.1 * (i + 1) * (j + 1) * (k + 1),
+            parent_outcome_ids=[parent_outcome],
+            parent_option_ids=[parent_option],
+        )
+        for i, parent_outcome in enumerate(parent_outcomes)
+        for j, parent_option in enumerate(parent_options)
+        for k, outcome_id in enumerate(outcomes)
+    ]
+    manager = DiscreteProbabilityArrayManager(probabilities, [parent_outcomes, parent_options], outcomes)
+
+    assert manager.array.shape == (2, 3, 2)
+    assert manager.get_probabilities_for_combination([parent_outcomes[1], parent_options[2]]) == pytest.approx([0.6, 1.2])
+    # string ids are accepted, states that are not of a parent are not
+    assert manager.get_probabilities_for_combination([str(parent_outcomes[0]), str(parent_options[1])]) == pytest.approx([0.2, 0.4])
+    with pytest.raises(ValueError):
+        manager.get_probabilities_for_combination([parent_outcomes[0], uuid.uuid4()])
+
+    # the table follows the requested order of the parents, states and outcomes
+    table = manager.get_probability_table([parent_options[::-1], parent_outcomes], outcomes[::-1])
+    assert table.shape == (3, 2, 2)
+    assert table[0, 1].tolist() == pytest.approx([1.2, 0.6])
+    assert table[2, 0].tolist() == pytest.approx([0.2, 0.1])
+    # unknown, missing and incomplete parents are errors instead of being broadcast or reduced
+    with pytest.raises(ValueError):
+        manager.get_probability_table([parent_options, parent_outcomes, [uuid.uuid4()]], outcomes)
+    with pytest.raises(ValueError):
+        manager.get_probability_table([parent_options], outcomes)
+    with pytest.raises(ValueError):
+        manager.get_probability_table([parent_options[:2], parent_outcomes], outcomes)
+    with pytest.raises(ValueError):
+        manager.get_probability_table([parent_options, parent_options], outcomes)
+    # probabilities of states that are not on an axis are rejected
+    with pytest.raises(ValueError):
+        DiscreteProbabilityArrayManager(probabilities, [parent_options], outcomes)
+
+    combinations, rows = manager.get_rows()
+    assert len(combinations) == 6
+    assert rows.shape == (6, 2)
+
+    # converting back to dtos keeps the ids and values of the probabilities
+    dtos = {x.id: x for x in manager.to_dtos()}
+    assert len(dtos) == len(probabilities)
+    for probability in probabilities:
+        dto = dtos[probability.id]
+        assert dto.probability == pytest.approx(probability.probability)
+        assert dto.outcome_id == probability.outcome_id
+        assert dto.parent_outcome_ids == probability.parent_outcome_ids
+        assert dto.parent_option_ids == probability.parent_option_ids
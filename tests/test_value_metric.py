@@ -2,6 +2,7 @@ import pytest
 from uuid import uuid4
 from httpx import AsyncClient
 from tests.utils import (
+    parse_response_to_page_test,
     parse_response_to_dto_test,
     parse_response_to_dtos_test,
 )
@@ -14,7 +15,7 @@ async def test_get_value_metrics(client: AsyncClient):
     response = await client.get("/value-metrics")
     assert response.status_code == 200, f"Response content: {response.content}"
 
-    parse_response_to_dtos_test(response, ValueMetricOutgoingDto)
+    parse_response_to_page_test(response, ValueMetricOutgoingDto)
 
 
 @pytest.mark.asyncio
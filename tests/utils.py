@@ -1,6 +1,6 @@
 import pytest
 import json
-from typing import TypeVar, Type
+from typing import Optional, TypeVar, Type
 from pydantic import BaseModel
 from httpx import Response
 
@@ -29,3 +29,15 @@ def parse_response_to_dtos_test(response: Response, dto_class: Type[T]) -> list[
         return parse_response_to_dtos(response, dto_class)
     except Exception:
         pytest.fail("Response parsing encountered an exception")
+
+
+def parse_response_to_page(response: Response, dto_class: Type[T]) -> tuple[list[T], Optional[str]]:
+    content = json.loads(response.content.decode("utf-8"))
+    return [dto_class.model_validate(obj) for obj in content["items"]], content["next_cursor"]
+
+
+def parse_response_to_page_test(response: Response, dto_class: Type[T]) -> list[T]:
+    try:
+        return parse_response_to_page(response, dto_class)[0]
+    except Exception:
+        pytest.fail("Response parsing encountered an exception")